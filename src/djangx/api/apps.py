@@ -0,0 +1,64 @@
+from django.apps import AppConfig, apps
+
+from .. import PKG_DISPLAY_NAME, PKG_NAME
+
+
+class ApiConfig(AppConfig):
+    """App configuration for the api layer."""
+
+    name = f"{PKG_NAME}.api"
+    label = f"{PKG_NAME}_api"
+    verbose_name = f"{PKG_DISPLAY_NAME} API"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        from django.core.signals import request_finished, request_started
+        from django.db.backends.signals import connection_created
+
+        from .backends.routers import reset_routing
+        from .settings import AUTH_USER_CACHE_TTL, DATABASE_REPLICAS, SLOW_QUERY_MS
+
+        if DATABASE_REPLICAS:
+            # Each request picks its own replica and starts unpinned from the primary
+            request_started.connect(reset_routing, dispatch_uid="djangx_reset_routing_started")
+            request_finished.connect(reset_routing, dispatch_uid="djangx_reset_routing_finished")
+
+        if SLOW_QUERY_MS > 0:
+            from .slowlog import install_slow_query_log
+
+            connection_created.connect(install_slow_query_log, dispatch_uid="djangx_slow_query_log")
+
+        if apps.is_installed("django.contrib.auth"):
+            from django.db.models.signals import post_migrate
+
+            from .backends.auth import create_lookup_indexes
+
+            # Not a migration, which would make this app depend on auth being installed
+            post_migrate.connect(
+                create_lookup_indexes, sender=self, dispatch_uid="djangx_create_lookup_indexes"
+            )
+
+        if AUTH_USER_CACHE_TTL > 0 and apps.is_installed("django.contrib.auth"):
+            from django.conf import settings
+            from django.contrib.auth.signals import user_logged_out
+            from django.core import checks
+            from django.db.models.signals import post_delete, post_save
+
+            from .usercache import check_user_cache, forget_cached_session, invalidate_cached_user
+
+            checks.register(check_user_cache, checks.Tags.caches)
+
+            # Saves include password changes, last_login updates and profile edits
+            post_save.connect(
+                invalidate_cached_user,
+                sender=settings.AUTH_USER_MODEL,
+                dispatch_uid="djangx_invalidate_cached_user_saved",
+            )
+            post_delete.connect(
+                invalidate_cached_user,
+                sender=settings.AUTH_USER_MODEL,
+                dispatch_uid="djangx_invalidate_cached_user_deleted",
+            )
+            user_logged_out.connect(
+                forget_cached_session, dispatch_uid="djangx_forget_cached_session"
+            )
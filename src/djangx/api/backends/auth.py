@@ -2,16 +2,75 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.db.models import Index, Value
+from django.db.models.functions import Upper
+from django.db.models.lookups import Exact
 from django.http import HttpRequest
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractBaseUser
 
+# Fields matched case-insensitively, in order, and the functional index serving each
+LOOKUP_INDEXES: dict[str, str] = {
+    "username": "djx_user_username_upper_idx",
+    "email": "djx_user_email_upper_idx",
+}
+
+
+def get_lookup_indexes(model: Any) -> list[Index]:
+    """Return the `UPPER(field)` indexes for the lookup fields the user model has"""
+    field_names = {field.name for field in model._meta.get_fields()}
+
+    return [
+        Index(Upper(field_name), name=name)
+        for field_name, name in LOOKUP_INDEXES.items()
+        if field_name in field_names
+    ]
+
+
+def create_lookup_indexes(sender: Any, using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """
+    Add the lookup indexes the user table is missing, after every migrate.
+
+    Connected only while django.contrib.auth is installed, so the api app
+    never depends on auth migrations that a project may have removed. The
+    indexes are built concurrently on PostgreSQL, so large user tables stay
+    writable, and skipped where expression indexes are unsupported.
+    """
+    User = get_user_model()
+    connection = connections[using]
+
+    if not connection.features.supports_expression_indexes:
+        return
+
+    if not router.allow_migrate_model(using, User):
+        return
+
+    with connection.cursor() as cursor:
+        if User._meta.db_table not in connection.introspection.table_names(cursor):
+            return
+        existing = connection.introspection.get_constraints(cursor, User._meta.db_table)
+
+    indexes = [index for index in get_lookup_indexes(User) if index.name not in existing]
+    if not indexes:
+        return
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    concurrently = {"concurrently": True} if connection.vendor == "postgresql" else {}
+
+    with connection.schema_editor(atomic=False) as schema_editor:
+        for index in indexes:
+            schema_editor.add_index(User, index, **concurrently)
+
 
 class UsernameOrEmailBackend(ModelBackend):
     """
     Custom authentication backend that allows users to login with either username or email.
+
+    Each field is looked up on its own as `UPPER(field) = UPPER(%s)`, the exact
+    expression of the functional indexes added after migrate, so every
+    lookup is an index scan instead of a scan of the whole user table.
     """
 
     def authenticate(
@@ -25,17 +84,38 @@ class UsernameOrEmailBackend(ModelBackend):
             return None
 
         User = get_user_model()
+        user = self.get_user_by_identifier(username)
 
-        try:
-            # Query the user model with either username or email
-            user = User.objects.get(Q(username__iexact=username) | Q(email__iexact=username))
-
-            # Check the password and return user if valid
-            if user.check_password(password):
-                return user
-            return None
-
-        except User.DoesNotExist:
+        if user is None:
             # Run the default password hasher to mitigate timing attacks
-            User().set_password(User.objects.make_random_password())
+            User().set_password(password)
             return None
+
+        # Check the password and return user if valid
+        if user.check_password(password):
+            return user
+        return None
+
+    def get_user_by_identifier(self, identifier: str) -> "Optional[AbstractBaseUser]":
+        """
+        Return the user whose username, or else email, matches case-insensitively.
+
+        A username match wins over an email match; an email shared by several
+        users matches none of them.
+        """
+        User = get_user_model()
+        field_names = {field.name for field in User._meta.get_fields()}
+
+        for field_name in LOOKUP_INDEXES:
+            if field_name not in field_names:
+                continue
+
+            users = list(
+                User._default_manager.filter(Exact(Upper(field_name), Upper(Value(identifier))))[:2]
+            )
+            if len(users) == 1:
+                return users[0]
+            if users:
+                return None
+
+        return None
@@ -0,0 +1,316 @@
+import errno
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+
+from ... import PKG_NAME
+
+# Errors meaning the filesystem cannot hard-link these paths; such files are copied instead
+_LINK_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+
+
+@dataclass
+class DedupStats:
+    """
+    Space used by the content-addressed store.
+
+    Attributes:
+        blobs: Number of distinct contents referenced by at least one name.
+        references: Number of names linked onto those contents.
+        stored_bytes: Bytes on disk for referenced contents.
+        logical_bytes: Bytes the referencing names would take as separate copies.
+        orphans: Number of contents no name refers to any more.
+        orphaned_bytes: Bytes on disk for orphaned contents.
+    """
+
+    blobs: int = 0
+    references: int = 0
+    stored_bytes: int = 0
+    logical_bytes: int = 0
+    orphans: int = 0
+    orphaned_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved by storing each distinct content once."""
+        return self.logical_bytes - self.stored_bytes
+
+    @property
+    def ratio(self) -> float:
+        """Logical bytes per stored byte; 1.0 means no duplicates."""
+        return self.logical_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+@deconstructible(path=f"{PKG_NAME}.api.backends.dedup.DedupFileSystemStorage")
+class DedupFileSystemStorage(FileSystemStorage):
+    """
+    Filesystem storage that keeps one copy of each distinct file content.
+
+    Uploads are hashed with SHA-256 while they are streamed to disk, stored
+    once under `<blob_location>/<ab>/<cd>/<digest>`, and hard-linked to
+    their logical names. The logical files are ordinary files, so serving
+    and reading them is unchanged, and the link count of a blob is its
+    reference count: deleting a name drops one reference, and a blob with no
+    other link left is an orphan for `collect_garbage` to remove.
+
+    The blobs live outside the storage location, in MEDIA_BLOB_ROOT by
+    default, so they are never served under MEDIA_URL. Where the filesystem
+    cannot hard-link, e.g. across devices, the name gets its own copy.
+
+    Args:
+        blob_location: Directory of the blobs; defaults to MEDIA_BLOB_ROOT.
+    """
+
+    def __init__(
+        self, *args: Any, blob_location: Optional[str | Path] = None, **kwargs: Any
+    ) -> None:
+        self._blob_location = blob_location
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def blob_location(self) -> Path:
+        return Path(self._value_or_setting(self._blob_location, settings.MEDIA_BLOB_ROOT))
+
+    def _clear_cached_properties(self, setting: str, **kwargs: Any) -> None:
+        super()._clear_cached_properties(setting, **kwargs)
+
+        if setting == "MEDIA_BLOB_ROOT":
+            self.__dict__.pop("blob_location", None)
+
+    def blob_path(self, digest: str) -> Path:
+        """Return the path of the blob holding the content with this digest"""
+        return self.blob_location / digest[:2] / digest[2:4] / digest
+
+    def _save(self, name: str, content: File) -> str:
+        temp_path, digest = self._write_temp(content)
+        blob = self.blob_path(digest)
+
+        try:
+            while True:
+                self._store_blob(temp_path, blob)
+
+                full_path = self.path(name)
+                self._makedirs(os.path.dirname(full_path))
+
+                try:
+                    self._link(blob, Path(full_path))
+                except FileExistsError:
+                    if self._allow_overwrite:
+                        os.unlink(full_path)
+                    else:
+                        name = self.get_available_name(name)
+                except FileNotFoundError:
+                    # Collected as an orphan after it was found; store it again
+                    continue
+                else:
+                    break
+        finally:
+            os.unlink(temp_path)
+
+        # Ensure the saved path is always relative to the storage root
+        name = os.path.relpath(full_path, self.location)
+        # Ensure the moved file has the same gid as the storage root
+        self._ensure_location_group_id(full_path)
+        # Store filenames with forward slashes, even on Windows
+        return str(name).replace("\\", "/")
+
+    # ---- Maintenance
+
+    def iter_blobs(self) -> Iterator[tuple[Path, os.stat_result]]:
+        """Yield every stored blob with its stat result"""
+        for path in self.blob_location.glob("??/??/*"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue
+
+    def stats(self) -> DedupStats:
+        """Return the space used and saved by the store"""
+        stats = DedupStats()
+
+        for _, stat in self.iter_blobs():
+            references = stat.st_nlink - 1
+
+            if references:
+                stats.blobs += 1
+                stats.references += references
+                stats.stored_bytes += stat.st_size
+                stats.logical_bytes += stat.st_size * references
+            else:
+                stats.orphans += 1
+                stats.orphaned_bytes += stat.st_size
+
+        return stats
+
+    def collect_garbage(self, dry_run: bool = False, grace: int = 3600) -> tuple[int, int]:
+        """
+        Remove blobs no name refers to any more, and temporary files left by
+        uploads interrupted more than `grace` seconds ago.
+
+        Returns the number of files removed and the bytes freed.
+        """
+        removed = freed = 0
+
+        for path, stat in self.iter_blobs():
+            if stat.st_nlink > 1:
+                continue
+
+            if not dry_run:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+
+            removed += 1
+            freed += stat.st_size
+
+        cutoff = time.time() - grace
+
+        for path in (self.blob_location / "tmp").glob("*.part"):
+            try:
+                stat = path.stat()
+                if stat.st_mtime > cutoff:
+                    continue
+                if not dry_run:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+
+            removed += 1
+            freed += stat.st_size
+
+        return removed, freed
+
+    def ingest(self) -> tuple[int, int]:
+        """
+        Move files written before deduplication was enabled into the store,
+        replacing duplicate copies with links to a single blob.
+
+        Returns the number of files ingested and the bytes freed.
+        """
+        ingested = freed = 0
+
+        for root, _, files in os.walk(self.location):
+            for filename in files:
+                path = Path(root) / filename
+                stat = path.lstat()
+
+                # Skip symlinks and files already linked onto a blob
+                if not path.is_file() or path.is_symlink() or stat.st_nlink > 1:
+                    continue
+
+                with path.open("rb") as handle:
+                    digest = self._hash(File(handle))
+
+                blob = self.blob_path(digest)
+                self._makedirs(str(blob.parent))
+
+                try:
+                    # The file becomes the blob if this content is new
+                    os.link(path, blob)
+                except FileExistsError:
+                    # Otherwise swap the copy for a link to the existing blob
+                    temp = path.with_name(f".{path.name}.{uuid4().hex}.part")
+                    os.link(blob, temp)
+                    os.replace(temp, path)
+                    freed += stat.st_size
+                except OSError as exc:
+                    if exc.errno in _LINK_UNSUPPORTED:
+                        continue
+                    raise
+
+                ingested += 1
+
+        return ingested, freed
+
+    # ---- Helpers
+
+    def _write_temp(self, content: File) -> tuple[Path, str]:
+        """Stream the content to a temporary file, hashing it on the way"""
+        temp_dir = self.blob_location / "tmp"
+        self._makedirs(str(temp_dir))
+
+        temp_path = temp_dir / f"{uuid4().hex}.part"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        fd = os.open(temp_path, flags, 0o666)
+
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                digest = self._hash(content, handle.write)
+
+            if self.file_permissions_mode is not None:
+                os.chmod(temp_path, self.file_permissions_mode)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        return temp_path, digest
+
+    @staticmethod
+    def _hash(content: File, write: Optional[Callable[[bytes], Any]] = None) -> str:
+        """Hash the content chunk by chunk, passing each chunk to write if given"""
+        digest = sha256()
+
+        if content.seekable():
+            content.seek(0)
+
+        for chunk in content.chunks():
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+
+            digest.update(chunk)
+
+            if write is not None:
+                write(chunk)
+
+        return digest.hexdigest()
+
+    def _store_blob(self, temp_path: Path, blob: Path) -> None:
+        """Make the temporary file the blob for its digest, unless one exists"""
+        self._makedirs(str(blob.parent))
+
+        try:
+            self._link(temp_path, blob)
+        except FileExistsError:
+            pass
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> None:
+        """Hard-link target to source, copying it where links are unsupported"""
+        try:
+            os.link(source, target)
+        except OSError as exc:
+            if exc.errno not in _LINK_UNSUPPORTED:
+                raise
+
+            with source.open("rb") as src, target.open("xb") as dst:
+                shutil.copyfileobj(src, dst)
+
+    def _makedirs(self, directory: str) -> None:
+        """Create a directory and its parents with the configured permissions"""
+        if self.directory_permissions_mode is not None:
+            # Set the umask because os.makedirs() doesn't apply the "mode"
+            # argument to intermediate-level directories
+            old_umask = os.umask(0o777 & ~self.directory_permissions_mode)
+            try:
+                os.makedirs(directory, self.directory_permissions_mode, exist_ok=True)
+            finally:
+                os.umask(old_umask)
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+
+__all__ = ["DedupFileSystemStorage", "DedupStats"]
@@ -0,0 +1,147 @@
+import itertools
+import threading
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+
+from ..settings import DATABASE_REPLICA_SELECTION, DATABASE_REPLICAS
+
+
+@dataclass
+class RoutingState:
+    """
+    Routing decisions for one unit of work, usually a request.
+
+    Attributes:
+        replica: The replica chosen for reads, once one has been made.
+        pinned: Whether a write happened, sending later reads to the primary.
+        release: Gives the replica's load back, at most once.
+    """
+
+    replica: Optional[str] = None
+    pinned: bool = False
+    release: Optional[weakref.finalize] = field(default=None, repr=False)
+
+
+_state: ContextVar[Optional[RoutingState]] = ContextVar("replica_routing", default=None)
+
+
+class ReplicaRouter:
+    """
+    Database router that sends reads to replicas and writes to the primary.
+
+    Each request reads from one replica, chosen round-robin or as the one
+    serving the fewest requests in this process, so its queries share one
+    connection. Once a request writes, or while it is inside a transaction
+    on the primary, its reads go to the primary too, so it always sees its
+    own writes despite replication lag.
+
+    Args:
+        replicas: Replica aliases; defaults to DATABASE_REPLICAS.
+        selection: "round-robin" or "least-loaded"; defaults to
+            DATABASE_REPLICA_SELECTION.
+        primary: Alias of the primary database.
+    """
+
+    def __init__(
+        self,
+        replicas: Optional[list[str]] = None,
+        selection: Optional[str] = None,
+        primary: str = DEFAULT_DB_ALIAS,
+    ) -> None:
+        self.replicas: list[str] = DATABASE_REPLICAS if replicas is None else replicas
+        self.selection: str = selection or DATABASE_REPLICA_SELECTION
+        self.primary = primary
+        self._cycle = itertools.cycle(self.replicas)
+        self._load: dict[str, int] = dict.fromkeys(self.replicas, 0)
+        self._lock = threading.Lock()
+
+    # ---- Router API
+
+    def db_for_read(self, model: Optional[type[Model]], **hints: Any) -> Optional[str]:
+        if not self.replicas:
+            return None
+
+        state = self.get_state()
+
+        if state.pinned or connections[self.primary].in_atomic_block:
+            return self.primary
+
+        if state.replica is None:
+            state.replica = self._acquire()
+
+            # Outside requests nothing resets the state, e.g. in management commands and
+            # plain threads, so the load is also given back once the state is dropped
+            # along with the thread, task or context that held it
+            state.release = weakref.finalize(state, self._release, state.replica)
+            state.release.atexit = False
+
+        return state.replica
+
+    def db_for_write(self, model: Optional[type[Model]], **hints: Any) -> Optional[str]:
+        self.get_state().pinned = True
+        return self.primary
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> Optional[bool]:
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any
+    ) -> Optional[bool]:
+        # Replicas receive schema changes through replication
+        return db == self.primary
+
+    # ---- Request lifecycle
+
+    def get_state(self) -> RoutingState:
+        """Return the routing state of the current unit of work"""
+        state = _state.get()
+
+        if state is None:
+            state = RoutingState()
+            _state.set(state)
+
+        return state
+
+    def reset(self) -> None:
+        """Start a new unit of work, releasing the replica of the previous one"""
+        state = _state.get()
+
+        if state is not None and state.release is not None:
+            state.release()
+
+        _state.set(RoutingState())
+
+    def _acquire(self) -> str:
+        """Choose a replica for the current unit of work"""
+        with self._lock:
+            if self.selection == "least-loaded":
+                replica = min(self.replicas, key=self._load.__getitem__)
+            else:
+                replica = next(self._cycle)
+
+            self._load[replica] += 1
+
+        return replica
+
+    def _release(self, replica: str) -> None:
+        with self._lock:
+            if self._load.get(replica, 0) > 0:
+                self._load[replica] -= 1
+
+
+def reset_routing(**kwargs: Any) -> None:
+    """Reset replica routing at the start and end of each request."""
+    from django.db import router
+
+    for instance in router.routers:
+        if isinstance(instance, ReplicaRouter):
+            instance.reset()
+
+
+__all__ = ["ReplicaRouter", "RoutingState", "reset_routing"]
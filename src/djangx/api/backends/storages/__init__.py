@@ -0,0 +1,26 @@
+from .aio import AsyncBlobApi
+from .api import BlobApi
+from .bulk import BulkReport, ProgressCallback
+from .cache import BlobMetadata, BlobMetadataCache
+from .clients import get_async_client, get_client
+from .index import BlobIndex
+from .reader import AsyncBlobReader, RangedBlobReader, open_blob
+from .upload import ChunkedUploader
+from .vercel import VercelBlobStorage
+
+__all__ = [
+    "AsyncBlobApi",
+    "AsyncBlobReader",
+    "BlobApi",
+    "BlobIndex",
+    "BlobMetadata",
+    "BlobMetadataCache",
+    "BulkReport",
+    "ChunkedUploader",
+    "ProgressCallback",
+    "RangedBlobReader",
+    "VercelBlobStorage",
+    "get_async_client",
+    "get_client",
+    "open_blob",
+]
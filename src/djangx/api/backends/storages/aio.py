@@ -0,0 +1,83 @@
+import asyncio
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from .api import RETRY_STATUSES, BlobApiBase, backoff
+from .clients import get_async_client
+
+
+class AsyncBlobApi(BlobApiBase):
+    """
+    Minimal async client for the Vercel Blob REST API.
+
+    Unlike the SDK's AsyncBlobClient, which opens a new connection for every
+    call, all requests made on an event loop share one pooled httpx client,
+    so keep-alive connections are reused across requests.
+    """
+
+    async def put(
+        self,
+        name: str,
+        content: bytes | AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Upload a blob with a random suffix and return the API response"""
+        # Streamed bodies cannot be replayed, so only buffered uploads are retried
+        return await self._request(
+            "PUT",
+            headers=self._put_headers(content_type),
+            params={"pathname": name},
+            content=content,
+            retry=isinstance(content, bytes),
+        )
+
+    async def delete(self, urls: list[str]) -> None:
+        """Delete blobs by URL"""
+        await self._request("POST", "/delete", json={"urls": urls})
+
+    async def list_objects(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Return one page of the blob listing"""
+        return await self._request("GET", params=self._list_params(prefix, limit, cursor))
+
+    async def _request(
+        self,
+        method: str,
+        pathname: str = "",
+        *,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        content: Any = None,
+        json: Any = None,
+        retry: bool = True,
+    ) -> Any:
+        """Call the Blob API, retrying transient failures with exponential backoff"""
+        attempts = self.retries + 1 if retry else 1
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+
+            try:
+                response = await get_async_client().request(
+                    method,
+                    self._url(pathname),
+                    headers=self._headers(headers),
+                    params=params,
+                    content=content,
+                    json=json,
+                )
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.is_success:
+                    return response.json()
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    raise self._error(response)
+
+            await asyncio.sleep(backoff(attempt))
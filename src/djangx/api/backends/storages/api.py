@@ -0,0 +1,235 @@
+import time
+from os import environ
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import quote
+
+import httpx
+from vercel.blob import BlobError, BlobNotFoundError  # type: ignore[reportMissingTypeStubs]
+
+from .clients import get_client
+
+# The Blob REST contract, built here rather than with the SDK's private helpers in
+# vercel.blob.utils, which may change in any release
+API_URL = "https://vercel.com/api/blob"
+API_VERSION = "11"
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def backoff(attempt: int) -> float:
+    """Return the delay in seconds before retrying the given attempt"""
+    return min(2**attempt * 0.1, 2.0)
+
+
+class BlobApiBase:
+    """
+    Request building and error mapping shared by the sync and async clients.
+
+    Args:
+        token: The Blob read-write token.
+        retries: How many times to retry transport errors and 5xx responses.
+    """
+
+    def __init__(self, token: str, retries: int = 3) -> None:
+        self.token = token
+        self.retries = retries
+
+    def _headers(self, headers: Optional[dict[str, str]] = None) -> dict[str, str]:
+        """Return the authentication and version headers merged with extra ones"""
+        return {
+            "authorization": f"Bearer {self.token}",
+            "x-api-version": environ.get("VERCEL_BLOB_API_VERSION_OVERRIDE") or API_VERSION,
+            **(headers or {}),
+        }
+
+    @staticmethod
+    def _url(pathname: str = "") -> str:
+        """Return the API URL of a path, honouring the SDK's VERCEL_BLOB_API_URL override"""
+        return f"{environ.get('VERCEL_BLOB_API_URL') or API_URL}{pathname}"
+
+    @staticmethod
+    def _put_headers(
+        content_type: Optional[str],
+        random_suffix: bool = True,
+        overwrite: bool = False,
+        max_age: Optional[int] = None,
+    ) -> dict[str, str]:
+        """Return the headers of an upload"""
+        headers = {
+            "x-add-random-suffix": "1" if random_suffix else "0",
+            "x-allow-overwrite": "1" if overwrite else "0",
+        }
+
+        if content_type:
+            headers["x-content-type"] = content_type
+        if max_age is not None:
+            headers["x-cache-control-max-age"] = str(max_age)
+
+        return headers
+
+    @staticmethod
+    def _list_params(
+        prefix: Optional[str], limit: Optional[int], cursor: Optional[str]
+    ) -> dict[str, Any]:
+        """Return the query parameters of a listing request"""
+        params: dict[str, Any] = {}
+
+        if prefix:
+            params["prefix"] = prefix
+        if limit:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
+
+        return params
+
+    @staticmethod
+    def _error(response: httpx.Response) -> BlobError:
+        """Map an error response to a Blob SDK exception"""
+        if response.status_code == 404:
+            return BlobNotFoundError()
+
+        try:
+            message = response.json()["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            message = response.text
+
+        return BlobError(f"Blob API request failed ({response.status_code}): {message}")
+
+
+class BlobApi(BlobApiBase):
+    """
+    Minimal client for the Vercel Blob REST API.
+
+    Unlike the SDK's BlobClient, which opens a new connection for every call,
+    all requests go through the process-wide pooled HTTP client.
+    """
+
+    def put(
+        self,
+        name: str,
+        content: bytes | Iterable[bytes],
+        content_type: Optional[str] = None,
+        random_suffix: bool = True,
+        overwrite: bool = False,
+        max_age: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Upload a blob and return the API response.
+
+        A random suffix is added to the name unless random_suffix is False, in
+        which case overwrite allows replacing an existing blob of that name.
+        """
+        # Streamed bodies cannot be replayed, so only buffered uploads are retried
+        return self._request(
+            "PUT",
+            headers=self._put_headers(content_type, random_suffix, overwrite, max_age),
+            params={"pathname": name},
+            content=content,
+            retry=isinstance(content, bytes),
+        )
+
+    def delete(self, urls: list[str]) -> None:
+        """Delete blobs by URL"""
+        self._request("POST", "/delete", json={"urls": urls})
+
+    def list_objects(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Return one page of the blob listing"""
+        return self._request("GET", params=self._list_params(prefix, limit, cursor))
+
+    def iter_objects(
+        self, prefix: Optional[str] = None, batch_size: int = 1000
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every blob under the prefix, fetching the listing page by page"""
+        cursor: Optional[str] = None
+
+        while True:
+            page = self.list_objects(prefix=prefix, limit=batch_size, cursor=cursor)
+            yield from page.get("blobs", [])
+
+            cursor = page.get("cursor")
+            if not page.get("hasMore") or not cursor:
+                return
+
+    def create_multipart(self, name: str, content_type: Optional[str] = None) -> dict[str, str]:
+        """Start a multipart upload and return its uploadId and key"""
+        headers = {**self._put_headers(content_type), "x-mpu-action": "create"}
+        return self._request("POST", "/mpu", headers=headers, params={"pathname": name})
+
+    def upload_part(
+        self,
+        name: str,
+        upload: dict[str, str],
+        number: int,
+        content: bytes,
+        content_type: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Upload one part of a multipart upload and return its partNumber and etag"""
+        headers = {
+            **self._put_headers(content_type),
+            "x-mpu-action": "upload",
+            "x-mpu-key": quote(upload["key"], safe=""),
+            "x-mpu-upload-id": upload["uploadId"],
+            "x-mpu-part-number": str(number),
+        }
+        response = self._request(
+            "POST", "/mpu", headers=headers, params={"pathname": name}, content=content
+        )
+        return {"partNumber": number, "etag": response["etag"]}
+
+    def complete_multipart(
+        self,
+        name: str,
+        upload: dict[str, str],
+        parts: list[dict[str, Any]],
+        content_type: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Assemble the uploaded parts into the final blob"""
+        headers = {
+            **self._put_headers(content_type),
+            "x-mpu-action": "complete",
+            "x-mpu-key": quote(upload["key"], safe=""),
+            "x-mpu-upload-id": upload["uploadId"],
+        }
+        return self._request("POST", "/mpu", headers=headers, params={"pathname": name}, json=parts)
+
+    def _request(
+        self,
+        method: str,
+        pathname: str = "",
+        *,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        content: Any = None,
+        json: Any = None,
+        retry: bool = True,
+    ) -> Any:
+        """Call the Blob API, retrying transient failures with exponential backoff"""
+        attempts = self.retries + 1 if retry else 1
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+
+            try:
+                response = get_client().request(
+                    method,
+                    self._url(pathname),
+                    headers=self._headers(headers),
+                    params=params,
+                    content=content,
+                    json=json,
+                )
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.is_success:
+                    return response.json()
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    raise self._error(response)
+
+            time.sleep(backoff(attempt))
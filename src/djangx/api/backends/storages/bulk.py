@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+# Called with (completed, total) after each item of a bulk operation
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class BulkReport:
+    """Outcome of a bulk storage operation.
+
+    Attributes:
+        names: Names of the items processed successfully, in input order.
+        errors: Exceptions raised for the items that failed, keyed by name.
+        bytes: Total bytes transferred.
+        elapsed: Wall-clock duration of the operation in seconds.
+    """
+
+    names: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    bytes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of items processed successfully."""
+        return len(self.names)
+
+    @property
+    def rate(self) -> float:
+        """Items processed per second."""
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes transferred per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """Return a one-line, human-readable summary of the operation."""
+        text = f"{self.count} item(s) in {self.elapsed:.2f}s ({self.rate:.1f}/s"
+
+        if self.bytes:
+            text += f", {self.throughput / (1024 * 1024):.2f} MiB/s"
+
+        text += ")"
+
+        if self.errors:
+            text += f", {len(self.errors)} failed"
+
+        return text
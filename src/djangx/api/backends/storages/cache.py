@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import md5
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from django.core.cache import caches
+
+from .... import PKG_NAME
+
+
+@dataclass(frozen=True, slots=True)
+class BlobMetadata:
+    """Metadata of a stored blob.
+
+    Attributes:
+        url: The public URL of the blob.
+        size: The size of the blob in bytes.
+        content_type: The content type of the blob, if known.
+    """
+
+    url: str
+    size: int
+    content_type: Optional[str] = None
+
+
+class BlobMetadataCache:
+    """
+    In-process LRU cache with TTL for blob metadata, keyed by blob name.
+
+    Optionally backed by a Django cache so that metadata resolved by one
+    worker process is shared with the others.
+
+    Args:
+        maxsize: Maximum number of entries kept in process
+        ttl: Seconds an entry stays valid
+        alias: Django cache alias to back the in-process cache with (empty to disable)
+    """
+
+    def __init__(self, maxsize: int, ttl: int, alias: str = "") -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.alias = alias
+        self._entries: OrderedDict[str, tuple[float, BlobMetadata]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and the current size of the in-process cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "shared_hits": self._shared_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    def get(self, name: str) -> Optional[BlobMetadata]:
+        """Return cached metadata for a blob, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                expires_at, metadata = entry
+                if expires_at > monotonic():
+                    self._entries.move_to_end(name)
+                    self._hits += 1
+                    return metadata
+                del self._entries[name]
+
+        metadata = self._get_shared(name)
+
+        with self._lock:
+            if metadata is None:
+                self._misses += 1
+                return None
+            self._shared_hits += 1
+
+        self._set_local(name, metadata)
+        return metadata
+
+    def set(self, name: str, metadata: BlobMetadata) -> None:
+        """Cache metadata for a blob."""
+        if not self.enabled:
+            return
+
+        self._set_local(name, metadata)
+
+        if self.alias:
+            caches[self.alias].set(
+                self._shared_key(name),
+                (metadata.url, metadata.size, metadata.content_type),
+                self.ttl,
+            )
+
+    def delete(self, name: str) -> None:
+        """Invalidate cached metadata for a blob."""
+        with self._lock:
+            self._entries.pop(name, None)
+
+        if self.alias:
+            caches[self.alias].delete(self._shared_key(name))
+
+    def clear(self) -> None:
+        """Drop every in-process entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._shared_hits = self._misses = self._evictions = 0
+
+    def _set_local(self, name: str, metadata: BlobMetadata) -> None:
+        """Insert an entry in process, evicting the least recently used ones."""
+        with self._lock:
+            self._entries[name] = (monotonic() + self.ttl, metadata)
+            self._entries.move_to_end(name)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _get_shared(self, name: str) -> Optional[BlobMetadata]:
+        """Look a blob up in the backing Django cache."""
+        if not self.alias:
+            return None
+
+        value = caches[self.alias].get(self._shared_key(name))
+        if value is None:
+            return None
+
+        url, size, content_type = value
+        return BlobMetadata(url=url, size=size, content_type=content_type)
+
+    @staticmethod
+    def _shared_key(name: str) -> str:
+        """Build a cache key that is safe for every Django cache backend."""
+        return f"{PKG_NAME}:blob:{md5(name.encode(), usedforsecurity=False).hexdigest()}"
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import threading
+from typing import Any, AsyncGenerator, Optional
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from ...settings import BLOB_CONNECT_TIMEOUT, BLOB_KEEPALIVE, BLOB_POOL_SIZE, BLOB_TIMEOUT
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
+
+# Each pooled async client is kept with the async generator that closes it
+_AsyncClientEntry = tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+
+# One connection pool per event loop; httpx async clients cannot be shared across loops
+_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncClientEntry]" = (
+    WeakKeyDictionary()
+)
+
+
+def client_options() -> dict[str, Any]:
+    """Return the pool size, keep-alive and timeout options shared by every client"""
+    return {
+        "follow_redirects": True,
+        "timeout": httpx.Timeout(BLOB_TIMEOUT, connect=BLOB_CONNECT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_connections=BLOB_POOL_SIZE,
+            max_keepalive_connections=BLOB_POOL_SIZE,
+            keepalive_expiry=BLOB_KEEPALIVE,
+        ),
+    }
+
+
+def get_client() -> httpx.Client:
+    """
+    Return the process-wide pooled HTTP client.
+
+    Every storage instance shares it, so keep-alive connections (and their
+    TLS sessions) are reused across calls instead of being opened per request.
+    """
+    global _client
+
+    client = _client
+    if client is None or client.is_closed:
+        with _lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.Client(**client_options())
+            client = _client
+
+    return client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled async HTTP client of the running event loop.
+
+    The client is closed when its loop shuts down its async generators, which
+    asyncio.run(), asgiref and ASGI servers all do before closing the loop.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(**client_options())
+        closer = _close_on_shutdown(loop, client)
+
+        # Starting it registers it with the loop's async generator hooks
+        asyncio.ensure_future(anext(closer))
+
+        entry = _async_clients[loop] = (client, closer)
+
+    return entry[0]
+
+
+async def _close_on_shutdown(
+    loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+) -> AsyncGenerator[None, None]:
+    """Suspend until the loop's shutdown_asyncgens(), then close the client"""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+        # Drop the entry, which references the loop through this generator
+        entry = _async_clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _async_clients[loop]
+
+
+def _reset_after_fork() -> None:
+    """Drop clients inherited from the parent; their sockets belong to it"""
+    global _client, _lock
+
+    _client = None
+    _lock = threading.Lock()
+    _async_clients.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,181 @@
+from contextlib import AbstractContextManager, nullcontext
+from typing import Iterable, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import DatabaseError, connections, router, transaction
+
+from ...models import BlobObject
+from .cache import BlobMetadata
+
+
+class BlobIndex:
+    """
+    Database-backed index of blob names to their public URLs.
+
+    Rows are written when a blob is saved so lookups never need to list the
+    blob store. Database errors (e.g. migrations not applied yet) are treated
+    as index misses so the storage keeps working against the network. Inside
+    a transaction each query runs in a savepoint, so a failed one does not
+    abort the caller's transaction on PostgreSQL.
+
+    Args:
+        enabled: Whether the index is read and written at all.
+        using: Database alias to use instead of the one the routers pick.
+    """
+
+    def __init__(self, enabled: bool = True, using: Optional[str] = None) -> None:
+        self.enabled = enabled
+        self.using = using
+
+    def get(self, name: str) -> Optional[BlobMetadata]:
+        """Return the indexed metadata for a blob, or None if it is not indexed"""
+        if not self.enabled:
+            return None
+
+        alias = self.using or router.db_for_read(BlobObject)
+
+        try:
+            with self._savepoint(alias):
+                row = (
+                    BlobObject.objects.using(alias)
+                    .filter(name=name)
+                    .values_list("url", "size", "content_type")
+                    .first()
+                )
+        except DatabaseError:
+            return None
+
+        if row is None:
+            return None
+
+        url, size, content_type = row
+        return BlobMetadata(url=url, size=size, content_type=content_type or None)
+
+    def get_many(self, names: Iterable[str], batch_size: int = 500) -> dict[str, BlobMetadata]:
+        """Return the indexed metadata of every name found, one query per batch"""
+        if not self.enabled:
+            return {}
+
+        names = list(names)
+        found: dict[str, BlobMetadata] = {}
+        alias = self.using or router.db_for_read(BlobObject)
+
+        try:
+            with self._savepoint(alias):
+                for offset in range(0, len(names), batch_size):
+                    rows = (
+                        BlobObject.objects.using(alias)
+                        .filter(name__in=names[offset : offset + batch_size])
+                        .values_list("name", "url", "size", "content_type")
+                    )
+
+                    for name, url, size, content_type in rows:
+                        found[name] = BlobMetadata(
+                            url=url, size=size, content_type=content_type or None
+                        )
+        except DatabaseError:
+            pass
+
+        return found
+
+    def set(self, name: str, metadata: BlobMetadata) -> None:
+        """Record a blob in the index, replacing any previous row for the name"""
+        if not self.enabled:
+            return
+
+        alias = self.using or router.db_for_write(BlobObject)
+
+        try:
+            with self._savepoint(alias):
+                BlobObject.objects.using(alias).update_or_create(
+                    name=name,
+                    defaults={
+                        "url": metadata.url,
+                        "size": metadata.size,
+                        "content_type": metadata.content_type or "",
+                    },
+                )
+        except DatabaseError:
+            pass
+
+    def set_many(self, items: Iterable[tuple[str, BlobMetadata]], batch_size: int = 500) -> int:
+        """Upsert many blobs in batches and return the number of rows written"""
+        if not self.enabled:
+            return 0
+
+        rows = [
+            BlobObject(
+                name=name,
+                url=metadata.url,
+                size=metadata.size,
+                content_type=metadata.content_type or "",
+            )
+            for name, metadata in items
+        ]
+        alias = self.using or router.db_for_write(BlobObject)
+
+        try:
+            with self._savepoint(alias):
+                BlobObject.objects.using(alias).bulk_create(
+                    rows,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=["name"],
+                    update_fields=["url", "size", "content_type"],
+                )
+        except DatabaseError:
+            return 0
+
+        return len(rows)
+
+    def delete(self, name: str) -> None:
+        """Remove a blob from the index"""
+        if not self.enabled:
+            return
+
+        alias = self.using or router.db_for_write(BlobObject)
+
+        try:
+            with self._savepoint(alias):
+                BlobObject.objects.using(alias).filter(name=name).delete()
+        except DatabaseError:
+            pass
+
+    def delete_many(self, names: Iterable[str], batch_size: int = 500) -> None:
+        """Remove many blobs from the index, one query per batch"""
+        if not self.enabled:
+            return
+
+        names = list(names)
+        alias = self.using or router.db_for_write(BlobObject)
+
+        try:
+            with self._savepoint(alias):
+                for offset in range(0, len(names), batch_size):
+                    BlobObject.objects.using(alias).filter(
+                        name__in=names[offset : offset + batch_size]
+                    ).delete()
+        except DatabaseError:
+            pass
+
+    # Savepoints are not async-safe, so the async versions run the sync ones in a thread
+
+    async def aget(self, name: str) -> Optional[BlobMetadata]:
+        """Async version of get()"""
+        return await sync_to_async(self.get)(name)
+
+    async def aset(self, name: str, metadata: BlobMetadata) -> None:
+        """Async version of set()"""
+        await sync_to_async(self.set)(name, metadata)
+
+    async def adelete(self, name: str) -> None:
+        """Async version of delete()"""
+        await sync_to_async(self.delete)(name)
+
+    @staticmethod
+    def _savepoint(alias: str) -> AbstractContextManager[object]:
+        """A savepoint inside a transaction; outside one a failed query aborts nothing"""
+        if connections[alias].in_atomic_block:
+            return transaction.atomic(using=alias)
+
+        return nullcontext()
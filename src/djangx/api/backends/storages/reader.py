@@ -0,0 +1,211 @@
+import io
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+
+class RangedBlobReader(io.RawIOBase):
+    """
+    Seekable, read-only view of a public blob fetched with HTTP Range requests.
+
+    Nothing is downloaded until bytes are read, and only the requested range
+    is fetched. Wrap it in io.BufferedReader to add a read-ahead buffer so many
+    small reads (e.g. FileResponse blocks) collapse into few requests. If the
+    server ignores the Range header, the full body it sends is kept and every
+    later read is served from memory.
+
+    Args:
+        client: The HTTP client used to fetch ranges.
+        url: The public URL of the blob.
+        size: The size of the blob in bytes.
+    """
+
+    def __init__(self, client: httpx.Client, url: str, size: int) -> None:
+        super().__init__()
+        self.client = client
+        self.url = url
+        self.size = size
+        self._position = 0
+        # The whole blob, once a server has ignored a Range header
+        self._body: Optional[bytes] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self._position + offset
+            case io.SEEK_END:
+                position = self.size + offset
+            case _:
+                raise ValueError(f"Invalid whence: {whence}")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        """Fetch the bytes at the current position into the buffer"""
+        if self._position >= self.size:
+            return 0
+
+        end = min(self._position + len(buffer), self.size) - 1
+        data = self._fetch(self._position, end)
+
+        count = len(data)
+        memoryview(buffer).cast("B")[:count] = data
+        self._position += count
+
+        return count
+
+    def readall(self) -> bytes:
+        """Fetch everything from the current position in a single request"""
+        if self._position >= self.size:
+            return b""
+
+        data = self._fetch(self._position, self.size - 1)
+        self._position += len(data)
+
+        return data
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        """Fetch an inclusive byte range of the blob"""
+        if self._body is not None:
+            return self._body[start : end + 1]
+
+        # Streamed so the body is not kept on the response, which httpx holds in a
+        # reference cycle that only the garbage collector frees
+        with self.client.stream(
+            "GET", self.url, headers={"Range": f"bytes={start}-{end}"}
+        ) as response:
+            if response.status_code == 404:
+                raise FileNotFoundError(f"Blob {self.url} not found.")
+
+            response.raise_for_status()
+            content = b"".join(response.iter_bytes())
+
+        if response.status_code == 206:
+            return content
+
+        # The server ignored the Range header and sent the whole blob; keep it so
+        # later reads don't download it again
+        self._body = content
+        return self._body[start : end + 1]
+
+
+class AsyncBlobReader:
+    """
+    Read-only async file object for a public blob, fetched with HTTP Range requests.
+
+    The async counterpart of open_blob(): reads await the pooled client of the
+    running event loop instead of blocking it. Each request fetches at least
+    read_ahead bytes, so many small reads collapse into few requests.
+
+    Args:
+        client: The async HTTP client used to fetch ranges.
+        url: The public URL of the blob.
+        size: The size of the blob in bytes.
+        read_ahead: Minimum number of bytes fetched per request.
+        name: The storage name of the blob.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        size: int,
+        read_ahead: int,
+        name: Optional[str] = None,
+    ) -> None:
+        self.client = client
+        self.url = url
+        self.size = size
+        self.read_ahead = max(read_ahead, 1)
+        self.name = name
+        self._position = 0
+        # The bytes fetched last and the offset of the blob they start at
+        self._buffer = b""
+        self._buffer_start = 0
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self._position + offset
+            case io.SEEK_END:
+                position = self.size + offset
+            case _:
+                raise ValueError(f"Invalid whence: {whence}")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return position
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the current position, or everything left"""
+        if self._position >= self.size:
+            return b""
+
+        end = self.size if size < 0 else min(self._position + size, self.size)
+
+        if not self._is_buffered(self._position, end):
+            await self._fetch(
+                self._position, max(end, min(self._position + self.read_ahead, self.size))
+            )
+
+        offset = self._position - self._buffer_start
+        data = self._buffer[offset : offset + end - self._position]
+        self._position += len(data)
+
+        return data
+
+    async def chunks(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Yield the rest of the blob in chunks, like File.chunks()"""
+        while chunk := await self.read(chunk_size or self.read_ahead):
+            yield chunk
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.chunks()
+
+    def _is_buffered(self, start: int, end: int) -> bool:
+        return self._buffer_start <= start and end <= self._buffer_start + len(self._buffer)
+
+    async def _fetch(self, start: int, end: int) -> None:
+        """Fetch the byte range [start, end) of the blob into the buffer"""
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+
+        # Streamed for the same reason as RangedBlobReader._fetch()
+        async with self.client.stream("GET", self.url, headers=headers) as response:
+            if response.status_code == 404:
+                raise FileNotFoundError(f"Blob {self.url} not found.")
+
+            response.raise_for_status()
+            content = b"".join([chunk async for chunk in response.aiter_bytes()])
+
+        if response.status_code == 206:
+            self._buffer, self._buffer_start = content, start
+        else:
+            # The server ignored the Range header; the whole blob serves every later read
+            self._buffer, self._buffer_start = content, 0
+
+
+def open_blob(client: httpx.Client, url: str, size: int, read_ahead: int) -> io.BufferedReader:
+    """Return a buffered, lazily fetched file object for a public blob"""
+    return io.BufferedReader(RangedBlobReader(client, url, size), buffer_size=max(read_ahead, 1))
@@ -0,0 +1,139 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from threading import Event
+from typing import Any, Iterator, Optional
+
+from django.core.files.base import File
+
+from .api import BlobApi
+
+# Smallest part the Blob API accepts; only the last part may be smaller
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class ChunkedUploader:
+    """
+    Streams Django files to Vercel Blob without buffering them in memory.
+
+    Files up to the threshold are sent in a single streamed PUT. Larger files,
+    and files whose size is unknown, are split into parts that upload
+    concurrently. At most `concurrency` parts are in flight while the next one
+    is read, so peak memory is bounded by (concurrency + 1) * part_size
+    regardless of file size.
+
+    Args:
+        client: The blob API client to upload with.
+        threshold: Size in bytes above which multipart upload is used.
+        part_size: Size in bytes of each multipart part.
+        concurrency: Maximum number of parts uploading at once.
+    """
+
+    def __init__(
+        self,
+        client: BlobApi,
+        threshold: int,
+        part_size: int,
+        concurrency: int,
+    ) -> None:
+        self.client = client
+        self.threshold = threshold
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.concurrency = max(concurrency, 1)
+
+    def upload(
+        self, name: str, content: File, content_type: Optional[str] = None
+    ) -> tuple[dict[str, Any], int]:
+        """Upload a file and return the API response along with the bytes sent"""
+        size = self.get_size(content)
+
+        if size is not None and size <= self.threshold:
+            return self.client.put(name, self._iter_chunks(content), content_type), size
+
+        if content.seekable():
+            content.seek(0)
+
+        return self._upload_multipart(name, content, content_type)
+
+    def _upload_multipart(
+        self, name: str, content: File, content_type: Optional[str]
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Upload a file in concurrent parts, reading one part ahead at most.
+
+        When a part fails, no further parts are read or sent and the upload is
+        never completed. The Blob API has no abort action, so a multipart
+        upload that is not completed is simply never turned into a blob.
+        """
+        upload = self.client.create_multipart(name, content_type=content_type)
+
+        parts: list[dict[str, Any]] = []
+        total = 0
+        aborted = Event()
+
+        def upload_part(number: int, chunk: bytes) -> dict[str, Any]:
+            # Parts still queued behind a failed one are not worth sending
+            if aborted.is_set():
+                raise CancelledError
+            return self.client.upload_part(name, upload, number, chunk, content_type)
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        inflight: set[Future[dict[str, Any]]] = set()
+
+        try:
+            for number, chunk in enumerate(self._iter_parts(content), start=1):
+                total += len(chunk)
+                inflight.add(executor.submit(upload_part, number, chunk))
+
+                if len(inflight) >= self.concurrency:
+                    done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                    parts.extend(future.result() for future in done)
+
+            while inflight:
+                done, inflight = wait(inflight, return_when=FIRST_EXCEPTION)
+                parts.extend(future.result() for future in done)
+        except BaseException:
+            aborted.set()
+            for future in inflight:
+                future.cancel()
+            raise
+        finally:
+            # Don't block the caller on parts of an upload that will never complete
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not parts:
+            # Empty file of unknown size; the multipart API needs at least one part
+            parts.append(upload_part(1, b""))
+
+        parts.sort(key=lambda part: part["partNumber"])
+
+        return self.client.complete_multipart(name, upload, parts, content_type), total
+
+    @staticmethod
+    def _iter_chunks(content: File) -> Iterator[bytes]:
+        """Yield the whole file content in small chunks for a streamed request body"""
+        for chunk in content.chunks():
+            yield chunk.encode() if isinstance(chunk, str) else chunk
+
+    def _iter_parts(self, content: File) -> Iterator[bytes]:
+        """Yield the file content in part-sized chunks"""
+        while True:
+            chunk = content.read(self.part_size)
+
+            if not chunk:
+                return
+
+            yield chunk.encode() if isinstance(chunk, str) else bytes(chunk)
+
+    @staticmethod
+    def get_size(content: File) -> Optional[int]:
+        """Return the size of the file, or None if it cannot be determined"""
+        try:
+            return content.size
+        except (AttributeError, OSError, TypeError):
+            return None
@@ -0,0 +1,198 @@
+import logging
+import re
+import sys
+import sysconfig
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any, Callable, Optional
+
+import django
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from .settings import QUERIES_N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Frames from these directories are never the call site of a query
+_IGNORED_PATHS: tuple[str, ...] = (
+    str(Path(django.__file__).parent),
+    str(Path(__file__).parent),
+    sysconfig.get_paths()["stdlib"],
+    sysconfig.get_paths()["purelib"],
+)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+
+
+def normalize_sql(sql: str) -> str:
+    """Reduce a statement to its shape, replacing literals and IN lists with placeholders"""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def find_origin(frame: Optional[FrameType]) -> str:
+    """
+    Describe where a query came from: the template node being rendered, if
+    any, and the innermost frame outside Django and the standard library.
+    """
+    template: Optional[str] = None
+    call_site: Optional[str] = None
+
+    while frame is not None and (template is None or call_site is None):
+        filename = frame.f_code.co_filename
+
+        if template is None and frame.f_code.co_name == "render_annotated":
+            node = frame.f_locals.get("self")
+            origin = getattr(node, "origin", None)
+            token = getattr(node, "token", None)
+            if origin is not None:
+                template = f"{origin.name}:{getattr(token, 'lineno', '?')}"
+
+        if call_site is None and not filename.startswith(_IGNORED_PATHS):
+            call_site = f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+        frame = frame.f_back
+
+    parts = [f"template {template}"] if template else []
+    parts.append(call_site or "unknown call site")
+
+    return ", ".join(parts)
+
+
+def find_view(frame: Optional[FrameType]) -> Optional[str]:
+    """Return the dotted path of the view Django's request handler is running, if any"""
+    while frame is not None:
+        if frame.f_code.co_name == "_get_response" and "callback" in frame.f_locals:
+            callback = frame.f_locals["callback"]
+            # Class-based views are plain functions that carry their class
+            view = getattr(callback, "view_class", callback)
+            return f"{view.__module__}.{view.__qualname__}"
+
+        frame = frame.f_back
+
+    return None
+
+
+@dataclass
+class QueryRecorder:
+    """
+    Execute wrapper recording the queries run while it is installed.
+
+    Attributes:
+        threshold: Repeats of one statement shape reported as a suspected N+1.
+        count: Number of queries executed.
+        duration: Total time spent in the database in seconds.
+        statements: Executions of each normalized statement.
+        origins: Where each suspected N+1 statement was first repeated.
+    """
+
+    threshold: int = QUERIES_N_PLUS_ONE_THRESHOLD
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    origins: dict[str, str] = field(default_factory=dict)
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        started = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += perf_counter() - started
+            self.count += 1
+
+            statement = normalize_sql(sql)
+            self.statements[statement] += 1
+
+            # Capture the origin only once per statement, when it becomes suspect
+            if self.threshold > 0 and self.statements[statement] == self.threshold:
+                self.origins[statement] = find_origin(sys._getframe(1))
+
+    def install(self) -> ExitStack:
+        """Return a context manager wrapping every database connection of this thread"""
+        stack = ExitStack()
+
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+
+        return stack
+
+    @property
+    def repeated(self) -> dict[str, int]:
+        """Statements executed at least `threshold` times, most frequent first"""
+        return {
+            statement: count
+            for statement, count in self.statements.most_common()
+            if self.threshold > 0 and count >= self.threshold
+        }
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record the queries of each request and report them.
+
+    Adds `X-DB-Queries` and a `db` entry to `Server-Timing` on the response,
+    and logs a warning for every statement repeated often enough to suggest
+    an N+1 pattern, naming the template or code that issued it. Queries are
+    recorded on the request's thread, which under ASGI covers sync views.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        recorder = QueryRecorder()
+
+        with recorder.install():
+            response = self.get_response(request)
+
+        self._add_headers(response, recorder)
+        self._log_repeated(request, recorder)
+
+        return response
+
+    @staticmethod
+    def _add_headers(response: HttpResponse, recorder: QueryRecorder) -> None:
+        timing = f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries"'
+        existing = response.get("Server-Timing")
+
+        response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+        response["X-DB-Queries"] = str(recorder.count)
+
+    @staticmethod
+    def _log_repeated(request: HttpRequest, recorder: QueryRecorder) -> None:
+        for statement, count in recorder.repeated.items():
+            logger.warning(
+                "Suspected N+1 query on %s %s: %d executions of %s (from %s)",
+                request.method,
+                request.path,
+                count,
+                statement,
+                recorder.origins.get(statement, "unknown call site"),
+            )
+
+
+__all__ = [
+    "QueryInstrumentationMiddleware",
+    "QueryRecorder",
+    "find_origin",
+    "find_view",
+    "normalize_sql",
+]
@@ -0,0 +1,45 @@
+from django.db import models
+from django.utils import timezone
+
+
+class BlobObject(models.Model):
+    """
+    Index of blobs saved through the Vercel Blob storage backend.
+
+    Maps each stored name to its public URL so that url(), exists() and size()
+    resolve from the database instead of listing the blob store.
+    """
+
+    name = models.CharField(max_length=950, unique=True)
+    url = models.URLField(max_length=2048)
+    size = models.PositiveBigIntegerField(default=0)
+    content_type = models.CharField(max_length=255, blank=True)
+    uploaded_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "blob object"
+        verbose_name_plural = "blob objects"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class BuildFingerprint(models.Model):
+    """
+    Fingerprint of the state left behind by the last successful build.
+
+    Stored in the database rather than on disk so that it survives the fresh
+    checkouts of deploy builds, and lets runbuild skip steps whose inputs
+    have not changed since.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    digest = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "build fingerprint"
+        verbose_name_plural = "build fingerprints"
+
+    def __str__(self) -> str:
+        return self.name
@@ -1,4 +1,5 @@
 from .auth import *  # noqa: F403
 from .databases import *  # noqa: F403
 from .gateway import *  # noqa: F403
+from .queries import *  # noqa: F403
 from .storages import *  # noqa: F403
@@ -4,6 +4,8 @@
 # ==============================================================================
 from typing import Literal
 
+from ... import Conf, ConfField
+
 AUTH_PASSWORD_VALIDATORS: list[dict[Literal["NAME"], str]] = [
     {"NAME": f"django.contrib.auth.password_validation.{validator}"}
     for validator in [
@@ -15,4 +17,28 @@ AUTH_PASSWORD_VALIDATORS: list[dict[Literal["NAME"], str]] = [
 ]
 
 
-__all__ = ["AUTH_PASSWORD_VALIDATORS"]
+class AuthConf(Conf):
+    """Authentication configuration settings."""
+
+    # Seconds the user of a session stays cached; 0 resolves it on every request
+    user_cache_ttl = ConfField(env="AUTH_USER_CACHE_TTL", toml="auth.user-cache-ttl", type=int)
+    # Use a shared cache when several processes serve requests, so saves invalidate them all;
+    # a per-process LocMemCache is reported by the djangx.W001 system check
+    user_cache_alias = ConfField(
+        env="AUTH_USER_CACHE_ALIAS",
+        toml="auth.user-cache-alias",
+        default="default",
+        type=str,
+    )
+
+
+_AUTH = AuthConf()
+
+if _AUTH.user_cache_ttl < 0:
+    raise ValueError(f"AUTH_USER_CACHE_TTL must not be negative, got {_AUTH.user_cache_ttl}.")
+
+AUTH_USER_CACHE_TTL: int = _AUTH.user_cache_ttl
+AUTH_USER_CACHE_ALIAS: str = _AUTH.user_cache_alias
+
+
+__all__ = ["AUTH_PASSWORD_VALIDATORS", "AUTH_USER_CACHE_TTL", "AUTH_USER_CACHE_ALIAS"]
@@ -4,10 +4,20 @@
 # https://www.postgresql.org/docs/current/libpq-pgservice.html
 # https://www.postgresql.org/docs/current/libpq-pgpass.html
 # ==============================================================================
+import os
+import tempfile
 from pathlib import Path
+from typing import Optional
 
-from ... import Conf, ConfField
-from ..types import DatabaseDict, DatabaseOptionsDict, DatabasesDict
+from ... import PKG_NAME, Conf, ConfField
+from ...cli.settings.security import DEBUG
+from ..types import DatabaseDict, DatabaseOptionsDict, DatabasePoolDict, DatabasesDict
+from .gateway import USE_ASGI
+
+_SQLITE_JOURNAL_MODES = ["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"]
+_SQLITE_SYNCHRONOUS = ["OFF", "NORMAL", "FULL", "EXTRA"]
+_SQLITE_TEMP_STORES = ["DEFAULT", "FILE", "MEMORY"]
+_SQLITE_TRANSACTION_MODES = ["DEFERRED", "IMMEDIATE", "EXCLUSIVE"]
 
 
 class DatabaseConf(Conf):
@@ -28,11 +38,320 @@ class DatabaseConf(Conf):
     host = ConfField(env="DB_HOST", type=str)
     port = ConfField(env="DB_PORT", type=str)
     pool = ConfField(env="DB_POOL", toml="db.pool", type=bool)
+    # Connecting through PgBouncer in transaction pooling mode
+    pgbouncer = ConfField(env="DB_PGBOUNCER", toml="db.pgbouncer", default=False, type=bool)
+    # Pool sizing and timeouts in seconds; 0 derives a default from the CPU count
+    pool_min_size = ConfField(env="DB_POOL_MIN_SIZE", toml="db.pool-min-size", type=int)
+    pool_max_size = ConfField(env="DB_POOL_MAX_SIZE", toml="db.pool-max-size", type=int)
+    pool_timeout = ConfField(env="DB_POOL_TIMEOUT", toml="db.pool-timeout", default=10, type=int)
+    pool_max_idle = ConfField(env="DB_POOL_MAX_IDLE", toml="db.pool-max-idle", default=300, type=int)
+    pool_max_lifetime = ConfField(
+        env="DB_POOL_MAX_LIFETIME", toml="db.pool-max-lifetime", default=1800, type=int
+    )
+    pool_num_workers = ConfField(
+        env="DB_POOL_NUM_WORKERS", toml="db.pool-num-workers", default=3, type=int
+    )
     ssl_mode = ConfField(env="DB_SSL_MODE", toml="db.ssl-mode", default="prefer", type=str)
+    # Seconds, "none" for unlimited; a string so that an explicit 0 differs from unset
+    conn_max_age = ConfField(env="DB_CONN_MAX_AGE", toml="db.conn-max-age", type=str)
+    conn_health_checks = ConfField(
+        env="DB_CONN_HEALTH_CHECKS", toml="db.conn-health-checks", type=bool
+    )
+    # PostgreSQL session timeouts in milliseconds; 0 leaves the server setting in place
+    statement_timeout = ConfField(env="DB_STATEMENT_TIMEOUT", toml="db.statement-timeout", type=int)
+    idle_in_transaction_timeout = ConfField(
+        env="DB_IDLE_IN_TRANSACTION_TIMEOUT", toml="db.idle-in-transaction-timeout", type=int
+    )
+    disable_server_side_cursors = ConfField(
+        env="DB_DISABLE_SERVER_SIDE_CURSORS",
+        toml="db.disable-server-side-cursors",
+        default=False,
+        type=bool,
+    )
+    # Executions before psycopg prepares a statement, "none" to never prepare
+    prepare_threshold = ConfField(env="DB_PREPARE_THRESHOLD", toml="db.prepare-threshold", type=str)
+    # Opt-in, so existing SQLite databases keep their journal mode and durability
+    sqlite_tuning = ConfField(
+        env="DB_SQLITE_TUNING", toml="db.sqlite-tuning", default=False, type=bool
+    )
+    sqlite_journal_mode = ConfField(
+        choices=_SQLITE_JOURNAL_MODES,
+        env="DB_SQLITE_JOURNAL_MODE",
+        toml="db.sqlite-journal-mode",
+        default="WAL",
+        type=str,
+    )
+    sqlite_synchronous = ConfField(
+        choices=_SQLITE_SYNCHRONOUS,
+        env="DB_SQLITE_SYNCHRONOUS",
+        toml="db.sqlite-synchronous",
+        default="NORMAL",
+        type=str,
+    )
+    # Bytes of the database file to memory-map
+    sqlite_mmap_size = ConfField(
+        env="DB_SQLITE_MMAP_SIZE", toml="db.sqlite-mmap-size", default=128 * 1024 * 1024, type=int
+    )
+    # Pages if positive, KiB if negative, as in PRAGMA cache_size
+    sqlite_cache_size = ConfField(
+        env="DB_SQLITE_CACHE_SIZE", toml="db.sqlite-cache-size", default=-20000, type=int
+    )
+    # Seconds to wait for a lock before failing with "database is locked"
+    sqlite_busy_timeout = ConfField(
+        env="DB_SQLITE_BUSY_TIMEOUT", toml="db.sqlite-busy-timeout", default=5, type=int
+    )
+    sqlite_temp_store = ConfField(
+        choices=_SQLITE_TEMP_STORES,
+        env="DB_SQLITE_TEMP_STORE",
+        toml="db.sqlite-temp-store",
+        default="MEMORY",
+        type=str,
+    )
+    sqlite_transaction_mode = ConfField(
+        choices=_SQLITE_TRANSACTION_MODES,
+        env="DB_SQLITE_TRANSACTION_MODE",
+        toml="db.sqlite-transaction-mode",
+        default="IMMEDIATE",
+        type=str,
+    )
+    # Statements slower than this many milliseconds are logged; 0 disables the log
+    slow_query_ms = ConfField(env="DB_SLOW_QUERY_MS", toml="db.slow-query-ms", type=int)
+    slow_query_log = ConfField(
+        env="DB_SLOW_QUERY_LOG",
+        toml="db.slow-query-log",
+        default="slow-queries.jsonl",
+        type=str,
+    )
+    slow_query_log_max_bytes = ConfField(
+        env="DB_SLOW_QUERY_LOG_MAX_BYTES",
+        toml="db.slow-query-log-max-bytes",
+        default=10 * 1024 * 1024,
+        type=int,
+    )
+    slow_query_log_backups = ConfField(
+        env="DB_SLOW_QUERY_LOG_BACKUPS",
+        toml="db.slow-query-log-backups",
+        default=5,
+        type=int,
+    )
+    # Service names, or host[:port] entries when DB_USE_VARS is set
+    replicas = ConfField(env="DB_REPLICAS", toml="db.replicas", type=list)
+    replica_selection = ConfField(
+        choices=["round-robin", "least-loaded"],
+        env="DB_REPLICA_SELECTION",
+        toml="db.replica-selection",
+        default="round-robin",
+        type=str,
+    )
 
 
 _DATABASE = DatabaseConf()
 
+# Connection lifetime in production when DB_CONN_MAX_AGE is not set
+_DEFAULT_CONN_MAX_AGE = 60
+
+
+def _get_conn_max_age() -> Optional[int]:
+    """
+    Return how long a connection is kept open between requests.
+
+    Persistent connections skip the TCP and TLS setup on every request, so
+    they are enabled by default in production. They stay off in DEBUG, with
+    connection pooling (which Django does not allow them with) and under
+    ASGI, where Django recommends pooling instead. Behind PgBouncer they
+    keep the cheap client connection to PgBouncer open, which hands out
+    server connections per transaction.
+    """
+    value: str = _DATABASE.conn_max_age.strip().lower()
+
+    if value in ("none", "unlimited"):
+        max_age: Optional[int] = None
+    elif value:
+        try:
+            max_age = int(value)
+        except ValueError as e:
+            raise ValueError(f"Invalid DB_CONN_MAX_AGE: {value!r}") from e
+    else:
+        return 0 if DEBUG or _DATABASE.pool or USE_ASGI else _DEFAULT_CONN_MAX_AGE
+
+    if _DATABASE.pool and max_age != 0:
+        raise ValueError("DB_CONN_MAX_AGE must be 0 when DB_POOL is enabled.")
+
+    return max_age
+
+
+def _check_pgbouncer() -> None:
+    """
+    Reject settings that PgBouncer's transaction pooling breaks.
+
+    A client-side pool would only pool connections to PgBouncer, which
+    already pools server connections. Session settings sent at connection
+    startup apply to whichever server connection PgBouncer happens to open,
+    not to the ones later transactions run on; set them on the database
+    role instead.
+    """
+    if _DATABASE.pool:
+        raise ValueError("DB_POOL must be off when DB_PGBOUNCER is enabled.")
+
+    if _DATABASE.statement_timeout or _DATABASE.idle_in_transaction_timeout:
+        raise ValueError(
+            "DB_STATEMENT_TIMEOUT and DB_IDLE_IN_TRANSACTION_TIMEOUT are not applied per "
+            "transaction behind PgBouncer; use ALTER ROLE ... SET instead."
+        )
+
+
+def _get_pool_options() -> DatabasePoolDict:
+    """
+    Return the psycopg pool options, filling in sizes from the worker model.
+
+    Each process has its own pool. Under ASGI one process serves many
+    requests at once, so the pool scales with the CPU count; under WSGI
+    concurrency per process is bounded by its threads, so it stays smaller.
+    """
+    cpus = os.cpu_count() or 1
+    max_size: int = _DATABASE.pool_max_size or max(4, cpus * (4 if USE_ASGI else 2))
+    min_size: int = _DATABASE.pool_min_size or min(max(2, max_size // 4), max_size)
+
+    if min_size < 0 or max_size < 1 or min_size > max_size:
+        raise ValueError(
+            f"Invalid DB pool size: min {min_size} and max {max_size} "
+            "need 0 <= min <= max and max >= 1."
+        )
+
+    positive: dict[str, int] = {
+        "timeout": _DATABASE.pool_timeout,
+        "max_idle": _DATABASE.pool_max_idle,
+        "max_lifetime": _DATABASE.pool_max_lifetime,
+        "num_workers": _DATABASE.pool_num_workers,
+    }
+
+    for key, value in positive.items():
+        if value <= 0:
+            raise ValueError(f"DB pool option '{key}' must be positive, got {value}.")
+
+    return {
+        "min_size": min_size,
+        "max_size": max_size,
+        "timeout": _DATABASE.pool_timeout,
+        "max_idle": _DATABASE.pool_max_idle,
+        "max_lifetime": _DATABASE.pool_max_lifetime,
+        "num_workers": _DATABASE.pool_num_workers,
+    }
+
+
+def _get_conn_health_checks() -> bool:
+    """Return whether persistent connections are checked before reuse."""
+    if _DATABASE.conn_health_checks is None:
+        # PgBouncer closes idle client connections on its own schedule
+        return _DATABASE.pgbouncer or not DEBUG
+
+    return _DATABASE.conn_health_checks
+
+
+def _get_session_options() -> DatabaseOptionsDict:
+    """
+    Return the PostgreSQL options set once per connection.
+
+    Timeouts travel in the startup packet through libpq's `options`, so the
+    server applies them when a connection is opened, pooled or not, and no
+    request pays for a `SET`. They replace any `options` from the service file.
+    """
+    timeouts: dict[str, int] = {
+        "statement_timeout": _DATABASE.statement_timeout,
+        "idle_in_transaction_session_timeout": _DATABASE.idle_in_transaction_timeout,
+    }
+
+    for setting, value in timeouts.items():
+        if value < 0:
+            raise ValueError(f"PostgreSQL {setting} must not be negative, got {value}.")
+
+    options: DatabaseOptionsDict = {}
+    flags: list[str] = [f"-c {setting}={value}" for setting, value in timeouts.items() if value]
+
+    if flags:
+        options["options"] = " ".join(flags)
+
+    threshold: str = _DATABASE.prepare_threshold.strip().lower()
+
+    # Prepared statements live on one server connection, which PgBouncer does not
+    # keep per client; PgBouncer 1.21+ with max_prepared_statements can opt back in
+    if threshold in ("none", "off") or (_DATABASE.pgbouncer and not threshold):
+        options["prepare_threshold"] = None
+    elif threshold:
+        try:
+            options["prepare_threshold"] = int(threshold)
+        except ValueError as e:
+            raise ValueError(f"Invalid DB_PREPARE_THRESHOLD: {threshold!r}") from e
+
+    return options
+
+
+def _get_sqlite_options() -> DatabaseOptionsDict:
+    """
+    Return the SQLite tuning profile, or no options when tuning is off.
+
+    WAL lets readers run alongside a writer, and with synchronous=NORMAL a
+    commit no longer waits for an fsync (durability across power loss is
+    traded for the last few transactions, never for integrity). IMMEDIATE
+    transactions take the write lock up front, so concurrent writers wait
+    for the busy timeout instead of failing on a lock upgrade.
+    """
+    if not _DATABASE.sqlite_tuning:
+        return {}
+
+    pragmas: dict[str, tuple[str, list[str]]] = {
+        "journal_mode": (_DATABASE.sqlite_journal_mode, _SQLITE_JOURNAL_MODES),
+        "synchronous": (_DATABASE.sqlite_synchronous, _SQLITE_SYNCHRONOUS),
+        "temp_store": (_DATABASE.sqlite_temp_store, _SQLITE_TEMP_STORES),
+        "transaction mode": (_DATABASE.sqlite_transaction_mode, _SQLITE_TRANSACTION_MODES),
+    }
+
+    for pragma, (value, choices) in pragmas.items():
+        if value.upper() not in choices:
+            raise ValueError(f"Invalid SQLite {pragma}: {value!r}. Choose from {choices}.")
+
+    commands: list[str] = [
+        f"PRAGMA journal_mode={_DATABASE.sqlite_journal_mode.upper()}",
+        f"PRAGMA synchronous={_DATABASE.sqlite_synchronous.upper()}",
+        f"PRAGMA temp_store={_DATABASE.sqlite_temp_store.upper()}",
+        f"PRAGMA mmap_size={_DATABASE.sqlite_mmap_size}",
+        f"PRAGMA cache_size={_DATABASE.sqlite_cache_size}",
+    ]
+
+    return {
+        "init_command": ";".join(commands),
+        "transaction_mode": _DATABASE.sqlite_transaction_mode.upper(),
+        "timeout": _DATABASE.sqlite_busy_timeout,
+    }
+
+
+def _get_replica_configs(primary: DatabaseDict) -> DatabasesDict:
+    """
+    Generate a `replica_<n>` alias per configured replica.
+
+    Replicas share the primary's settings and differ only in the service
+    name, or in host and port. They mirror the primary in tests, so test
+    data written to it is visible through every replica alias.
+    """
+    replicas: DatabasesDict = {}
+
+    for index, entry in enumerate(_DATABASE.replicas, start=1):
+        config = primary.copy()
+        options = primary.get("OPTIONS", {}).copy()
+
+        if _DATABASE.use_vars:
+            host, _, port = entry.partition(":")
+            config["HOST"] = host
+            config["PORT"] = port or primary.get("PORT")
+        else:
+            options["service"] = entry
+
+        config["OPTIONS"] = options
+        config["TEST"] = {"MIRROR": "default"}
+        replicas[f"replica_{index}"] = config
+
+    return replicas
+
 
 def _get_databases_config() -> DatabasesDict:
     """Generate databases configuration based on backend type."""
@@ -41,16 +360,32 @@ def _get_databases_config() -> DatabasesDict:
 
     match backend:
         case "sqlite" | "sqlite3":
+            if _DATABASE.replicas:
+                raise ValueError("DB_REPLICAS requires the PostgreSQL backend.")
+            if _DATABASE.pgbouncer:
+                raise ValueError("DB_PGBOUNCER requires the PostgreSQL backend.")
+
             return {
                 "default": {
                     "ENGINE": "django.db.backends.sqlite3",
                     "NAME": Path.cwd() / "db.sqlite3",
+                    "CONN_MAX_AGE": _get_conn_max_age(),
+                    "CONN_HEALTH_CHECKS": _get_conn_health_checks(),
+                    "OPTIONS": _get_sqlite_options(),
                 }
             }
         case "postgresql" | "postgres" | "psql" | "pgsql" | "pg" | "psycopg":
+            if _DATABASE.pgbouncer:
+                _check_pgbouncer()
+
+            # Named cursors do not survive PgBouncer moving the client between servers
+            disable_server_side_cursors: bool = (
+                _DATABASE.pgbouncer or _DATABASE.disable_server_side_cursors
+            )
             options: DatabaseOptionsDict = {
-                "pool": _DATABASE.pool,
+                "pool": _get_pool_options() if _DATABASE.pool else False,
                 "sslmode": _DATABASE.ssl_mode,
+                **_get_session_options(),
             }
 
             # Add service or connection vars
@@ -62,6 +397,9 @@ def _get_databases_config() -> DatabasesDict:
                     "PASSWORD": _DATABASE.password,
                     "HOST": _DATABASE.host,
                     "PORT": _DATABASE.port,
+                    "CONN_MAX_AGE": _get_conn_max_age(),
+                    "CONN_HEALTH_CHECKS": _get_conn_health_checks(),
+                    "DISABLE_SERVER_SIDE_CURSORS": disable_server_side_cursors,
                     "OPTIONS": options,
                 }
             else:
@@ -69,15 +407,37 @@ def _get_databases_config() -> DatabasesDict:
                 config = {
                     "ENGINE": "django.db.backends.postgresql",
                     "NAME": _DATABASE.name,
+                    "CONN_MAX_AGE": _get_conn_max_age(),
+                    "CONN_HEALTH_CHECKS": _get_conn_health_checks(),
+                    "DISABLE_SERVER_SIDE_CURSORS": disable_server_side_cursors,
                     "OPTIONS": options,
                 }
 
-            return {"default": config}
+            return {"default": config, **_get_replica_configs(config)}
         case _:
             raise ValueError(f"Unsupported DB backend: {backend}")
 
 
 DATABASES: DatabasesDict = _get_databases_config()
+DATABASE_REPLICAS: list[str] = [alias for alias in DATABASES if alias != "default"]
+DATABASE_REPLICA_SELECTION: str = _DATABASE.replica_selection
+DATABASE_ROUTERS: list[str] = (
+    [f"{PKG_NAME}.api.backends.routers.ReplicaRouter"] if DATABASE_REPLICAS else []
+)
+SLOW_QUERY_MS: int = _DATABASE.slow_query_ms
+# Relative paths land in the temp dir, the one writable place on serverless hosts
+SLOW_QUERY_LOG: Path = Path(tempfile.gettempdir()) / _DATABASE.slow_query_log
+SLOW_QUERY_LOG_MAX_BYTES: int = _DATABASE.slow_query_log_max_bytes
+SLOW_QUERY_LOG_BACKUPS: int = _DATABASE.slow_query_log_backups
 
 
-__all__ = ["DATABASES"]
+__all__ = [
+    "DATABASES",
+    "DATABASE_REPLICAS",
+    "DATABASE_REPLICA_SELECTION",
+    "DATABASE_ROUTERS",
+    "SLOW_QUERY_MS",
+    "SLOW_QUERY_LOG",
+    "SLOW_QUERY_LOG_MAX_BYTES",
+    "SLOW_QUERY_LOG_BACKUPS",
+]
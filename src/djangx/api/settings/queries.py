@@ -0,0 +1,25 @@
+# ==============================================================================
+# Query instrumentation
+# https://docs.djangoproject.com/en/stable/topics/db/instrumentation/
+# ==============================================================================
+from ... import Conf, ConfField
+
+
+class QueriesConf(Conf):
+    """Query instrumentation configuration settings."""
+
+    # Identical statements in one request before they are reported as N+1
+    n_plus_one_threshold = ConfField(
+        env="QUERIES_N_PLUS_ONE_THRESHOLD",
+        toml="queries.n-plus-one-threshold",
+        default=5,
+        type=int,
+    )
+
+
+_QUERIES = QueriesConf()
+
+QUERIES_N_PLUS_ONE_THRESHOLD: int = _QUERIES.n_plus_one_threshold
+
+
+__all__ = ["QUERIES_N_PLUS_ONE_THRESHOLD"]
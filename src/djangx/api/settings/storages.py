@@ -16,13 +16,92 @@ class StorageConf(Conf):
     """Storage configuration settings."""
 
     backend = ConfField(
-        choices=["filesystem", "blob"],
+        choices=["filesystem", "dedup", "blob"],
         env="STORAGE_BACKEND",
         toml="storage.backend",
         default="filesystem",
         type=str,
     )
     token = ConfField(env="BLOB_READ_WRITE_TOKEN", toml="storage.blob-token", type=str)
+    blob_cache_ttl = ConfField(
+        env="BLOB_CACHE_TTL",
+        toml="storage.blob-cache-ttl",
+        default=300,
+        type=int,
+    )
+    blob_cache_size = ConfField(
+        env="BLOB_CACHE_SIZE",
+        toml="storage.blob-cache-size",
+        default=1024,
+        type=int,
+    )
+    blob_cache_alias = ConfField(env="BLOB_CACHE_ALIAS", toml="storage.blob-cache-alias", type=str)
+    blob_multipart_threshold = ConfField(
+        env="BLOB_MULTIPART_THRESHOLD",
+        toml="storage.blob-multipart-threshold",
+        default=8 * 1024 * 1024,
+        type=int,
+    )
+    blob_part_size = ConfField(
+        env="BLOB_PART_SIZE",
+        toml="storage.blob-part-size",
+        default=8 * 1024 * 1024,
+        type=int,
+    )
+    blob_upload_concurrency = ConfField(
+        env="BLOB_UPLOAD_CONCURRENCY",
+        toml="storage.blob-upload-concurrency",
+        default=4,
+        type=int,
+    )
+    blob_read_ahead = ConfField(
+        env="BLOB_READ_AHEAD",
+        toml="storage.blob-read-ahead",
+        default=256 * 1024,
+        type=int,
+    )
+    blob_pool_size = ConfField(
+        env="BLOB_POOL_SIZE",
+        toml="storage.blob-pool-size",
+        default=20,
+        type=int,
+    )
+    blob_keepalive = ConfField(
+        env="BLOB_KEEPALIVE",
+        toml="storage.blob-keepalive",
+        default=30,
+        type=int,
+    )
+    blob_connect_timeout = ConfField(
+        env="BLOB_CONNECT_TIMEOUT",
+        toml="storage.blob-connect-timeout",
+        default=5,
+        type=int,
+    )
+    blob_timeout = ConfField(
+        env="BLOB_TIMEOUT",
+        toml="storage.blob-timeout",
+        default=30,
+        type=int,
+    )
+    static_offload_prefix = ConfField(
+        env="STATIC_OFFLOAD_PREFIX",
+        toml="storage.static-offload-prefix",
+        default="static",
+        type=str,
+    )
+    static_offload_workers = ConfField(
+        env="STATIC_OFFLOAD_WORKERS",
+        toml="storage.static-offload-workers",
+        default=16,
+        type=int,
+    )
+    blob_index = ConfField(
+        env="BLOB_INDEX",
+        toml="storage.blob-index",
+        default=True,
+        type=bool,
+    )
 
 
 _STORAGE = StorageConf()
@@ -37,6 +116,8 @@ def _get_storages_config() -> StoragesDict:
     match backend:
         case "filesystem" | "local" | "fs":
             storage_backend = "django.core.files.storage.FileSystemStorage"
+        case "dedup":
+            storage_backend = f"{PKG_NAME}.api.backends.dedup.DedupFileSystemStorage"
         case "blob" | "vercel" | "vercel-blob":
             storage_backend = f"{PKG_NAME}.api.backends.storages.VercelBlobStorage"
         case _:
@@ -54,8 +135,44 @@ def _get_storages_config() -> StoragesDict:
 
 STORAGES: StoragesDict = _get_storages_config()
 BLOB_READ_WRITE_TOKEN: str = _STORAGE.token
+BLOB_CACHE_TTL: int = _STORAGE.blob_cache_ttl
+BLOB_CACHE_SIZE: int = _STORAGE.blob_cache_size
+BLOB_CACHE_ALIAS: str = _STORAGE.blob_cache_alias
+BLOB_INDEX: bool = _STORAGE.blob_index
+BLOB_MULTIPART_THRESHOLD: int = _STORAGE.blob_multipart_threshold
+BLOB_PART_SIZE: int = _STORAGE.blob_part_size
+BLOB_UPLOAD_CONCURRENCY: int = _STORAGE.blob_upload_concurrency
+BLOB_READ_AHEAD: int = _STORAGE.blob_read_ahead
+BLOB_POOL_SIZE: int = _STORAGE.blob_pool_size
+BLOB_KEEPALIVE: int = _STORAGE.blob_keepalive
+BLOB_CONNECT_TIMEOUT: int = _STORAGE.blob_connect_timeout
+BLOB_TIMEOUT: int = _STORAGE.blob_timeout
+STATIC_OFFLOAD_PREFIX: str = _STORAGE.static_offload_prefix
+STATIC_OFFLOAD_WORKERS: int = _STORAGE.static_offload_workers
 STATIC_ROOT: Path = Path.cwd() / "public" / "static"
 MEDIA_ROOT: Path = Path.cwd() / "public" / "media"
-
-
-__all__ = ["STORAGES", "BLOB_READ_WRITE_TOKEN", "STATIC_ROOT", "MEDIA_ROOT"]
+# Outside the served public directory; on the same filesystem so media files can hard-link
+MEDIA_BLOB_ROOT: Path = Path.cwd() / ".media-blobs"
+
+
+__all__ = [
+    "STORAGES",
+    "BLOB_READ_WRITE_TOKEN",
+    "BLOB_CACHE_TTL",
+    "BLOB_CACHE_SIZE",
+    "BLOB_CACHE_ALIAS",
+    "BLOB_INDEX",
+    "BLOB_MULTIPART_THRESHOLD",
+    "BLOB_PART_SIZE",
+    "BLOB_UPLOAD_CONCURRENCY",
+    "BLOB_READ_AHEAD",
+    "BLOB_POOL_SIZE",
+    "BLOB_KEEPALIVE",
+    "BLOB_CONNECT_TIMEOUT",
+    "BLOB_TIMEOUT",
+    "STATIC_OFFLOAD_PREFIX",
+    "STATIC_OFFLOAD_WORKERS",
+    "STATIC_ROOT",
+    "MEDIA_ROOT",
+    "MEDIA_BLOB_ROOT",
+]
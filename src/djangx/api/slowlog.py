@@ -0,0 +1,213 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from hashlib import sha256
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from django.db import connections
+
+from .middleware import find_origin, find_view, normalize_sql
+from .settings import (
+    SLOW_QUERY_LOG,
+    SLOW_QUERY_LOG_BACKUPS,
+    SLOW_QUERY_LOG_MAX_BYTES,
+    SLOW_QUERY_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statements PostgreSQL can EXPLAIN without running them
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+# Entries waiting for the writer; beyond this, new slow queries are dropped
+_QUEUE_SIZE = 1000
+
+
+class SlowQueryLog:
+    """
+    Execute wrapper logging statements slower than a threshold.
+
+    Each entry records the normalized SQL, a hash of the parameters, the
+    duration, and the view and call site that ran it. The request thread
+    only timestamps the query and enqueues the entry; a background thread
+    runs `EXPLAIN (FORMAT JSON)` on PostgreSQL, over its own connection, and
+    appends the entry to a rotating JSON Lines file.
+
+    Args:
+        threshold_ms: Duration in milliseconds above which a query is logged.
+        path: File the entries are appended to.
+        max_bytes: Size at which the file is rotated.
+        backups: Number of rotated files kept.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: int = SLOW_QUERY_MS,
+        path: os.PathLike[str] | str = SLOW_QUERY_LOG,
+        max_bytes: int = SLOW_QUERY_LOG_MAX_BYTES,
+        backups: int = SLOW_QUERY_LOG_BACKUPS,
+    ) -> None:
+        self.threshold = threshold_ms / 1000
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self._queue: queue.Queue[Optional[dict[str, Any]]] = queue.Queue(_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        # The writer's own EXPLAIN queries are never slow-logged
+        if threading.current_thread() is self._worker:
+            return execute(sql, params, many, context)
+
+        started = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - started
+
+            if duration >= self.threshold:
+                frame = sys._getframe(1)
+                self._enqueue(
+                    {
+                        "time": datetime.now(timezone.utc).isoformat(),
+                        "alias": context["connection"].alias,
+                        "vendor": context["connection"].vendor,
+                        "duration_ms": round(duration * 1000, 3),
+                        "sql": normalize_sql(sql),
+                        "params_hash": self._hash_params(params),
+                        "view": find_view(frame),
+                        "origin": find_origin(frame),
+                        # Kept in memory for EXPLAIN only; never written to the log
+                        "_raw": None if many else (sql, params),
+                    }
+                )
+
+    def install(self, connection: Any) -> None:
+        """Add the wrapper to a connection, once"""
+        # Outermost, since `execute_wrapper()` pops whatever wrapper is last on exit
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.insert(0, self)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush pending entries and stop the writer thread"""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+
+        self._queue.put(None)
+        worker.join(timeout)
+
+    # ---- Writer thread
+
+    def _enqueue(self, entry: dict[str, Any]) -> None:
+        # The log could not be opened; retrying on every slow query would not help
+        if self._failed:
+            self.dropped += 1
+            return
+
+        self._start()
+
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="slow-query-log", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                self.path, maxBytes=self.max_bytes, backupCount=self.backups, encoding="utf-8"
+            )
+        except OSError as exc:
+            self._failed = True
+            logger.warning("Slow query log disabled, cannot write to %s: %s", self.path, exc)
+            return
+
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        try:
+            while (entry := self._queue.get()) is not None:
+                raw = entry.pop("_raw")
+                entry["explain"] = self._explain(entry, raw) if raw else None
+                handler.emit(logging.makeLogRecord({"msg": json.dumps(entry, default=str)}))
+        finally:
+            handler.close()
+            for connection in connections.all(initialized_only=True):
+                connection.close()
+
+    @staticmethod
+    def _explain(entry: dict[str, Any], raw: tuple[str, Any]) -> Optional[Any]:
+        """Return the PostgreSQL plan of the statement, or None where unavailable"""
+        sql, params = raw
+
+        if entry["vendor"] != "postgresql" or not sql.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+
+        try:
+            with connections[entry["alias"]].cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+        except Exception as exc:
+            return {"error": str(exc)}
+
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+    @staticmethod
+    def _hash_params(params: Any) -> Optional[str]:
+        if params is None:
+            return None
+
+        return sha256(repr(params).encode()).hexdigest()[:16]
+
+
+# Shared by every connection in the process
+_SLOW_QUERY_LOG = SlowQueryLog()
+
+atexit.register(_SLOW_QUERY_LOG.close)
+
+
+def install_slow_query_log(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """Log slow queries on every new database connection."""
+    _SLOW_QUERY_LOG.install(connection)
+
+
+def _reset_after_fork() -> None:
+    """Drop the writer inherited from the parent; its thread does not exist here"""
+    _SLOW_QUERY_LOG._worker = None
+    _SLOW_QUERY_LOG._lock = threading.Lock()
+    _SLOW_QUERY_LOG._queue = queue.Queue(_QUEUE_SIZE)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+__all__ = ["SlowQueryLog", "install_slow_query_log"]
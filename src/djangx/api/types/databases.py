@@ -1,17 +1,39 @@
 from pathlib import Path
-from typing import NotRequired, TypedDict
+from typing import NotRequired, TypeAlias, TypedDict
+
+
+class DatabasePoolDict(TypedDict):
+    """Type definition for psycopg connection pool options."""
+
+    min_size: int
+    max_size: int
+    timeout: int
+    max_idle: int
+    max_lifetime: int
+    num_workers: int
 
 
 class DatabaseOptionsDict(TypedDict, total=False):
     """Type definition for database OPTIONS dictionary."""
 
     service: str
-    pool: bool
+    pool: bool | DatabasePoolDict
     sslmode: str
+    options: str
+    prepare_threshold: int | None
+    init_command: str
+    transaction_mode: str
+    timeout: int
+
+
+class DatabaseTestDict(TypedDict, total=False):
+    """Type definition for database TEST dictionary."""
+
+    MIRROR: str
 
 
 class DatabaseDict(TypedDict):
-    """Type definition for default database configuration."""
+    """Type definition for a database configuration."""
 
     ENGINE: str
     NAME: str | Path
@@ -19,13 +41,21 @@ class DatabaseDict(TypedDict):
     PASSWORD: NotRequired[str | None]
     HOST: NotRequired[str | None]
     PORT: NotRequired[str | None]
+    CONN_MAX_AGE: NotRequired[int | None]
+    CONN_HEALTH_CHECKS: NotRequired[bool]
+    DISABLE_SERVER_SIDE_CURSORS: NotRequired[bool]
     OPTIONS: NotRequired[DatabaseOptionsDict]
+    TEST: NotRequired[DatabaseTestDict]
 
 
-class DatabasesDict(TypedDict):
-    """Type definition for DATABASES setting."""
-
-    default: DatabaseDict
+# DATABASES setting: the "default" primary plus any "replica_<n>" aliases
+DatabasesDict: TypeAlias = dict[str, DatabaseDict]
 
 
-__all__ = ["DatabaseOptionsDict", "DatabaseDict", "DatabasesDict"]
+__all__ = [
+    "DatabasePoolDict",
+    "DatabaseOptionsDict",
+    "DatabaseTestDict",
+    "DatabaseDict",
+    "DatabasesDict",
+]
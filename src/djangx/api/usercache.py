@@ -0,0 +1,186 @@
+from functools import partial
+from secrets import token_hex
+from typing import Any, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.core import checks
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.http import HttpRequest
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from .settings import AUTH_USER_CACHE_ALIAS, AUTH_USER_CACHE_TTL
+
+_KEY_PREFIX = "djx:auth-user"
+
+
+def check_user_cache(**kwargs: Any) -> list[checks.CheckMessage]:
+    """
+    Warn when the user cache is private to each process.
+
+    With several worker processes, saving or deleting a user invalidates
+    only the cache of the process that handled it, so the others keep using
+    the stale user, e.g. after a password change, until the entry expires.
+    """
+    try:
+        cache = caches[AUTH_USER_CACHE_ALIAS]
+    except InvalidCacheBackendError:
+        return [
+            checks.Error(
+                f"AUTH_USER_CACHE_ALIAS names the cache {AUTH_USER_CACHE_ALIAS!r}, "
+                "which is not in CACHES.",
+                id="djangx.E001",
+            )
+        ]
+
+    if isinstance(cache, LocMemCache):
+        return [
+            checks.Warning(
+                f"AUTH_USER_CACHE_TTL is set but the {AUTH_USER_CACHE_ALIAS!r} cache is "
+                "local to each process, so other processes keep serving users that were "
+                "saved or deleted until their entries expire.",
+                hint="Point AUTH_USER_CACHE_ALIAS at a shared cache such as Redis or "
+                "Memcached, or set AUTH_USER_CACHE_TTL to 0.",
+                id="djangx.W001",
+            )
+        ]
+
+    return []
+
+
+def _session_key(session_key: str) -> str:
+    return f"{_KEY_PREFIX}:session:{session_key}"
+
+
+def _generation_key(user_id: str) -> str:
+    return f"{_KEY_PREFIX}:generation:{user_id}"
+
+
+def get_user(request: HttpRequest) -> Any:
+    """
+    Return the user of the request's session, from the cache while it is valid.
+
+    A cached user is only used while its session still names the same user
+    and backend and carries the user's current session auth hash, and while
+    the user has not been saved or deleted since it was cached. Otherwise
+    the user is resolved by Django, which also handles fallback secrets and
+    flushes invalid sessions, and cached again.
+    """
+    session = request.session
+
+    try:
+        user_id = str(session[SESSION_KEY])
+        backend_path = session[BACKEND_SESSION_KEY]
+    except KeyError:
+        # Anonymous sessions resolve without a query
+        return auth.get_user(request)
+
+    cache = caches[AUTH_USER_CACHE_ALIAS]
+    generation_key = _generation_key(user_id)
+
+    if session.session_key is None:
+        generation = cache.get(generation_key)
+    else:
+        session_key = _session_key(session.session_key)
+        values = cache.get_many([session_key, generation_key])
+        generation = values.get(generation_key)
+        entry = values.get(session_key)
+
+        if entry is not None and _is_valid(entry, request, generation):
+            return entry[2]
+
+    user = auth.get_user(request)
+
+    # The session key may have been cycled or flushed while resolving the user
+    if user.is_authenticated and session.session_key is not None:
+        cache.set(
+            _session_key(session.session_key),
+            (generation, backend_path, user),
+            AUTH_USER_CACHE_TTL,
+        )
+
+    return user
+
+
+def _is_valid(entry: tuple[Any, str, Any], request: HttpRequest, generation: Any) -> bool:
+    """Whether a cached user may stand in for resolving the session's user"""
+    cached_generation, backend_path, user = entry
+    session = request.session
+
+    if cached_generation != generation or backend_path != session[BACKEND_SESSION_KEY]:
+        return False
+
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return False
+
+    if user._meta.pk.value_to_string(user) != str(session[SESSION_KEY]):
+        return False
+
+    session_hash = session.get(HASH_SESSION_KEY)
+    return bool(session_hash) and constant_time_compare(session_hash, user.get_session_auth_hash())
+
+
+def _get_cached_user(request: HttpRequest) -> Any:
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = get_user(request)
+    return request._cached_user
+
+
+async def _aget_cached_user(request: HttpRequest) -> Any:
+    if not hasattr(request, "_acached_user"):
+        request._acached_user = await sync_to_async(get_user)(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    AuthenticationMiddleware that caches the user of each session.
+
+    Authenticated requests resolve `request.user` with one cache round trip
+    instead of a query on the user table, for up to AUTH_USER_CACHE_TTL
+    seconds. Saving or deleting a user, which includes changing its password,
+    invalidates every cached session of that user, and logging out drops the
+    session's entry. Bulk `update()` calls bypass these signals and are only
+    picked up when the entries expire.
+    """
+
+    def process_request(self, request: HttpRequest) -> None:
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: _get_cached_user(request))
+        request.auser = partial(_aget_cached_user, request)
+
+
+def invalidate_cached_user(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate every cached session of a user once its save or delete commits."""
+    user_id = instance._meta.pk.value_to_string(instance)
+
+    def invalidate() -> None:
+        # Outlives every entry cached before it, so none of them can match again
+        caches[AUTH_USER_CACHE_ALIAS].set(
+            _generation_key(user_id), token_hex(8), AUTH_USER_CACHE_TTL
+        )
+
+    transaction.on_commit(invalidate, using=kwargs.get("using"))
+
+
+def forget_cached_session(sender: Any, request: Optional[HttpRequest], **kwargs: Any) -> None:
+    """Drop the cached user of a session that logs out."""
+    session = getattr(request, "session", None)
+
+    if session is not None and session.session_key is not None:
+        caches[AUTH_USER_CACHE_ALIAS].delete(_session_key(session.session_key))
+
+
+__all__ = [
+    "CachedAuthenticationMiddleware",
+    "check_user_cache",
+    "forget_cached_session",
+    "get_user",
+    "invalidate_cached_user",
+]
@@ -0,0 +1,196 @@
+"""
+Management command for offline performance benchmarks.
+
+This module provides a clean, OOP-based interface for:
+- Benchmarking the Vercel Blob storage backend against a local stand-in
+  server with injected latency, so storage optimizations can be verified
+  without a token or network access
+- Comparing per-call HTTP latency of fresh connections with the pooled
+  client, counting TCP connects and TLS handshakes
+- Measuring database requests per second with each connection lifetime
+  and health check setting
+- Stressing the database connection pool with bursts of concurrent
+  requests and reporting queue wait times
+- Checking a concurrent workload against PgBouncer in transaction
+  pooling mode
+- Checking read-replica routing against a local primary and two replicas
+- Comparing concurrent SQLite read/write throughput without options and
+  with the configured tuning profile
+- Timing login lookups by username and email among a million synthetic
+  users, without and with the functional indexes
+- Counting the queries of authenticated requests with and without the
+  per-session user cache
+- Reporting latency percentiles, operation rates and throughput
+"""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ..helpers.bench.clients import HttpBenchmark
+from ..helpers.bench.database import DatabaseBenchmark
+from ..helpers.bench.login import LoginBenchmark
+from ..helpers.bench.pgbouncer import PgBouncerBenchmark
+from ..helpers.bench.pool import PoolBenchmark
+from ..helpers.bench.report import MIB
+from ..helpers.bench.routing import RoutingBenchmark
+from ..helpers.bench.session import SessionBenchmark
+from ..helpers.bench.sqlite import SqliteBenchmark
+from ..helpers.bench.storage import StorageBenchmark
+
+
+class Command(BaseCommand):
+    """Django management command for offline performance benchmarks."""
+
+    help = "Offline performance benchmarks."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "target",
+            choices=[
+                "storage",
+                "http",
+                "db",
+                "pool",
+                "pgbouncer",
+                "routing",
+                "sqlite",
+                "login",
+                "session",
+            ],
+            help="Benchmark to run: storage, http, db, pool, pgbouncer, routing, sqlite, "
+            "login or session",
+        )
+        parser.add_argument(
+            "--url",
+            default=None,
+            help="URL for the http benchmark; defaults to the local stand-in server.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=20,
+            help="Requests per client, scenario or thread in the http, db, pool, pgbouncer, "
+            "sqlite and session benchmarks, or in total for routing and login (default: 20).",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias for the db, pool and pgbouncer benchmarks (default: default).",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=1_000_000,
+            help="Synthetic users created for the login benchmark (default: 1000000).",
+        )
+        parser.add_argument(
+            "--files",
+            type=int,
+            default=50,
+            help="Number of files per phase (default: 50).",
+        )
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=256 * 1024,
+            help="Size of each file in bytes (default: 256 KiB).",
+        )
+        parser.add_argument(
+            "--large-size",
+            dest="large_size",
+            type=int,
+            default=64 * MIB,
+            help="Size of the large file in bytes for the memory phase (default: 64 MiB).",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.02,
+            help="Latency in seconds injected into every stand-in request (default: 0.02).",
+        )
+        parser.add_argument(
+            "--jitter",
+            type=float,
+            default=0.0,
+            help="Maximum random latency in seconds added on top (default: 0).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="Concurrent uploads in the async phase, or threads in the pool, "
+            "pgbouncer, routing and sqlite benchmarks (default: 16).",
+        )
+        parser.add_argument(
+            "--hold",
+            type=float,
+            default=0.01,
+            help="Seconds each connection or replica is held in the pool and routing "
+            "benchmarks (default: 0.01).",
+        )
+        parser.add_argument(
+            "--no-verbose",
+            dest="no_verbose",
+            action="store_true",
+            help="Suppress output messages.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command handler."""
+        verbose = not options.get("no_verbose", False)
+
+        if options["target"] == "session":
+            SessionBenchmark(self.stdout.write, self.style, verbose).run(
+                requests=options["requests"],
+            )
+        elif options["target"] == "login":
+            LoginBenchmark(self.stdout.write, self.style, verbose).run(
+                users=options["users"],
+                requests=options["requests"],
+            )
+        elif options["target"] == "http":
+            HttpBenchmark(self.stdout.write, self.style, verbose).run(
+                url=options["url"],
+                requests=options["requests"],
+                latency=options["latency"],
+            )
+        elif options["target"] == "sqlite":
+            SqliteBenchmark(self.stdout.write, self.style, verbose).run(
+                requests=options["requests"],
+                concurrency=options["concurrency"],
+            )
+        elif options["target"] == "routing":
+            RoutingBenchmark(self.stdout.write, self.style, verbose).run(
+                requests=options["requests"],
+                concurrency=options["concurrency"],
+                hold=options["hold"],
+            )
+        elif options["target"] == "pgbouncer":
+            PgBouncerBenchmark(self.stdout.write, self.style, verbose).run(
+                requests=options["requests"],
+                concurrency=options["concurrency"],
+                alias=options["database"],
+            )
+        elif options["target"] == "pool":
+            PoolBenchmark(self.stdout.write, self.style, verbose).run(
+                requests=options["requests"],
+                concurrency=options["concurrency"],
+                hold=options["hold"],
+                alias=options["database"],
+            )
+        elif options["target"] == "db":
+            DatabaseBenchmark(self.stdout.write, self.style, verbose).run(
+                requests=options["requests"],
+                alias=options["database"],
+            )
+        else:
+            StorageBenchmark(self.stdout.write, self.style, verbose).run(
+                files=options["files"],
+                size=options["size"],
+                large_size=options["large_size"],
+                latency=options["latency"],
+                jitter=options["jitter"],
+                concurrency=options["concurrency"],
+            )
@@ -0,0 +1,417 @@
+"""
+Management command for self-hosted web fonts.
+
+This module provides a clean, OOP-based interface for:
+- Resolving the configured font families from a local font directory or cache
+- Fetching missing font files from Google Fonts into the cache at build time
+- Subsetting fonts to the configured unicode ranges and writing woff2 files
+- Writing an @font-face stylesheet for the self-hosted fonts
+- Cleaning generated font files
+"""
+
+import re
+from dataclasses import dataclass
+from os.path import relpath
+from pathlib import Path
+from shutil import copyfileobj
+from typing import Any, Callable
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote_plus
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.management.color import Style
+
+from .... import PKG_NAME
+from ....ui.settings import FONTS
+
+
+@dataclass(frozen=True)
+class FontFace:
+    """A single family/weight/style combination to self-host.
+
+    Attributes:
+        family: The font family name (e.g., 'Roboto').
+        weight: The numeric font weight (e.g., 400).
+        style: The font style, either 'normal' or 'italic'.
+    """
+
+    family: str
+    weight: int
+    style: str
+
+    @property
+    def slug(self) -> str:
+        """Return the file name stem used for source, cache and output files."""
+        family_slug = re.sub(r"[^a-z0-9]+", "-", self.family.lower()).strip("-")
+        return f"{family_slug}-{self.weight}-{self.style}"
+
+
+class FontSpecParser:
+    """Parses font family declarations from the fonts configuration.
+
+    Each declaration has the form ``Family:weights`` where weights are separated
+    by semicolons and an ``i`` suffix marks italics, e.g. ``Roboto:400;700;400i``.
+    A declaration without weights defaults to the regular 400 weight.
+    """
+
+    WEIGHT_PATTERN = re.compile(r"^(?P<weight>[1-9]00)(?P<italic>i|italic)?$")
+
+    def parse(self, declarations: list[str]) -> list[FontFace]:
+        """Parse all declarations into a de-duplicated list of font faces."""
+        faces: list[FontFace] = []
+
+        for declaration in declarations:
+            family, _, weights = declaration.partition(":")
+            family = family.strip()
+
+            if not family:
+                raise CommandError(f"Invalid font declaration: '{declaration}'")
+
+            for weight_spec in (weights or "400").split(";"):
+                faces.append(self._parse_weight(family, weight_spec.strip(), declaration))
+
+        return list(dict.fromkeys(faces))
+
+    def _parse_weight(self, family: str, weight_spec: str, declaration: str) -> FontFace:
+        """Parse a single weight specification for a family."""
+        match = self.WEIGHT_PATTERN.match(weight_spec.lower())
+
+        if not match:
+            raise CommandError(
+                f"Invalid font weight '{weight_spec}' in declaration '{declaration}'. "
+                f"Use values like '400' or '700i'."
+            )
+
+        style = "italic" if match.group("italic") else "normal"
+        return FontFace(family=family, weight=int(match.group("weight")), style=style)
+
+
+class UnicodeRangeParser:
+    """Parses CSS unicode-range values (e.g., 'U+0000-00FF') into codepoints."""
+
+    RANGE_PATTERN = re.compile(r"^U\+(?P<start>[0-9A-F?]{1,6})(?:-(?P<end>[0-9A-F]{1,6}))?$")
+
+    def parse(self, ranges: list[str]) -> set[int]:
+        """Parse all ranges into a set of unicode codepoints."""
+        codepoints: set[int] = set()
+
+        for value in ranges:
+            match = self.RANGE_PATTERN.match(value.strip().upper())
+
+            if not match:
+                raise CommandError(f"Invalid unicode range: '{value}'")
+
+            start = match.group("start")
+            end = match.group("end")
+
+            if "?" in start:
+                # Wildcard ranges such as U+4?? cover every digit in place of '?'
+                codepoints.update(
+                    range(int(start.replace("?", "0"), 16), int(start.replace("?", "F"), 16) + 1)
+                )
+            else:
+                codepoints.update(range(int(start, 16), int(end or start, 16) + 1))
+
+        return codepoints
+
+
+class FontResolver:
+    """Resolves font source files from the local font directory, the cache or Google Fonts."""
+
+    SOURCE_SUFFIXES = (".ttf", ".otf", ".woff2", ".woff")
+    GOOGLE_FONTS_CSS_URL = "https://fonts.googleapis.com/css2"
+    # Seconds to wait for Google Fonts to connect or send data before giving up
+    TIMEOUT = 30
+
+    def __init__(self, stdout_writer: Callable[[str], None], offline: bool, verbose: bool = True):
+        self.write = stdout_writer
+        self.offline = offline
+        self.verbose = verbose
+
+    def resolve(self, faces: list[FontFace]) -> dict[FontFace, Path]:
+        """Resolve a source file for every face, fetching missing ones into the cache."""
+        resolved: dict[FontFace, Path] = {}
+        missing: list[FontFace] = []
+
+        for face in faces:
+            source = self._find_local(face)
+            if source is None:
+                missing.append(face)
+            else:
+                resolved[face] = source
+
+        if missing:
+            if self.offline:
+                raise CommandError(
+                    "Font files not found for: "
+                    + ", ".join(face.slug for face in missing)
+                    + f". Place them in '{FONTS.source_dir}' or run without --offline."
+                )
+            resolved.update(self._fetch(missing))
+
+        return resolved
+
+    def _find_local(self, face: FontFace) -> Path | None:
+        """Look for a face in the source directory first, then in the cache."""
+        for directory in (FONTS.source_dir, FONTS.cache_dir):
+            for suffix in self.SOURCE_SUFFIXES:
+                candidate = directory / f"{face.slug}{suffix}"
+                if candidate.is_file():
+                    return candidate
+        return None
+
+    def _fetch(self, faces: list[FontFace]) -> dict[FontFace, Path]:
+        """Download the given faces from Google Fonts into the cache directory."""
+        cache_dir: Path = FONTS.cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        fetched: dict[FontFace, Path] = {}
+        faces_by_family: dict[str, list[FontFace]] = {}
+        for face in faces:
+            faces_by_family.setdefault(face.family, []).append(face)
+
+        for family, family_faces in faces_by_family.items():
+            urls = self._get_font_urls(family, family_faces)
+
+            for face in family_faces:
+                url = urls.get((face.weight, face.style))
+                if url is None:
+                    raise CommandError(f"Google Fonts does not provide {face.slug}")
+
+                destination = cache_dir / f"{face.slug}.ttf"
+                self._download(url, destination)
+                fetched[face] = destination
+
+        return fetched
+
+    def _get_font_urls(self, family: str, faces: list[FontFace]) -> dict[tuple[int, str], str]:
+        """Query the Google Fonts CSS API for the font file URLs of a family."""
+        axes = sorted({(int(face.style == "italic"), face.weight) for face in faces})
+        tuples = ";".join(f"{italic},{weight}" for italic, weight in axes)
+        url = f"{self.GOOGLE_FONTS_CSS_URL}?family={quote_plus(family)}:ital,wght@{tuples}"
+
+        if self.verbose:
+            self.write(f"Fetching font metadata: {url}")
+
+        try:
+            # The default urllib user agent makes Google Fonts serve plain TrueType files
+            with urlopen(Request(url), timeout=self.TIMEOUT) as response:
+                css: str = response.read().decode("utf-8")
+        except HTTPError as e:
+            raise CommandError(
+                f"Failed to fetch fonts for '{family}'. HTTP Error {e.code}: {e.reason}"
+            )
+        except URLError as e:
+            raise CommandError(f"Failed to fetch fonts for '{family}': {e.reason}")
+        except TimeoutError:
+            raise CommandError(f"Timed out fetching fonts for '{family}'.")
+
+        urls: dict[tuple[int, str], str] = {}
+        for block in re.findall(r"@font-face\s*{([^}]*)}", css):
+            style = re.search(r"font-style:\s*(\w+)", block)
+            weight = re.search(r"font-weight:\s*(\d+)", block)
+            src = re.search(r"src:\s*url\(([^)]+)\)", block)
+            if style and weight and src:
+                urls[(int(weight.group(1)), style.group(1))] = src.group(1).strip("'\"")
+
+        return urls
+
+    def _download(self, url: str, destination: Path) -> None:
+        """Download a single font file."""
+        temp_destination = destination.with_suffix(destination.suffix + ".tmp")
+
+        try:
+            if self.verbose:
+                self.write(f"Downloading {destination.name}")
+            with urlopen(url, timeout=self.TIMEOUT) as response, temp_destination.open("wb") as f:
+                copyfileobj(response, f)
+            temp_destination.rename(destination)
+        except (HTTPError, URLError, TimeoutError) as e:
+            if temp_destination.exists():
+                temp_destination.unlink()
+            raise CommandError(f"Failed to download font from {url}: {e}")
+
+
+class FontSubsetter:
+    """Subsets fonts to a set of codepoints and writes them as woff2."""
+
+    def __init__(self) -> None:
+        try:
+            import brotli  # type: ignore[reportMissingImports]  # noqa: F401
+            from fontTools import subset  # type: ignore[reportMissingImports]
+        except ImportError:
+            raise CommandError(
+                "Subsetting fonts requires 'fonttools' and 'brotli'. "
+                "Install them with: uv add fonttools brotli"
+            )
+
+        self._subset = subset
+
+    def subset(self, source: Path, destination: Path, codepoints: set[int]) -> None:
+        """Subset a single font file and save it as woff2."""
+        options = self._subset.Options()
+        options.flavor = "woff2"
+        options.layout_features = ["*"]
+
+        try:
+            font = self._subset.load_font(str(source), options)
+            subsetter = self._subset.Subsetter(options)
+            subsetter.populate(unicodes=codepoints)
+            subsetter.subset(font)
+            self._subset.save_font(font, str(destination), options)
+        except Exception as e:
+            raise CommandError(f"Failed to subset font '{source}': {e}")
+
+
+class BuildHandler:
+    """Handles building the self-hosted font files and stylesheet."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+
+    def build(self, offline: bool = False) -> None:
+        """Resolve, subset and write all configured fonts and their stylesheet."""
+        faces = FontSpecParser().parse(FONTS.families)
+
+        if not faces:
+            raise CommandError(
+                f"No font families configured. Define them under [tool.{PKG_NAME}.fonts] "
+                f"'families' in pyproject.toml or with FONTS_FAMILIES."
+            )
+
+        codepoints = UnicodeRangeParser().parse(FONTS.unicode_ranges)
+        subsetter = FontSubsetter()
+        sources = FontResolver(self.write, offline, self.verbose).resolve(faces)
+
+        output_dir: Path = FONTS.output_dir
+        output_css: Path = FONTS.output_css
+        self._ensure_directory(output_dir)
+        self._ensure_directory(output_css.parent)
+
+        for face in faces:
+            destination = output_dir / f"{face.slug}.woff2"
+            subsetter.subset(sources[face], destination, codepoints)
+
+            if self.verbose:
+                source_size = sources[face].stat().st_size
+                self.write(
+                    f"  {face.slug}: {source_size / 1024:.1f} KB → "
+                    f"{destination.stat().st_size / 1024:.1f} KB"
+                )
+
+        output_css.write_text(self._build_stylesheet(faces, output_css, output_dir))
+
+        if self.verbose:
+            self.write(self.style.SUCCESS(f"✓ {len(faces)} font file(s) written to {output_dir}"))
+
+    def _ensure_directory(self, directory: Path) -> None:
+        """Ensure an output directory exists."""
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except PermissionError:
+            raise CommandError(
+                f"Permission denied: Cannot create directory at {directory}. "
+                f"Ensure the path is writable."
+            )
+
+    @staticmethod
+    def _build_stylesheet(faces: list[FontFace], output_css: Path, output_dir: Path) -> str:
+        """Build the @font-face stylesheet referencing the woff2 files relatively."""
+        fonts_url = Path(relpath(output_dir, output_css.parent)).as_posix()
+        unicode_range = ",".join(value.strip().upper() for value in FONTS.unicode_ranges)
+
+        return "".join(
+            "@font-face{"
+            f'font-family:"{face.family}";'
+            f"font-style:{face.style};"
+            f"font-weight:{face.weight};"
+            f"font-display:{FONTS.display};"
+            f'src:url("{fonts_url}/{face.slug}.woff2") format("woff2");'
+            f"unicode-range:{unicode_range}"
+            "}\n"
+            for face in faces
+        )
+
+
+class CleanHandler:
+    """Handles cleaning of generated font files."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+
+    def clean(self) -> None:
+        """Delete the generated woff2 files and stylesheet."""
+        output_dir: Path = FONTS.output_dir
+        targets: list[Path] = [FONTS.output_css]
+
+        if output_dir.exists():
+            targets.extend(output_dir.glob("*.woff2"))
+
+        for target in targets:
+            if target.exists():
+                self._delete_file(target)
+
+        if self.verbose:
+            self.write(self.style.SUCCESS("✓ Generated font files removed"))
+
+    def _delete_file(self, path: Path) -> None:
+        """Delete a generated file."""
+        try:
+            path.unlink()
+        except PermissionError:
+            raise CommandError(
+                f"Permission denied: Cannot delete file at {path}. "
+                f"Ensure the file is not in use and the path is writable."
+            )
+
+
+class Command(BaseCommand):
+    """Django management command for self-hosted font operations."""
+
+    help = "Self-hosted fonts management: build and clean operations."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "command",
+            choices=["build", "clean"],
+            help="Command to execute: build or clean",
+        )
+        parser.add_argument(
+            "--offline",
+            dest="offline",
+            action="store_true",
+            help="Only use the local font directory and cache; never download.",
+        )
+        parser.add_argument(
+            "--no-verbose",
+            dest="no_verbose",
+            action="store_true",
+            help="Suppress output messages.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command handler."""
+        verbose = not options.get("no_verbose", False)
+
+        if options["command"] == "build":
+            BuildHandler(self.stdout.write, self.style, verbose).build(
+                offline=options.get("offline", False)
+            )
+        else:
+            CleanHandler(self.stdout.write, self.style, verbose).clean()
@@ -0,0 +1,480 @@
+"""
+Management command for static image optimization.
+
+This module provides a clean, OOP-based interface for:
+- Generating modern format (AVIF, WebP) and downscaled variants of every
+  raster image in the collected static tree
+- Spreading the encoding work across CPU cores
+- Caching encoded variants by content hash so unchanged images are never re-encoded
+- Writing a manifest of the variants that template tags can query
+- Registering content-hashed copies of the variants with ManifestStaticFilesStorage
+- Cleaning generated variants
+"""
+
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from hashlib import sha256
+from os import cpu_count
+from pathlib import Path
+from shutil import copy2
+from time import perf_counter
+from typing import Any, Callable, cast
+
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.management.color import Style
+
+from ....api.settings import STATIC_ROOT
+from ....ui.settings import IMAGES
+from ....ui.types import ImageEntryDict, ImageManifestDict, ImageOptionsDict, ImageVariantDict
+
+MANIFEST_VERSION = 1
+
+RASTER_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+VARIANT_STEM_PATTERN = re.compile(r"\.\d+w$")
+
+SAVE_OPTIONS: dict[str, dict[str, Any]] = {
+    "avif": {"format": "AVIF"},
+    "webp": {"format": "WEBP", "method": 6},
+    "png": {"format": "PNG", "optimize": True},
+    "jpeg": {"format": "JPEG", "optimize": True, "progressive": True},
+}
+
+
+@dataclass(frozen=True)
+class ImageJob:
+    """Everything a worker process needs to optimize a single image.
+
+    Attributes:
+        source: Absolute path of the image in the static tree.
+        name: Path of the image relative to the static root.
+        digest: SHA-256 hex digest of the image content.
+        widths: Candidate widths to downscale to.
+        formats: Output formats to encode each width in.
+        quality: Encoder quality for lossy formats.
+        cache_dir: Directory holding previously encoded variants.
+        force: Encode every variant again instead of restoring it from the cache.
+    """
+
+    source: Path
+    name: str
+    digest: str
+    widths: tuple[int, ...]
+    formats: tuple[str, ...]
+    quality: int
+    cache_dir: Path
+    force: bool = False
+
+
+@dataclass
+class ImageResult:
+    """Result of optimizing a single image.
+
+    Attributes:
+        name: Path of the image relative to the static root.
+        entry: Manifest entry describing the generated variants.
+        encoded: Number of variants that had to be encoded.
+        cached: Number of variants restored from the cache.
+        source_bytes: Size of the source image.
+        smallest_bytes: Size of the smallest full-width variant.
+    """
+
+    name: str
+    entry: ImageEntryDict
+    encoded: int
+    cached: int
+    source_bytes: int
+    smallest_bytes: int
+
+
+def _optimize_image(job: ImageJob) -> ImageResult:
+    """Generate all variants of a single image.
+
+    Runs in a worker process, so it only depends on its arguments.
+    """
+    from PIL import Image, ImageOps  # type: ignore[reportMissingImports]
+
+    with Image.open(job.source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        width, height = image.size
+        source_format = "jpeg" if job.source.suffix.lower() in (".jpg", ".jpeg") else "png"
+
+        target_widths = sorted({w for w in job.widths if w < width} | {width})
+        variants: dict[str, list[ImageVariantDict]] = {}
+        encoded = cached = 0
+        smallest_bytes = job.source.stat().st_size
+
+        for fmt in (*job.formats, source_format):
+            suffix = "jpg" if fmt == "jpeg" else fmt
+
+            for target_width in target_widths:
+                target_height = max(1, round(height * target_width / width))
+                variant_path = job.source.with_name(f"{job.source.stem}.{target_width}w.{suffix}")
+                cache_path = job.cache_dir / f"{job.digest}-{target_width}-q{job.quality}.{suffix}"
+
+                if not job.force and cache_path.exists():
+                    cached += 1
+                else:
+                    resized = image
+                    if target_width != width:
+                        resized = image.resize(
+                            (target_width, target_height), Image.Resampling.LANCZOS
+                        )
+                    if fmt == "jpeg" and resized.mode not in ("RGB", "L"):
+                        resized = resized.convert("RGB")
+
+                    temp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+                    resized.save(temp_path, quality=job.quality, **SAVE_OPTIONS[fmt])
+                    temp_path.replace(cache_path)
+                    encoded += 1
+
+                copy2(cache_path, variant_path)
+
+                if target_width == width:
+                    smallest_bytes = min(smallest_bytes, variant_path.stat().st_size)
+
+                variants.setdefault(fmt, []).append(
+                    {
+                        "path": Path(job.name).with_name(variant_path.name).as_posix(),
+                        "width": target_width,
+                        "height": target_height,
+                    }
+                )
+
+    return ImageResult(
+        name=job.name,
+        entry={"hash": job.digest, "width": width, "height": height, "variants": variants},
+        encoded=encoded,
+        cached=cached,
+        source_bytes=job.source.stat().st_size,
+        smallest_bytes=smallest_bytes,
+    )
+
+
+def _hashed_names() -> set[str]:
+    """Return the content-hashed copies collectstatic wrote, which are not sources."""
+    if isinstance(staticfiles_storage, ManifestFilesMixin):
+        return set(staticfiles_storage.hashed_files.values())
+
+    return set()
+
+
+def _register_variants(names: list[str]) -> None:
+    """
+    Give every variant a content-hashed copy and a staticfiles manifest entry.
+
+    'images build' runs after 'collectstatic', so with ManifestStaticFilesStorage
+    the variants would otherwise be missing from the manifest and `static()`
+    would raise for each of them.
+    """
+    if not names or not isinstance(staticfiles_storage, ManifestFilesMixin):
+        return
+
+    for name in names:
+        hashed_name = staticfiles_storage.hashed_name(name)
+        if not staticfiles_storage.exists(hashed_name):
+            copy2(staticfiles_storage.path(name), staticfiles_storage.path(hashed_name))
+
+        key = staticfiles_storage.hash_key(staticfiles_storage.clean_name(name))
+        staticfiles_storage.hashed_files[key] = hashed_name
+
+    staticfiles_storage.save_manifest()
+
+
+def _unregister_variants(names: list[str]) -> None:
+    """Drop the content-hashed copies and manifest entries of removed variants."""
+    if not names or not isinstance(staticfiles_storage, ManifestFilesMixin):
+        return
+
+    for name in names:
+        key = staticfiles_storage.hash_key(staticfiles_storage.clean_name(name))
+        hashed_name = staticfiles_storage.hashed_files.pop(key, None)
+        if hashed_name is not None and staticfiles_storage.exists(hashed_name):
+            staticfiles_storage.delete(hashed_name)
+
+    staticfiles_storage.save_manifest()
+
+
+def _variant_names(manifest: ImageManifestDict) -> list[str]:
+    """Return the static paths of every variant in the manifest."""
+    return [
+        variant["path"]
+        for entry in manifest["images"].values()
+        for variants in entry["variants"].values()
+        for variant in variants
+    ]
+
+
+class ManifestStore:
+    """Reads and writes the image variant manifest."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self, options: ImageOptionsDict | None = None) -> ImageManifestDict:
+        """Load the manifest.
+
+        Returns an empty manifest if it is missing, outdated, or was generated
+        with different options than the given ones.
+        """
+        empty: ImageManifestDict = {
+            "version": MANIFEST_VERSION,
+            "options": options or {"widths": [], "formats": [], "quality": 0},
+            "images": {},
+        }
+
+        try:
+            manifest = cast(ImageManifestDict, json.loads(self.path.read_text()))
+        except (OSError, ValueError):
+            return empty
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            return empty
+
+        if options is not None and manifest.get("options") != options:
+            return empty
+
+        return manifest
+
+    def save(self, manifest: ImageManifestDict) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        temp_path.replace(self.path)
+
+
+class BuildHandler:
+    """Handles generating image variants for the static tree."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+
+    def build(self, force: bool = False) -> None:
+        """Optimize every raster image in the static root and write the manifest."""
+        options: ImageOptionsDict = {
+            "widths": list(self._get_widths()),
+            "formats": list(self._get_formats()),
+            "quality": IMAGES.quality,
+        }
+        static_root: Path = STATIC_ROOT
+
+        if not static_root.is_dir():
+            raise CommandError(
+                f"Static root not found at {static_root}. Run 'collectstatic' before 'images'."
+            )
+
+        store = ManifestStore(IMAGES.manifest)
+        previous = store.load(options)
+        cache_dir: Path = IMAGES.cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        started = perf_counter()
+        manifest: ImageManifestDict = {"version": MANIFEST_VERSION, "options": options, "images": {}}
+        jobs: list[ImageJob] = []
+        unchanged = 0
+
+        for source in self._scan(static_root, _hashed_names()):
+            name = source.relative_to(static_root).as_posix()
+            digest = sha256(source.read_bytes()).hexdigest()
+            entry = previous["images"].get(name)
+
+            if not force and entry is not None and self._is_current(entry, digest, static_root):
+                manifest["images"][name] = entry
+                unchanged += 1
+                continue
+
+            jobs.append(
+                ImageJob(
+                    source=source,
+                    name=name,
+                    digest=digest,
+                    widths=tuple(options["widths"]),
+                    formats=tuple(options["formats"]),
+                    quality=IMAGES.quality,
+                    cache_dir=cache_dir,
+                    force=force,
+                )
+            )
+
+        results = self._run(jobs)
+        for result in results:
+            manifest["images"][result.name] = result.entry
+
+        _register_variants(_variant_names(manifest))
+        store.save(manifest)
+        self._print_report(results, unchanged, perf_counter() - started)
+
+    def _get_formats(self) -> tuple[str, ...]:
+        """Validate the configured formats against what Pillow can encode."""
+        try:
+            from PIL import features  # type: ignore[reportMissingImports]
+        except ImportError:
+            raise CommandError("Image optimization requires Pillow. Install it with: uv add pillow")
+
+        formats: list[str] = []
+        for fmt in (f.lower() for f in IMAGES.formats):
+            if fmt not in ("avif", "webp"):
+                raise CommandError(f"Unsupported image format: '{fmt}'. Use 'avif' or 'webp'.")
+            if not features.check(fmt):
+                if self.verbose:
+                    self.write(self.style.WARNING(f"Pillow cannot encode {fmt}; skipping it."))
+                continue
+            formats.append(fmt)
+
+        return tuple(formats)
+
+    @staticmethod
+    def _get_widths() -> tuple[int, ...]:
+        """Parse the configured widths."""
+        try:
+            return tuple(sorted({int(w) for w in IMAGES.widths if int(w) > 0}))
+        except ValueError:
+            raise CommandError(f"Invalid image widths: {IMAGES.widths}")
+
+    @staticmethod
+    def _scan(static_root: Path, hashed: set[str]) -> list[Path]:
+        """Find source raster images, skipping generated variants and hashed copies."""
+        return sorted(
+            path
+            for path in static_root.rglob("*")
+            if path.suffix.lower() in RASTER_SUFFIXES
+            and path.is_file()
+            and not VARIANT_STEM_PATTERN.search(path.stem)
+            and path.relative_to(static_root).as_posix() not in hashed
+        )
+
+    @staticmethod
+    def _is_current(entry: ImageEntryDict, digest: str, static_root: Path) -> bool:
+        """Check that a manifest entry matches the image and its variants still exist."""
+        return entry["hash"] == digest and all(
+            (static_root / variant["path"]).exists()
+            for variants in entry["variants"].values()
+            for variant in variants
+        )
+
+    def _run(self, jobs: list[ImageJob]) -> list[ImageResult]:
+        """Optimize images in parallel across CPU cores."""
+        if not jobs:
+            return []
+
+        workers = IMAGES.workers or cpu_count() or 1
+        results: list[ImageResult] = []
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            futures = {executor.submit(_optimize_image, job): job for job in jobs}
+
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    raise CommandError(f"Failed to optimize '{job.name}': {e}")
+
+                results.append(result)
+                if self.verbose:
+                    self.write(
+                        f"  {result.name}: {result.source_bytes / 1024:.1f} KB → "
+                        f"{result.smallest_bytes / 1024:.1f} KB "
+                        f"({result.encoded} encoded, {result.cached} cached)"
+                    )
+
+        return results
+
+    def _print_report(self, results: list[ImageResult], unchanged: int, elapsed: float) -> None:
+        """Print a summary of the optimization run."""
+        if not self.verbose:
+            return
+
+        encoded = sum(r.encoded for r in results)
+        cached = sum(r.cached for r in results)
+        self.write(
+            self.style.SUCCESS(
+                f"✓ {len(results)} image(s) optimized, {unchanged} unchanged "
+                f"({encoded} variant(s) encoded, {cached} from cache) in {elapsed:.2f}s"
+            )
+        )
+        self.write(f"  Manifest: {IMAGES.manifest}")
+
+
+class CleanHandler:
+    """Handles cleaning of generated image variants."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+
+    def clean(self) -> None:
+        """Delete every variant listed in the manifest and the manifest itself."""
+        store = ManifestStore(IMAGES.manifest)
+        static_root: Path = STATIC_ROOT
+        names = _variant_names(store.load())
+        removed = 0
+
+        _unregister_variants(names)
+
+        for name in names:
+            path = static_root / name
+            if path.exists():
+                path.unlink()
+                removed += 1
+
+        if store.path.exists():
+            store.path.unlink()
+
+        if self.verbose:
+            self.write(self.style.SUCCESS(f"✓ {removed} image variant(s) removed"))
+
+
+class Command(BaseCommand):
+    """Django management command for static image optimization."""
+
+    help = "Static image optimization: build and clean operations."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "command",
+            choices=["build", "clean"],
+            help="Command to execute: build or clean",
+        )
+        parser.add_argument(
+            "-y",
+            "--force",
+            dest="force",
+            action="store_true",
+            help="Regenerate variants even for unchanged images.",
+        )
+        parser.add_argument(
+            "--no-verbose",
+            dest="no_verbose",
+            action="store_true",
+            help="Suppress output messages.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command handler."""
+        verbose = not options.get("no_verbose", False)
+
+        if options["command"] == "build":
+            BuildHandler(self.stdout.write, self.style, verbose).build(
+                force=options.get("force", False)
+            )
+        else:
+            CleanHandler(self.stdout.write, self.style, verbose).clean()
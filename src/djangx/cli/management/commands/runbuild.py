@@ -3,6 +3,7 @@
 Executes build commands.
 Supports dry-run mode for previewing commands before execution
 and continues running remaining commands even if one fails.
+Skips makemigrations and migrate when the migration fingerprint is unchanged.
 """
 
 from typing import Any
@@ -11,12 +12,93 @@ from django.core.management.base import BaseCommand, CommandParser
 
 from ...settings import RUNCOMMANDS
 from ..helpers.art import ArtType
-from ..helpers.run import CommandGenerator, CommandOutput, Output
+from ..helpers.fingerprint import MigrationFingerprint
+from ..helpers.run import (
+    CommandExecutor,
+    CommandGenerator,
+    CommandOutput,
+    CommandResult,
+    Output,
+)
+
+
+class BuildCommandExecutor(CommandExecutor):
+    """Executor for build commands.
+
+    Skips the migration commands while migration files, model definitions
+    and applied migrations all match the fingerprint of the last build whose
+    migration commands succeeded, and stores a new fingerprint once they do.
+    """
+
+    MIGRATION_COMMANDS = frozenset({"makemigrations", "migrate"})
+
+    def __init__(self, command: BaseCommand, commands: list[str], force: bool = False) -> None:
+        """Initialize the build command executor.
+
+        Args:
+            command: The parent Command instance.
+            commands: All build commands, to know when the last migration command ran.
+            force: If True, run the migration commands even when nothing changed.
+        """
+        super().__init__(command)
+        self.force = force
+        self.fingerprint = MigrationFingerprint()
+        self.remaining = sum(self._is_migration_command(cmd) for cmd in commands)
+        self.unchanged: bool | None = None
+        self.failed = False
+
+    def execute(self, cmd: str) -> CommandResult:
+        """Execute a single command, skipping migration commands when possible.
+
+        Args:
+            cmd: The command string to execute.
+
+        Returns:
+            CommandResult containing execution status and any error details.
+        """
+        if not self._is_migration_command(cmd):
+            return super().execute(cmd)
+
+        # Decided once, before the first migration command changes anything
+        if self.unchanged is None:
+            self.unchanged = not self.force and self.fingerprint.matches()
+
+        self.remaining -= 1
+
+        if self.unchanged:
+            return CommandResult(command=cmd, success=True, skip_reason="migrations unchanged")
+
+        result = super().execute(cmd)
+        self.failed = self.failed or not result.success
+
+        if self.remaining == 0 and not self.failed:
+            self.fingerprint.store(self.fingerprint.compute())
+
+        return result
+
+    def _is_migration_command(self, cmd: str) -> bool:
+        """Return whether a command only acts on migrations of the default database."""
+        parts: list[str] = cmd.strip().split()
+        return (
+            bool(parts)
+            and parts[0] in self.MIGRATION_COMMANDS
+            and not any(part.startswith("--database") for part in parts)
+        )
 
 
 class BuildCommandGenerator(CommandGenerator):
     """Generator for build command execution."""
 
+    def __init__(self, django_command: BaseCommand, force: bool = False) -> None:
+        """Initialize the build command generator.
+
+        Args:
+            django_command: The Django BaseCommand instance.
+            force: If True, run the migration commands even when nothing changed.
+        """
+        super().__init__(django_command)
+        self.force = force
+
     def get_runcommands(self) -> list[str]:
         """Retrieve build commands."""
         runcommands_conf = RUNCOMMANDS
@@ -30,6 +112,10 @@ class BuildCommandGenerator(CommandGenerator):
         """Get the mode identifier for build commands."""
         return "BUILD"
 
+    def create_executor(self) -> CommandExecutor:
+        """Create the executor skipping unchanged migration commands."""
+        return BuildCommandExecutor(self.django_command, self.get_runcommands(), self.force)
+
 
 class Command(BaseCommand):
     help = "Execute build commands"
@@ -47,6 +133,12 @@ class Command(BaseCommand):
             action="store_true",
             help="Show commands that would be executed without running them",
         )
+        parser.add_argument(
+            "--force",
+            dest="force",
+            action="store_true",
+            help="Run makemigrations and migrate even when the migration fingerprint is unchanged",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Handle the runbuild command execution.
@@ -59,7 +151,9 @@ class Command(BaseCommand):
             *args: Unused positional arguments.
             **options: Command options including:
                 - dry_run (bool): If True, show commands without executing.
+                - force (bool): If True, never skip the migration commands.
         """
         dry_run: bool = options.get("dry_run", False)
-        generator = BuildCommandGenerator(self)
+        force: bool = options.get("force", False)
+        generator = BuildCommandGenerator(self, force=force)
         generator.generate(dry_run=dry_run)
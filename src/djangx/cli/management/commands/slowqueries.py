@@ -0,0 +1,230 @@
+"""
+Management command for the slow query log.
+
+This module provides a clean, OOP-based interface for:
+- Summarizing logged slow queries by statement shape
+- Showing the plan PostgreSQL chose for each of them
+- Clearing the log and its rotated files
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.management.color import Style
+
+from ....api.settings import SLOW_QUERY_LOG, SLOW_QUERY_LOG_BACKUPS, SLOW_QUERY_MS
+
+
+@dataclass
+class SlowQuery:
+    """
+    Aggregated log entries of one normalized statement.
+
+    Attributes:
+        sql: The normalized statement.
+        durations: Duration of each logged execution in milliseconds.
+        views: Views that ran the statement.
+        origins: Call sites that ran the statement.
+        plan: Top node of the most recent plan, if one was captured.
+    """
+
+    sql: str
+    durations: list[float] = field(default_factory=list)
+    views: set[str] = field(default_factory=set)
+    origins: set[str] = field(default_factory=set)
+    plan: Optional[str] = None
+
+    @property
+    def count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations)
+
+    @property
+    def max(self) -> float:
+        return max(self.durations)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    def add(self, entry: dict[str, Any]) -> None:
+        self.durations.append(float(entry.get("duration_ms", 0.0)))
+
+        if entry.get("view"):
+            self.views.add(entry["view"])
+        if entry.get("origin"):
+            self.origins.add(entry["origin"])
+
+        # Entries are read oldest first, so the last plan seen is the latest
+        plan = self._describe_plan(entry.get("explain"))
+        if plan is not None:
+            self.plan = plan
+
+    @staticmethod
+    def _describe_plan(explain: Any) -> Optional[str]:
+        """Summarize the top node of an `EXPLAIN (FORMAT JSON)` result"""
+        if not isinstance(explain, list) or not explain:
+            return None
+
+        node = explain[0].get("Plan", {}) if isinstance(explain[0], dict) else {}
+        if "Node Type" not in node:
+            return None
+
+        relation = f" on {node['Relation Name']}" if "Relation Name" in node else ""
+        return f"{node['Node Type']}{relation} (cost {node.get('Total Cost', '?')})"
+
+
+class SlowQueriesHandler:
+    """Handler for reading and clearing the slow query log."""
+
+    SORT_KEYS = ("total", "count", "max", "mean")
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.stdout_writer = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.path = Path(SLOW_QUERY_LOG)
+
+    def report(self, top: int = 10, sort: str = "total") -> None:
+        """Print the slowest statement shapes, worst first."""
+        queries: dict[str, SlowQuery] = {}
+        skipped = 0
+
+        for entry in self._entries():
+            if entry is None:
+                skipped += 1
+                continue
+
+            sql = entry.get("sql", "")
+            queries.setdefault(sql, SlowQuery(sql)).add(entry)
+
+        if not queries:
+            if SLOW_QUERY_MS <= 0:
+                raise CommandError("No slow queries logged. Set DB_SLOW_QUERY_MS to enable the log.")
+
+            self.stdout_writer(self.style.SUCCESS(f"✓ No slow queries in {self.path}"))
+            return
+
+        ranked = sorted(queries.values(), key=lambda query: getattr(query, sort), reverse=True)
+        executions = sum(query.count for query in queries.values())
+
+        # The report is the point of this target, so it ignores --no-verbose
+        self.stdout_writer(
+            self.style.MIGRATE_HEADING(
+                f"Slow queries: {executions} execution(s) of {len(queries)} statement(s), "
+                f"top {min(top, len(ranked))} by {sort}:"
+            )
+        )
+
+        for rank, query in enumerate(ranked[:top], start=1):
+            self.stdout_writer(
+                self.style.WARNING(
+                    f"\n{rank}. {query.count}x, total {query.total:.1f} ms, "
+                    f"mean {query.mean:.1f} ms, max {query.max:.1f} ms"
+                )
+            )
+            self.stdout_writer(f"   {query.sql}")
+
+            if query.views:
+                self.stdout_writer(f"   Views:  {', '.join(sorted(query.views))}")
+            if query.origins:
+                self.stdout_writer(f"   From:   {sorted(query.origins)[0]}")
+            if query.plan:
+                self.stdout_writer(f"   Plan:   {query.plan}")
+
+        if skipped and self.verbose:
+            self.stdout_writer(self.style.WARNING(f"\n⚠ Skipped {skipped} unreadable line(s)"))
+
+    def clear(self) -> None:
+        """Delete the log and its rotated files."""
+        removed = 0
+
+        for path in self._files():
+            path.unlink(missing_ok=True)
+            removed += 1
+
+        if self.verbose:
+            self.stdout_writer(self.style.SUCCESS(f"✓ Removed {removed} slow query log file(s)"))
+
+    def _files(self) -> list[Path]:
+        """Return the existing log files, oldest first"""
+        rotated = [
+            self.path.with_name(f"{self.path.name}.{index}")
+            for index in range(SLOW_QUERY_LOG_BACKUPS, 0, -1)
+        ]
+        return [path for path in [*rotated, self.path] if path.is_file()]
+
+    def _entries(self) -> Iterator[Optional[dict[str, Any]]]:
+        """Yield every logged entry, or None for a line that cannot be parsed"""
+        for path in self._files():
+            with path.open(encoding="utf-8") as lines:
+                for line in lines:
+                    if not line.strip():
+                        continue
+
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line cut short by a crash or a rotation in progress
+                        yield None
+                        continue
+
+                    yield entry if isinstance(entry, dict) else None
+
+
+class Command(BaseCommand):
+    """Django management command for the slow query log."""
+
+    help = "Slow query log: report and clear operations."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "command",
+            choices=["report", "clear"],
+            help="Command to execute: report or clear",
+        )
+        parser.add_argument(
+            "--top",
+            dest="top",
+            type=int,
+            default=10,
+            help="Number of statements to report.",
+        )
+        parser.add_argument(
+            "--sort",
+            dest="sort",
+            choices=SlowQueriesHandler.SORT_KEYS,
+            default="total",
+            help="Rank statements by total, count, max or mean duration.",
+        )
+        parser.add_argument(
+            "--no-verbose",
+            dest="no_verbose",
+            action="store_true",
+            help="Suppress output messages.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command handler."""
+        verbose = not options.get("no_verbose", False)
+        handler = SlowQueriesHandler(self.stdout.write, self.style, verbose)
+
+        match options["command"]:
+            case "report":
+                if options["top"] < 1:
+                    raise CommandError("--top must be at least 1.")
+                handler.report(top=options["top"], sort=options["sort"])
+            case "clear":
+                handler.clear()
@@ -0,0 +1,340 @@
+"""
+Management command for offloading static files to Vercel Blob.
+
+This module provides a clean, OOP-based interface for:
+- Hashing the collected static tree into a local manifest
+- Diffing it against the manifest stored next to the remote copy
+- Uploading only new or changed files in parallel, optionally pruning
+  files that no longer exist locally
+- Reporting the time spent in each phase
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from hashlib import sha256
+from mimetypes import guess_type
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.management.color import Style
+
+from ....api.settings import (
+    BLOB_READ_WRITE_TOKEN,
+    STATIC_OFFLOAD_PREFIX,
+    STATIC_OFFLOAD_WORKERS,
+    STATIC_ROOT,
+)
+
+MANIFEST_VERSION = 1
+
+MANIFEST_NAME = ".staticsync.json"
+
+# Content-hashed names never change content, so the CDN may cache them for good
+HASHED_MAX_AGE = 365 * 24 * 60 * 60
+
+# Everything else, e.g. the unhashed copies collectstatic also writes, is cached briefly
+STATIC_MAX_AGE = 60 * 60
+
+# The manifest is read back on every sync and must never be stale
+MANIFEST_MAX_AGE = 60
+
+
+@dataclass
+class SyncPlan:
+    """Differences between the local static tree and the remote copy.
+
+    Attributes:
+        upload: Relative paths that are new or changed.
+        delete: Relative paths that exist only remotely.
+        unchanged: Number of files already up to date.
+    """
+
+    upload: list[str] = field(default_factory=list)
+    delete: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+class SyncHandler:
+    """Handles syncing the collected static tree to Vercel Blob."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.timings: dict[str, float] = {}
+
+    def sync(self, full: bool = False, prune: bool = False) -> None:
+        """Upload new and changed static files, then store the new manifest."""
+        if not BLOB_READ_WRITE_TOKEN:
+            if self.verbose:
+                self.write(
+                    self.style.WARNING("⚠ BLOB_READ_WRITE_TOKEN is not set; skipping static sync.")
+                )
+            return
+
+        static_root: Path = STATIC_ROOT
+        if not static_root.is_dir():
+            raise CommandError(
+                f"Static root not found at {static_root}. Run 'collectstatic' before 'staticsync'."
+            )
+
+        hashed = self._hashed_names()
+
+        # Imported here so the command loads without the Blob SDK installed
+        from ....api.backends.storages import BlobApi
+
+        client = BlobApi(BLOB_READ_WRITE_TOKEN)
+        started = perf_counter()
+
+        local = self._timed("hash", lambda: self._hash_tree(static_root))
+        remote = {} if full else self._timed("fetch manifest", lambda: self._fetch(client))
+        plan = self._plan(local, remote)
+
+        uploaded, origin = self._timed(
+            "upload", lambda: self._upload(client, static_root, plan.upload, hashed)
+        )
+
+        if prune and plan.delete:
+            self._timed("prune", lambda: self._prune(client, plan.delete))
+
+        self._timed("store manifest", lambda: self._store(client, local))
+
+        self._print_report(plan, uploaded, origin, full, prune, perf_counter() - started)
+
+    # ---- Phases
+
+    @staticmethod
+    def _hash_tree(static_root: Path) -> dict[str, dict[str, Any]]:
+        """Return the SHA-256 digest and size of every file in the static tree."""
+        files: dict[str, dict[str, Any]] = {}
+
+        for path in sorted(static_root.rglob("*")):
+            if not path.is_file():
+                continue
+
+            digest = sha256()
+            with path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+
+            files[path.relative_to(static_root).as_posix()] = {
+                "hash": digest.hexdigest(),
+                "size": path.stat().st_size,
+            }
+
+        return files
+
+    def _fetch(self, client: Any) -> dict[str, dict[str, Any]]:
+        """Download the manifest of the last sync, or an empty one."""
+        from ....api.backends.storages import get_client
+
+        listing = client.list_objects(prefix=self._remote_name(MANIFEST_NAME), limit=1)
+        blobs: list[dict[str, Any]] = listing.get("blobs", [])
+
+        if not blobs or blobs[0]["pathname"] != self._remote_name(MANIFEST_NAME):
+            return {}
+
+        # Bust the CDN cache with the upload time of the current manifest
+        response = get_client().get(blobs[0]["url"], params={"v": blobs[0]["uploadedAt"]})
+        if not response.is_success:
+            return {}
+
+        try:
+            manifest = response.json()
+        except ValueError:
+            return {}
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+
+        return manifest.get("files", {})
+
+    @staticmethod
+    def _plan(local: dict[str, dict[str, Any]], remote: dict[str, dict[str, Any]]) -> SyncPlan:
+        """Work out which files to upload and which to delete."""
+        plan = SyncPlan()
+
+        for name, entry in local.items():
+            previous = remote.get(name)
+            if previous is not None and previous.get("hash") == entry["hash"]:
+                plan.unchanged += 1
+            else:
+                plan.upload.append(name)
+
+        plan.delete = sorted(set(remote) - set(local))
+
+        return plan
+
+    def _upload(
+        self, client: Any, static_root: Path, names: list[str], hashed: set[str]
+    ) -> tuple[int, Optional[str]]:
+        """Upload files in parallel and return the bytes sent and the CDN origin."""
+        sent = 0
+        origin: Optional[str] = None
+
+        def upload(name: str) -> tuple[int, str]:
+            content = (static_root / name).read_bytes()
+            result = client.put(
+                self._remote_name(name),
+                content,
+                content_type=guess_type(name)[0],
+                random_suffix=False,
+                overwrite=True,
+                max_age=HASHED_MAX_AGE if name in hashed else STATIC_MAX_AGE,
+            )
+            return len(content), result["url"]
+
+        with ThreadPoolExecutor(max_workers=max(STATIC_OFFLOAD_WORKERS, 1)) as executor:
+            futures = {executor.submit(upload, name): name for name in names}
+
+            for future in as_completed(futures):
+                try:
+                    size, url = future.result()
+                except Exception as exc:
+                    raise CommandError(f"Failed to upload {futures[future]}: {exc}") from exc
+
+                sent += size
+                if origin is None:
+                    origin = url[: -len(futures[future])]
+
+        return sent, origin
+
+    def _prune(self, client: Any, names: list[str]) -> None:
+        """Delete remote files that no longer exist locally, in batches."""
+        # Deletes take URLs; derive them from the URL of the previous manifest
+        listing = client.list_objects(prefix=self._remote_name(MANIFEST_NAME), limit=1)
+        blobs: list[dict[str, Any]] = listing.get("blobs", [])
+        if not blobs:
+            return
+
+        base = blobs[0]["url"][: -len(MANIFEST_NAME)]
+        urls = [base + name for name in names]
+
+        for offset in range(0, len(urls), 1000):
+            client.delete(urls[offset : offset + 1000])
+
+    def _store(self, client: Any, files: dict[str, dict[str, Any]]) -> None:
+        """Upload the manifest describing the synced tree."""
+        manifest = {"version": MANIFEST_VERSION, "files": files}
+
+        client.put(
+            self._remote_name(MANIFEST_NAME),
+            json.dumps(manifest, separators=(",", ":")).encode(),
+            content_type="application/json",
+            random_suffix=False,
+            overwrite=True,
+            max_age=MANIFEST_MAX_AGE,
+        )
+
+    # ---- Helpers
+
+    @staticmethod
+    def _hashed_names() -> set[str]:
+        """
+        Return the content-hashed names written by collectstatic.
+
+        Raises if static files are already served from the CDN under names that
+        do not change with their content, as cached copies would then go stale.
+        """
+        if isinstance(staticfiles_storage, ManifestFilesMixin):
+            return set(staticfiles_storage.hashed_files.values())
+
+        if urlsplit(settings.STATIC_URL).netloc:
+            raise CommandError(
+                "Static files served from URLS_STATIC_CDN need content-hashed names. "
+                "Use ManifestStaticFilesStorage for STORAGES['staticfiles'] and run "
+                "'collectstatic' again."
+            )
+
+        return set()
+
+    @staticmethod
+    def _remote_name(name: str) -> str:
+        """Return the blob pathname of a static file."""
+        prefix = STATIC_OFFLOAD_PREFIX.strip("/")
+        return f"{prefix}/{name}" if prefix else name
+
+    def _timed(self, phase: str, call: Callable[[], Any]) -> Any:
+        """Run a phase and record how long it took."""
+        started = perf_counter()
+        result = call()
+        self.timings[phase] = perf_counter() - started
+        return result
+
+    def _print_report(
+        self,
+        plan: SyncPlan,
+        uploaded: int,
+        origin: Optional[str],
+        full: bool,
+        prune: bool,
+        elapsed: float,
+    ) -> None:
+        """Print a summary of the sync and the time spent in each phase."""
+        if not self.verbose:
+            return
+
+        mode = "Full" if full else "Incremental"
+        self.write(
+            self.style.SUCCESS(
+                f"✓ {mode} static sync: {len(plan.upload)} uploaded "
+                f"({uploaded / (1024 * 1024):.2f} MiB), {plan.unchanged} unchanged, "
+                f"{len(plan.delete) if prune else 0} pruned in {elapsed:.2f}s"
+            )
+        )
+
+        for phase, seconds in self.timings.items():
+            self.write(f"  {phase:<16}{seconds:>8.2f}s")
+
+        if plan.delete and not prune:
+            self.write(f"  {len(plan.delete)} remote file(s) no longer exist locally (use --prune)")
+
+        if origin:
+            self.write(f"  Set URLS_STATIC_CDN={origin} to serve static files from the CDN")
+
+
+class Command(BaseCommand):
+    """Django management command for offloading static files to Vercel Blob."""
+
+    help = "Upload changed static files to Vercel Blob for serving from its CDN."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "--full",
+            dest="full",
+            action="store_true",
+            help="Ignore the remote manifest and upload every file.",
+        )
+        parser.add_argument(
+            "--prune",
+            dest="prune",
+            action="store_true",
+            help="Delete remote files that no longer exist locally.",
+        )
+        parser.add_argument(
+            "--no-verbose",
+            dest="no_verbose",
+            action="store_true",
+            help="Suppress output messages.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command handler."""
+        verbose = not options.get("no_verbose", False)
+
+        SyncHandler(self.stdout.write, self.style, verbose).sync(
+            full=options.get("full", False),
+            prune=options.get("prune", False),
+        )
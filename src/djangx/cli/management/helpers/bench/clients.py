@@ -0,0 +1,71 @@
+"""Management command utilities: HTTP client benchmark
+
+Compares per-call HTTP latency of fresh connections with the pooled
+client, counting TCP connects and TLS handshakes.
+"""
+
+from typing import Any, Callable, Optional
+
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class HttpBenchmark:
+    """Compares a new HTTP client per call with the process-wide pooled client."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(self, url: Optional[str] = None, requests: int = 20, latency: float = 0.02) -> None:
+        """Time sequential GETs to the URL, or to a local stand-in when none is given."""
+        # Imported here so the command loads without the Blob SDK installed
+        import httpx
+
+        from .....api.backends.storages import get_client
+        from .....api.backends.storages.clients import client_options
+        from .standin import BlobStandInServer
+
+        with BlobStandInServer(latency=latency) as server:
+            target = url or f"{server.api_url}/?limit=1"
+
+            fresh = Measurement("new client per call")
+            pooled = Measurement("pooled client")
+            events: dict[str, dict[str, int]] = {fresh.name: {}, pooled.name: {}}
+
+            def trace(counts: dict[str, int]) -> Callable[[str, dict[str, Any]], None]:
+                def record(event: str, info: dict[str, Any]) -> None:
+                    if event.endswith(".started"):
+                        counts[event] = counts.get(event, 0) + 1
+
+                return record
+
+            def get_fresh() -> None:
+                with httpx.Client(**client_options()) as client:
+                    client.get(target, extensions={"trace": trace(events[fresh.name])})
+
+            def get_pooled() -> None:
+                get_client().get(target, extensions={"trace": trace(events[pooled.name])})
+
+            for _ in range(requests):
+                fresh.time(get_fresh)
+            for _ in range(requests):
+                pooled.time(get_pooled)
+
+        if not self.verbose:
+            return
+
+        self.printer.print(f"HTTP connection reuse ({target})", [fresh, pooled])
+
+        for name, counts in events.items():
+            connects = counts.get("connection.connect_tcp.started", 0)
+            handshakes = counts.get("connection.start_tls.started", 0)
+            self.write(f"  {name}: {connects} TCP connect(s), {handshakes} TLS handshake(s)")
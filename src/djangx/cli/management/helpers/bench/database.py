@@ -0,0 +1,89 @@
+"""Management command utilities: database benchmark
+
+Measures database requests per second with each connection lifetime
+and health check setting.
+"""
+
+from typing import Any, Callable, Optional
+
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class DatabaseBenchmark:
+    """Measures request throughput with each database connection setting."""
+
+    SCENARIOS: list[tuple[str, Optional[int], bool]] = [
+        ("new connection per request", 0, False),
+        ("persistent", 60, False),
+        ("persistent + health checks", 60, True),
+    ]
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(self, requests: int = 20, alias: str = "default") -> None:
+        """
+        Simulate requests that each run one query against the database.
+
+        Every request fires the request_started and request_finished signals,
+        so connections are opened, health-checked and closed exactly as Django
+        does for real requests.
+        """
+        from django.db import connections
+
+        connection = connections[alias]
+        settings_dict = connection.settings_dict
+        original = {key: settings_dict.get(key) for key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS")}
+
+        if settings_dict.get("OPTIONS", {}).get("pool"):
+            # Django does not allow persistent connections together with a pool
+            scenarios: list[tuple[str, Optional[int], bool]] = [("connection pool", 0, False)]
+        else:
+            scenarios = self.SCENARIOS
+
+        measurements: list[Measurement] = []
+
+        try:
+            for label, max_age, health_checks in scenarios:
+                connection.close()
+                settings_dict["CONN_MAX_AGE"] = max_age
+                settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+
+                measurement = Measurement(label)
+                for _ in range(requests):
+                    measurement.time(lambda: self._request(connection))
+                measurements.append(measurement)
+        finally:
+            connection.close()
+            settings_dict.update(original)
+
+        if not self.verbose:
+            return
+
+        self.printer.print(f"Database connections ({connection.vendor}, {alias})", measurements)
+        self.write(
+            f"  Configured: CONN_MAX_AGE={original['CONN_MAX_AGE']}, "
+            f"CONN_HEALTH_CHECKS={original['CONN_HEALTH_CHECKS']}"
+        )
+
+    def _request(self, connection: Any) -> None:
+        """Run one query inside the signals that bracket a request."""
+        from django.core.signals import request_finished, request_started
+
+        request_started.send(sender=self.__class__)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+        finally:
+            request_finished.send(sender=self.__class__)
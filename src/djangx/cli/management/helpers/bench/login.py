@@ -0,0 +1,138 @@
+"""Management command utilities: login benchmark
+
+Times login lookups by username and email among synthetic users,
+without and with the functional indexes.
+"""
+
+from secrets import token_hex
+from time import perf_counter
+from typing import Any, Callable
+
+from django.core.management.base import CommandError
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class LoginBenchmark:
+    """
+    Times the login lookup against a user table filled with synthetic users.
+
+    The users and any index changes are made inside a transaction that is
+    rolled back at the end, so the database is left as it was. The table is
+    locked meanwhile, so run it against a development database.
+    """
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(self, users: int = 1_000_000, requests: int = 20) -> None:
+        """
+        Compare the `iexact` OR query with the backend lookup, without and with
+        the functional indexes, for logins by username and by email.
+        """
+        from django.contrib.auth import get_user_model
+        from django.contrib.auth.hashers import make_password
+        from django.db import connections, router, transaction
+        from django.db.models import Q
+
+        from .....api.backends.auth import UsernameOrEmailBackend, get_lookup_indexes
+
+        User = get_user_model()
+        alias = router.db_for_write(User)
+        connection = connections[alias]
+
+        if not connection.features.can_rollback_ddl:
+            raise CommandError(f"The login benchmark cannot roll back DDL on {connection.vendor}.")
+
+        indexes = get_lookup_indexes(User)
+        # Only used to build and run statements, so its DDL joins the transaction below
+        editor = connection.schema_editor()
+        prefix = f"bench{token_hex(4)}"
+        numbers = range(0, users, max(users // requests, 1))[:requests]
+        # Alternate username and email logins, uppercased so matching must ignore case
+        identifiers = [
+            (f"{prefix}_{number}@example.com" if index % 2 else f"{prefix}_{number}").upper()
+            for index, number in enumerate(numbers)
+        ]
+        backend = UsernameOrEmailBackend()
+        measurements: list[Measurement] = []
+
+        def lookup_or(identifier: str) -> None:
+            query = Q(username__iexact=identifier) | Q(email__iexact=identifier)
+            list(User._default_manager.filter(query)[:2])
+
+        def lookup_backend(identifier: str) -> None:
+            backend.get_user_by_identifier(identifier)
+
+        with transaction.atomic(using=alias):
+            created = perf_counter()
+            self._create_users(User, alias, prefix, users, make_password(token_hex(16)))
+            created = perf_counter() - created
+
+            existing = self._existing_indexes(connection, User)
+            for index in indexes:
+                if index.name in existing:
+                    editor.execute(editor.sql_delete_index % {"name": editor.quote_name(index.name)})
+            self._analyze(connection, User)
+
+            for with_indexes in (False, True):
+                if with_indexes:
+                    for index in indexes:
+                        editor.execute(index.create_sql(User, editor))
+                    self._analyze(connection, User)
+
+                suffix = "indexed" if with_indexes else "no index"
+                for label, lookup in (("iexact OR", lookup_or), ("backend", lookup_backend)):
+                    measurement = Measurement(f"{label}, {suffix}")
+                    for identifier in identifiers:
+                        measurement.time(lambda: lookup(identifier))
+                    measurements.append(measurement)
+
+            transaction.set_rollback(True, using=alias)
+
+        if not self.verbose:
+            return
+
+        self.printer.print(
+            f"Login lookup ({connection.vendor}, {users} synthetic users)", measurements
+        )
+        self.write(f"  Users created in {created:.1f}s and rolled back")
+
+    @staticmethod
+    def _create_users(User: Any, alias: str, prefix: str, users: int, password: str) -> None:
+        """Insert users in batches, sharing one password hash to skip the hasher."""
+        batch = 10_000
+
+        for start in range(0, users, batch):
+            User._default_manager.db_manager(alias).bulk_create(
+                User(
+                    username=f"{prefix}_{number}",
+                    email=f"{prefix}_{number}@example.com",
+                    password=password,
+                )
+                for number in range(start, min(start + batch, users))
+            )
+
+    @staticmethod
+    def _existing_indexes(connection: Any, User: Any) -> set[str]:
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, User._meta.db_table)
+
+        return set(constraints)
+
+    @staticmethod
+    def _analyze(connection: Any, User: Any) -> None:
+        """Refresh planner statistics so the new rows and indexes are considered"""
+        table = connection.ops.quote_name(User._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {table}")
@@ -0,0 +1,156 @@
+"""Management command utilities: PgBouncer benchmark
+
+Checks a concurrent workload against PgBouncer in transaction pooling mode.
+"""
+
+import threading
+from collections import Counter
+from time import perf_counter
+from typing import Callable
+
+from django.core.management.base import CommandError
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class PgBouncerBenchmark:
+    """
+    Runs a concurrent workload that PgBouncer's transaction pooling breaks
+    unless the connection is configured for it.
+
+    Point the database at a local PgBouncer with `pool_mode = transaction`
+    and a `default_pool_size` below the thread count, so clients keep moving
+    between server connections. Each thread iterates a large result through
+    Django's chunked cursor, re-runs one statement with server-side binding
+    past psycopg's prepare threshold, and checks that a transaction stays on
+    one server connection. With DB_PGBOUNCER off, the first two fail with
+    missing cursors or prepared statements. Without a PgBouncer at hand, the
+    workload still runs against PostgreSQL directly, as a baseline.
+    """
+
+    ROWS = 5000
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(self, requests: int = 20, concurrency: int = 16, alias: str = "default") -> None:
+        """Run every operation `requests` times on each of `concurrency` threads."""
+        from django.db import connections, transaction
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        connection = connections[alias]
+        if connection.vendor != "postgresql" or not is_psycopg3:
+            raise CommandError("The pgbouncer benchmark needs PostgreSQL with psycopg 3.")
+
+        import psycopg  # type: ignore[reportMissingImports]
+
+        def chunked_read() -> None:
+            # As QuerySet.iterator() outside a transaction picks its cursor
+            client = connections[alias]
+            if client.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+                cursor = client.cursor()
+            else:
+                cursor = client.chunked_cursor()
+
+            try:
+                cursor.execute("SELECT n FROM generate_series(1, %s) AS n", [self.ROWS])
+                rows = 0
+                while batch := cursor.fetchmany(500):
+                    rows += len(batch)
+            finally:
+                cursor.close()
+
+            if rows != self.ROWS:
+                raise AssertionError(f"read {rows} of {self.ROWS} rows")
+
+        def repeated_statement() -> None:
+            connections[alias].ensure_connection()
+            # Server-side binding, as with OPTIONS server_side_binding, honours prepare_threshold
+            with psycopg.Cursor(connections[alias].connection) as cursor:
+                for number in range(10):
+                    cursor.execute("SELECT %s::int + 1", [number])
+                    if cursor.fetchone()[0] != number + 1:
+                        raise AssertionError("wrong result")
+
+        def transaction_pinning() -> None:
+            with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+                cursor.execute("SELECT pg_backend_pid()")
+                first = cursor.fetchone()[0]
+                cursor.execute("SELECT pg_sleep(0.001), pg_backend_pid()")
+                if cursor.fetchone()[1] != first:
+                    raise AssertionError("transaction moved between server connections")
+
+        operations: dict[str, Callable[[], None]] = {
+            "chunked read": chunked_read,
+            "repeated statement": repeated_statement,
+            "transaction": transaction_pinning,
+        }
+        measurements = {name: Measurement(name) for name in operations}
+        errors: Counter[str] = Counter()
+        first_errors: dict[str, str] = {}
+        lock = threading.Lock()
+        barrier = threading.Barrier(concurrency)
+
+        def worker() -> None:
+            barrier.wait()
+
+            try:
+                for _ in range(requests):
+                    for name, operation in operations.items():
+                        started = perf_counter()
+                        try:
+                            operation()
+                        except Exception as exc:
+                            with lock:
+                                errors[name] += 1
+                                first_errors.setdefault(name, str(exc).splitlines()[0])
+                            # A failed statement can leave the client in an unusable state
+                            connections[alias].close()
+                            continue
+
+                        with lock:
+                            measurements[name].samples.append(perf_counter() - started)
+            finally:
+                connections[alias].close()
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - started
+
+        for measurement in measurements.values():
+            measurement.elapsed = elapsed
+
+        if not self.verbose:
+            return
+
+        settings_dict = connection.settings_dict
+        self.printer.print(
+            f"PgBouncer transaction pooling ({concurrency} threads)", list(measurements.values())
+        )
+        self.write(
+            f"  DISABLE_SERVER_SIDE_CURSORS={settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')}, "
+            f"prepare_threshold={settings_dict['OPTIONS'].get('prepare_threshold', 5)}, "
+            f"CONN_MAX_AGE={settings_dict.get('CONN_MAX_AGE')}"
+        )
+
+        if not errors:
+            self.write(self.style.SUCCESS("  ✓ No errors"))
+
+        for name, count in errors.items():
+            self.write(
+                self.style.WARNING(f"  {name}: {count} failure(s), e.g. {first_errors[name]}")
+            )
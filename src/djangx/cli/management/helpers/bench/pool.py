@@ -0,0 +1,104 @@
+"""Management command utilities: pool benchmark
+
+Stresses the database connection pool with bursts of concurrent
+requests and reports queue wait times.
+"""
+
+import threading
+from time import perf_counter
+from typing import Callable
+
+from django.core.management.base import CommandError
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class PoolBenchmark:
+    """Stresses the psycopg connection pool with a burst of concurrent requests."""
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(
+        self,
+        requests: int = 20,
+        concurrency: int = 16,
+        hold: float = 0.01,
+        alias: str = "default",
+    ) -> None:
+        """
+        Start all threads at once, each checking out a connection `requests`
+        times and holding it for `hold` seconds, and time the wait for each.
+        """
+        from django.db import connections
+
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            raise CommandError("The pool benchmark needs PostgreSQL with DB_POOL enabled.")
+
+        from psycopg_pool import PoolTimeout  # type: ignore[reportMissingImports]
+
+        wait = Measurement("queue wait")
+        total = Measurement("checkout + query")
+        lock = threading.Lock()
+        barrier = threading.Barrier(concurrency)
+        timeouts = 0
+
+        def worker() -> None:
+            nonlocal timeouts
+            barrier.wait()
+
+            for _ in range(requests):
+                started = perf_counter()
+                try:
+                    with pool.connection() as conn:
+                        acquired = perf_counter()
+                        conn.execute("SELECT pg_sleep(%s)", [hold])
+                except PoolTimeout:
+                    with lock:
+                        timeouts += 1
+                    continue
+
+                with lock:
+                    wait.samples.append(acquired - started)
+                    total.samples.append(perf_counter() - started)
+
+        pool.pop_stats()
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wait.elapsed = total.elapsed = perf_counter() - started
+
+        stats: dict[str, int] = pool.pop_stats()
+
+        if not self.verbose:
+            return
+
+        self.printer.print(
+            f"Connection pool (min {pool.min_size}, max {pool.max_size}, "
+            f"{concurrency} concurrent, {hold * 1000:.0f} ms hold)",
+            [wait, total],
+        )
+        self.write(
+            f"  Queued requests: {stats.get('requests_queued', 0)}, "
+            f"total wait: {stats.get('requests_wait_ms', 0)} ms, "
+            f"connections opened: {stats.get('connections_num', 0)}"
+        )
+
+        if timeouts:
+            self.write(
+                self.style.WARNING(f"  {timeouts} checkout(s) timed out (raise DB_POOL_MAX_SIZE)")
+            )
@@ -0,0 +1,85 @@
+"""Management command utilities: benchmark reports
+
+Timings of benchmarked operations and the table they are printed as.
+"""
+
+from dataclasses import dataclass, field
+from statistics import fmean, quantiles
+from time import perf_counter
+from typing import Any, Callable
+
+from django.core.management.color import Style
+
+MIB = 1024 * 1024
+
+
+@dataclass
+class Measurement:
+    """Timings of a single benchmarked operation.
+
+    Attributes:
+        name: Label of the operation.
+        samples: Duration of each call in seconds.
+        bytes: Total bytes transferred by all calls.
+        elapsed: Wall-clock duration of the whole phase, if calls overlapped.
+    """
+
+    name: str
+    samples: list[float] = field(default_factory=list)
+    bytes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """Wall-clock time of the phase."""
+        return self.elapsed or sum(self.samples)
+
+    @property
+    def rate(self) -> float:
+        """Operations per second."""
+        return len(self.samples) / self.total if self.total else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second."""
+        return self.bytes / self.total if self.total else 0.0
+
+    def percentile(self, percent: int) -> float:
+        """Return the given latency percentile in seconds."""
+        if len(self.samples) < 2:
+            return self.samples[0] if self.samples else 0.0
+
+        return quantiles(self.samples, n=100, method="inclusive")[percent - 1]
+
+    def time(self, call: Callable[[], Any]) -> Any:
+        """Run and time a call, recording the sample."""
+        started = perf_counter()
+        result = call()
+        self.samples.append(perf_counter() - started)
+        return result
+
+
+class ReportPrinter:
+    """Prints measurements as an aligned table."""
+
+    HEADER = f"{'operation':<28}{'n':>6}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}"
+
+    def __init__(self, stdout_writer: Callable[[str], None], style: Style) -> None:
+        self.write = stdout_writer
+        self.style = style
+
+    def print(self, title: str, measurements: list[Measurement]) -> None:
+        """Print a titled table of measurements."""
+        self.write(self.style.MIGRATE_HEADING(title))
+        self.write(self.style.MIGRATE_LABEL(f"{self.HEADER}{'ops/s':>10}{'MiB/s':>10}"))
+
+        for m in measurements:
+            mean = fmean(m.samples) * 1000 if m.samples else 0.0
+            mib = f"{m.throughput / MIB:>10.2f}" if m.bytes else f"{'-':>10}"
+            self.write(
+                f"{m.name:<28}{len(m.samples):>6}{mean:>10.2f}"
+                f"{m.percentile(50) * 1000:>10.2f}{m.percentile(95) * 1000:>10.2f}"
+                f"{m.rate:>10.1f}{mib}"
+            )
+
+        self.write("")
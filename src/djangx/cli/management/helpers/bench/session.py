@@ -0,0 +1,96 @@
+"""Management command utilities: session benchmark
+
+Counts the queries of authenticated requests with and without the
+per-session user cache.
+"""
+
+from secrets import token_hex
+from typing import Callable
+
+from django.core.management.base import CommandError
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class SessionBenchmark:
+    """
+    Compares resolving `request.user` with and without the per-session user cache.
+
+    A throwaway user logs in inside a transaction that is rolled back at the
+    end, and each request runs the session and authentication middleware and
+    touches `request.user`, as any authenticated page does.
+    """
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(self, requests: int = 20) -> None:
+        """Count the queries and time of authenticated requests through each middleware."""
+        from django.conf import settings
+        from django.contrib.auth import get_user_model, login
+        from django.contrib.auth.middleware import AuthenticationMiddleware
+        from django.contrib.sessions.middleware import SessionMiddleware
+        from django.db import router, transaction
+        from django.http import HttpRequest, HttpResponse
+        from django.test import RequestFactory
+
+        from .....api.middleware import QueryRecorder
+        from .....api.settings import AUTH_USER_CACHE_TTL
+        from .....api.usercache import CachedAuthenticationMiddleware, forget_cached_session
+
+        if AUTH_USER_CACHE_TTL <= 0:
+            raise CommandError("The session benchmark needs AUTH_USER_CACHE_TTL above 0.")
+
+        User = get_user_model()
+        factory = RequestFactory()
+
+        def view(request: HttpRequest) -> HttpResponse:
+            return HttpResponse(str(request.user.pk))
+
+        with transaction.atomic(using=router.db_for_write(User)):
+            user = User._default_manager.create(**{User.USERNAME_FIELD: f"bench{token_hex(4)}"})
+
+            request = factory.get("/")
+            SessionMiddleware(view).process_request(request)
+            login(request, user, backend=settings.AUTHENTICATION_BACKENDS[0])
+            request.session.save()
+
+            results: list[tuple[Measurement, int]] = []
+            scenarios = (
+                ("AuthenticationMiddleware", AuthenticationMiddleware),
+                ("cached per session", CachedAuthenticationMiddleware),
+            )
+
+            for label, middleware in scenarios:
+                handler = SessionMiddleware(middleware(view))
+                measurement = Measurement(label)
+                recorder = QueryRecorder(threshold=0)
+
+                with recorder.install():
+                    for _ in range(requests):
+                        authenticated = factory.get("/")
+                        authenticated.COOKIES[settings.SESSION_COOKIE_NAME] = (
+                            request.session.session_key
+                        )
+                        measurement.time(lambda: handler(authenticated))
+
+                results.append((measurement, recorder.count))
+
+            forget_cached_session(None, request)
+            transaction.set_rollback(True)
+
+        if not self.verbose:
+            return
+
+        self.printer.print("Authenticated requests", [measurement for measurement, _ in results])
+        for measurement, queries in results:
+            self.write(f"  {measurement.name}: {queries / requests:.2f} queries per request")
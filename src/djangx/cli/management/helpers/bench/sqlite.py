@@ -0,0 +1,148 @@
+"""Management command utilities: SQLite benchmark
+
+Compares concurrent SQLite read/write throughput without options and
+with the configured tuning profile.
+"""
+
+import threading
+from pathlib import Path
+from secrets import token_hex
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+
+from django.core.management.base import CommandError
+from django.core.management.color import Style
+
+from .report import Measurement, ReportPrinter
+
+
+class SqliteBenchmark:
+    """
+    Compares concurrent SQLite throughput with and without the tuning profile.
+
+    Each profile gets a fresh database file in a temporary directory, so the
+    persistent journal mode of one cannot leak into the other.
+    """
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(self, requests: int = 20, concurrency: int = 16) -> None:
+        """Run half the threads as writers and half as readers against each profile."""
+        from django.conf import settings
+        from django.db import connections
+
+        default = settings.DATABASES["default"]
+        if default["ENGINE"] != "django.db.backends.sqlite3":
+            raise CommandError("The sqlite benchmark needs DB_BACKEND=sqlite3.")
+
+        configured = dict(default.get("OPTIONS", {}))
+        if not configured:
+            raise CommandError(
+                "No SQLite tuning profile to compare. Set DB_SQLITE_TUNING=true to enable it."
+            )
+
+        profiles: dict[str, dict[str, Any]] = {"no options": {}, "configured profile": configured}
+
+        with TemporaryDirectory() as directory:
+            configs = {
+                f"bench_sqlite_{index}": {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": Path(directory) / f"{index}.sqlite3",
+                    "OPTIONS": options,
+                }
+                for index, options in enumerate(profiles.values())
+            }
+            # Fills in the remaining keys; a "default" entry is required but discarded
+            configs = connections.configure_settings({"default": {}, **configs})
+
+            try:
+                for index, label in enumerate(profiles):
+                    alias = f"bench_sqlite_{index}"
+                    connections.settings[alias] = configs[alias]
+                    self._bench(alias, label, requests, max(concurrency, 2))
+            finally:
+                for index in range(len(profiles)):
+                    alias = f"bench_sqlite_{index}"
+                    if alias in connections.settings:
+                        connections[alias].close()
+                        del connections.settings[alias]
+
+    def _bench(self, alias: str, label: str, requests: int, concurrency: int) -> None:
+        """Measure one profile with concurrent writers and readers."""
+        from django.db import OperationalError, connections, transaction
+
+        with connections[alias].cursor() as cursor:
+            cursor.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, value TEXT)")
+            cursor.execute("CREATE TABLE total (id INTEGER PRIMARY KEY, count INTEGER)")
+            cursor.execute("INSERT INTO total (id, count) VALUES (1, 0)")
+
+        writes = Measurement("write transaction")
+        reads = Measurement("read query")
+        errors = 0
+        lock = threading.Lock()
+        barrier = threading.Barrier(concurrency)
+
+        def write() -> None:
+            with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+                cursor.execute("INSERT INTO item (value) VALUES (%s)", [token_hex(16)])
+                cursor.execute("UPDATE total SET count = count + 1 WHERE id = 1")
+
+        def read() -> None:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT count FROM total WHERE id = 1")
+                cursor.execute("SELECT COUNT(*), MAX(id) FROM item")
+                cursor.fetchone()
+
+        def worker(operation: Callable[[], None], measurement: Measurement) -> None:
+            nonlocal errors
+            barrier.wait()
+
+            try:
+                for _ in range(requests):
+                    started = perf_counter()
+                    try:
+                        operation()
+                    except OperationalError:
+                        with lock:
+                            errors += 1
+                        continue
+
+                    with lock:
+                        measurement.samples.append(perf_counter() - started)
+            finally:
+                connections[alias].close()
+
+        writers = concurrency // 2
+        threads = [threading.Thread(target=worker, args=(write, writes)) for _ in range(writers)] + [
+            threading.Thread(target=worker, args=(read, reads)) for _ in range(concurrency - writers)
+        ]
+
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writes.elapsed = reads.elapsed = perf_counter() - started
+
+        connections[alias].close()
+
+        if not self.verbose:
+            return
+
+        self.printer.print(
+            f"SQLite, {label} ({writers} writers, {concurrency - writers} readers)",
+            [writes, reads],
+        )
+        if errors:
+            self.write(self.style.WARNING(f"  {errors} operation(s) failed: database is locked"))
+            self.write("")
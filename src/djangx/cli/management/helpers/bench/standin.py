@@ -0,0 +1,497 @@
+"""Management command utilities: Blob stand-in
+
+A local, in-memory stand-in for the Vercel Blob API that the storage
+benchmarks run against, so they need neither a token nor network access.
+"""
+
+import json
+import random
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from mimetypes import guess_type
+from os import environ
+from posixpath import splitext
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Any token of this shape is accepted; the SDK derives a store id from its 4th segment
+STANDIN_TOKEN = "vercel_blob_rw_standin_local"
+
+_API_PREFIX = "/api"
+_FILES_PREFIX = "/files/"
+
+
+@dataclass
+class _StoredBlob:
+    """A blob held in memory by the stand-in server."""
+
+    pathname: str
+    content: bytes
+    content_type: str
+    uploaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+@dataclass
+class _PendingUpload:
+    """A multipart upload that has not been completed yet."""
+
+    pathname: str
+    content_type: str
+    parts: dict[int, bytes] = field(default_factory=dict)
+
+
+class _BlobStandInHandler(BaseHTTPRequestHandler):
+    """Implements the subset of the Blob API that BlobClient and the storage backend use."""
+
+    protocol_version = "HTTP/1.1"
+    server: "BlobStandInServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+    # ---- HTTP verbs
+
+    def do_GET(self) -> None:
+        self.server.inject_latency()
+        path, query = self._split()
+
+        if path.startswith(_FILES_PREFIX):
+            self._serve_file(unquote(path[len(_FILES_PREFIX) :]))
+        elif path.rstrip("/") == _API_PREFIX:
+            if "url" in query:
+                self._head(query["url"])
+            else:
+                self._list(query)
+        else:
+            self._send_error(404, "not_found")
+
+    def do_PUT(self) -> None:
+        self.server.inject_latency()
+        path, query = self._split()
+
+        if path.rstrip("/") != _API_PREFIX or "pathname" not in query:
+            self._send_error(400, "bad_request", "pathname is required")
+            return
+
+        blob = self.server.store(
+            self._pathname(query["pathname"]),
+            self._read_body(),
+            self.headers.get("x-content-type"),
+        )
+        self._send_json(self.server.describe(blob))
+
+    def do_POST(self) -> None:
+        self.server.inject_latency()
+        path, query = self._split()
+
+        match path.rstrip("/"):
+            case "/api/delete":
+                urls: list[str] = json.loads(self._read_body() or b"{}").get("urls", [])
+                self.server.delete(urls)
+                self._send_json({})
+            case "/api/mpu":
+                self._multipart(query)
+            case _:
+                self._send_error(404, "not_found")
+
+    # ---- Endpoints
+
+    def _head(self, url: str) -> None:
+        blob = self.server.find(url)
+
+        if blob is None:
+            self._send_error(404, "not_found")
+            return
+
+        self._send_json(
+            {
+                **self.server.describe(blob),
+                "size": len(blob.content),
+                "uploadedAt": blob.uploaded_at.isoformat(),
+                "cacheControl": "public, max-age=31536000",
+            }
+        )
+
+    def _list(self, query: dict[str, str]) -> None:
+        prefix = query.get("prefix", "")
+        limit = int(query.get("limit") or 1000)
+        offset = int(query.get("cursor") or 0)
+
+        blobs = self.server.list_blobs(prefix)
+        page = blobs[offset : offset + limit]
+        has_more = offset + limit < len(blobs)
+
+        self._send_json(
+            {
+                "blobs": [
+                    {
+                        "url": self.server.url_for(blob.pathname),
+                        "downloadUrl": self.server.url_for(blob.pathname) + "?download=1",
+                        "pathname": blob.pathname,
+                        "size": len(blob.content),
+                        "uploadedAt": blob.uploaded_at.isoformat(),
+                    }
+                    for blob in page
+                ],
+                "cursor": str(offset + limit) if has_more else None,
+                "hasMore": has_more,
+            }
+        )
+
+    def _multipart(self, query: dict[str, str]) -> None:
+        action = self.headers.get("x-mpu-action")
+
+        match action:
+            case "create":
+                upload_id = self.server.create_upload(
+                    self._pathname(query.get("pathname", "")),
+                    self.headers.get("x-content-type"),
+                )
+                self._send_json({"uploadId": upload_id, "key": upload_id})
+            case "upload":
+                etag = self.server.upload_part(
+                    self.headers.get("x-mpu-upload-id", ""),
+                    int(self.headers.get("x-mpu-part-number", "0")),
+                    self._read_body(),
+                )
+                self._send_json({"etag": etag})
+            case "complete":
+                parts: list[dict[str, Any]] = json.loads(self._read_body() or b"[]")
+                blob = self.server.complete_upload(
+                    self.headers.get("x-mpu-upload-id", ""),
+                    [int(part["partNumber"]) for part in parts],
+                )
+                if blob is None:
+                    self._send_error(404, "not_found")
+                else:
+                    self._send_json(self.server.describe(blob))
+            case _:
+                self._send_error(400, "bad_request", f"Unknown multipart action: {action}")
+
+    def _serve_file(self, pathname: str) -> None:
+        blob = self.server.get(pathname)
+
+        if blob is None:
+            self._send_error(404, "not_found")
+            return
+
+        content = blob.content
+        status = 200
+        headers = {"Content-Type": blob.content_type, "Accept-Ranges": "bytes"}
+
+        byte_range = self.headers.get("Range", "")
+        if byte_range.startswith("bytes="):
+            start_text, _, end_text = byte_range[len("bytes=") :].partition("-")
+            start = int(start_text or 0)
+            end = min(int(end_text) if end_text else len(content) - 1, len(content) - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+            content = content[start : end + 1]
+            status = 206
+
+        self._send(status, content, headers)
+
+    # ---- Helpers
+
+    def _split(self) -> tuple[str, dict[str, str]]:
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        return parts.path, query
+
+    def _pathname(self, pathname: str) -> str:
+        if self.headers.get("x-add-random-suffix", "0") != "1":
+            return pathname
+
+        stem, extension = splitext(pathname)
+        return f"{stem}-{secrets.token_urlsafe(16)}{extension}"
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks: list[bytes] = []
+
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+
+            return b"".join(chunks)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+
+        for key, value in headers.items():
+            self.send_header(key, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        self._send(status, json.dumps(payload).encode(), {"Content-Type": "application/json"})
+
+    def _send_error(self, status: int, code: str, message: str = "") -> None:
+        self._send_json({"error": {"code": code, "message": message}}, status)
+
+
+class BlobStandInServer(ThreadingHTTPServer):
+    """
+    In-memory stand-in for the Vercel Blob API, for offline tests and benchmarks.
+
+    Implements the put, list, head, delete and multipart endpoints used by
+    BlobClient, and serves stored blobs (with Range support) at the URLs it
+    hands out. Every request can be delayed to simulate network latency.
+
+    Usage:
+        with BlobStandInServer(latency=0.02) as server, server.environment():
+            storage = VercelBlobStorage(token=server.token)
+
+    Args:
+        host: The interface to bind.
+        port: The port to bind; 0 picks a free port.
+        latency: Fixed delay in seconds added to every request.
+        jitter: Maximum random delay in seconds added on top of latency.
+    """
+
+    daemon_threads = True
+    token = STANDIN_TOKEN
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+    ) -> None:
+        super().__init__((host, port), _BlobStandInHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self._blobs: dict[str, _StoredBlob] = {}
+        self._uploads: dict[str, _PendingUpload] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "BlobStandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """The root URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        """The Blob API base URL to point the SDK at."""
+        return self.base_url + _API_PREFIX
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def environment(self) -> AbstractContextManager[None]:
+        """Point the Blob SDK at this server and disable its telemetry until exit."""
+        return _environment(self.api_url)
+
+    def inject_latency(self) -> None:
+        """Sleep for the configured latency plus random jitter."""
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+        if delay > 0:
+            time.sleep(delay)
+
+    # ---- Store
+
+    def url_for(self, pathname: str) -> str:
+        return f"{self.base_url}{_FILES_PREFIX}{pathname}"
+
+    def describe(self, blob: _StoredBlob) -> dict[str, Any]:
+        url = self.url_for(blob.pathname)
+        return {
+            "url": url,
+            "downloadUrl": url + "?download=1",
+            "pathname": blob.pathname,
+            "contentType": blob.content_type,
+            "contentDisposition": f'inline; filename="{blob.pathname.rsplit("/", 1)[-1]}"',
+        }
+
+    def store(self, pathname: str, content: bytes, content_type: Optional[str]) -> _StoredBlob:
+        blob = _StoredBlob(
+            pathname=pathname,
+            content=content,
+            content_type=content_type or guess_type(pathname)[0] or "application/octet-stream",
+        )
+
+        with self._lock:
+            self._blobs[pathname] = blob
+
+        return blob
+
+    def get(self, pathname: str) -> Optional[_StoredBlob]:
+        with self._lock:
+            return self._blobs.get(pathname)
+
+    def find(self, url_or_pathname: str) -> Optional[_StoredBlob]:
+        return self.get(self._to_pathname(url_or_pathname))
+
+    def list_blobs(self, prefix: str) -> list[_StoredBlob]:
+        with self._lock:
+            return sorted(
+                (blob for blob in self._blobs.values() if blob.pathname.startswith(prefix)),
+                key=lambda blob: blob.pathname,
+            )
+
+    def delete(self, urls: list[str]) -> None:
+        with self._lock:
+            for url in urls:
+                self._blobs.pop(self._to_pathname(url), None)
+
+    def create_upload(self, pathname: str, content_type: Optional[str]) -> str:
+        upload_id = secrets.token_hex(8)
+
+        with self._lock:
+            self._uploads[upload_id] = _PendingUpload(pathname, content_type or "")
+
+        return upload_id
+
+    def upload_part(self, upload_id: str, part_number: int, content: bytes) -> str:
+        with self._lock:
+            self._uploads[upload_id].parts[part_number] = content
+
+        return f"{upload_id}-{part_number}"
+
+    def complete_upload(self, upload_id: str, part_numbers: list[int]) -> Optional[_StoredBlob]:
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+
+        if upload is None:
+            return None
+
+        content = b"".join(upload.parts[number] for number in sorted(part_numbers))
+        return self.store(upload.pathname, content, upload.content_type)
+
+    def _to_pathname(self, url_or_pathname: str) -> str:
+        path = urlsplit(url_or_pathname).path
+        prefix = _FILES_PREFIX if path.startswith(_FILES_PREFIX) else "/"
+        return unquote(path[len(prefix) :])
+
+
+class BlobStandInProcess:
+    """
+    BlobStandInServer running in a child process.
+
+    Keeps the stand-in's request handling and stored blobs out of the calling
+    process, e.g. while tracemalloc measures the memory of the storage backend.
+
+    Args:
+        latency: Fixed delay in seconds added to every request.
+        jitter: Maximum random delay in seconds added on top of latency.
+    """
+
+    token = STANDIN_TOKEN
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.base_url = ""
+        self._process: Optional[subprocess.Popen[str]] = None
+
+    def __enter__(self) -> "BlobStandInProcess":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def api_url(self) -> str:
+        """The Blob API base URL to point the SDK at."""
+        return self.base_url + _API_PREFIX
+
+    def start(self) -> None:
+        """Start the child process and wait until it serves requests."""
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", __name__, str(self.latency), str(self.jitter)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert self._process.stdout is not None
+
+        self.base_url = self._process.stdout.readline().strip()
+        if not self.base_url:
+            self.stop()
+            raise RuntimeError("The Blob stand-in process exited before serving requests.")
+
+    def stop(self) -> None:
+        """Stop the child process."""
+        if self._process is None:
+            return
+
+        # The child serves until its stdin closes
+        if self._process.stdin is not None:
+            self._process.stdin.close()
+
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+        self._process = None
+
+    def environment(self) -> AbstractContextManager[None]:
+        """Point the Blob SDK at the child's server and disable its telemetry until exit."""
+        return _environment(self.api_url)
+
+
+@contextmanager
+def _environment(api_url: str) -> Iterator[None]:
+    """Point the Blob SDK at a stand-in, restoring the previous values on exit"""
+    values = {"VERCEL_BLOB_API_URL": api_url, "VERCEL_TELEMETRY_DISABLED": "1"}
+    previous = {key: environ.get(key) for key in values}
+    environ.update(values)
+
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                environ.pop(key, None)
+            else:
+                environ[key] = value
+
+
+def _serve(latency: float, jitter: float) -> None:
+    """Serve until stdin closes, announcing the base URL on stdout"""
+    with BlobStandInServer(latency=latency, jitter=jitter) as server:
+        print(server.base_url, flush=True)
+        sys.stdin.read()
+
+
+if __name__ == "__main__":
+    _serve(float(sys.argv[1]), float(sys.argv[2]))
@@ -0,0 +1,263 @@
+"""Management command utilities: storage benchmark
+
+Benchmarks the Vercel Blob storage backend against a local stand-in server
+with injected latency, without a token or network access.
+"""
+
+import asyncio
+import gc
+import tracemalloc
+from contextlib import contextmanager
+from os import urandom
+from pathlib import Path
+from secrets import token_hex
+from tempfile import TemporaryDirectory, TemporaryFile
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.files.base import ContentFile, File
+from django.core.management.color import Style
+
+from .report import MIB, Measurement, ReportPrinter
+
+
+class StorageBenchmark:
+    """
+    Benchmarks VercelBlobStorage against a local Blob stand-in server.
+
+    The blob index is kept in a throwaway SQLite database, so no rows are
+    written to the project's databases.
+    """
+
+    DATABASE = "bench_storage"
+
+    def __init__(
+        self,
+        stdout_writer: Callable[[str], None],
+        style: Style,
+        verbose: bool = True,
+    ) -> None:
+        self.write = stdout_writer
+        self.style = style
+        self.verbose = verbose
+        self.printer = ReportPrinter(stdout_writer, style)
+
+    def run(
+        self,
+        files: int = 50,
+        size: int = 256 * 1024,
+        large_size: int = 64 * MIB,
+        latency: float = 0.02,
+        jitter: float = 0.0,
+        concurrency: int = 16,
+    ) -> None:
+        """Start a stand-in server and benchmark every storage operation against it."""
+        # Imported here so the command loads without the Blob SDK installed
+        from .....api.backends.storages import BlobIndex, BlobMetadataCache, VercelBlobStorage
+        from .standin import BlobStandInServer
+
+        with (
+            self._index_database() as alias,
+            BlobStandInServer(latency=latency, jitter=jitter) as server,
+            server.environment(),
+        ):
+            storage = VercelBlobStorage(token=server.token)
+            # Isolated from the process-wide cache and any shared cache backend
+            storage.cache = BlobMetadataCache(maxsize=max(files * 4, 1024), ttl=300)
+            storage.index = BlobIndex(using=alias)
+
+            prefix = f"bench/{token_hex(4)}"
+            payload = urandom(size)
+
+            if self.verbose:
+                self.write(
+                    self.style.SUCCESS(
+                        f"✓ Blob stand-in at {server.api_url} "
+                        f"(latency {latency * 1000:.0f}ms, jitter {jitter * 1000:.0f}ms)"
+                    )
+                )
+                self.write("")
+
+            names = self._bench_sync(storage, prefix, payload, files)
+            self._bench_memory(storage, prefix, large_size, latency, jitter)
+            self._bench_async(storage, prefix, payload, files, concurrency)
+            self._bench_bulk(storage, prefix, names)
+
+    def _bench_sync(self, storage: Any, prefix: str, payload: bytes, files: int) -> list[str]:
+        """Measure save, url and open on the sync API."""
+        save = Measurement("save")
+        url_cached = Measurement("url (cache)")
+        url_indexed = Measurement("url (index)")
+        url_listed = Measurement("url (listing)")
+        open_head = Measurement("open + read 1 KiB")
+        open_full = Measurement("open + read all")
+
+        names: list[str] = []
+        for i in range(files):
+            content = ContentFile(payload, name=f"{prefix}/file-{i}.bin")
+            names.append(save.time(lambda: storage.save(content.name, content)))
+        save.bytes = len(payload) * files
+
+        for name in names:
+            url_cached.time(lambda: storage.url(name))
+
+        storage.cache.clear()
+        for name in names:
+            url_indexed.time(lambda: storage.url(name))
+
+        storage.cache.clear()
+        indexed, storage.index.enabled = storage.index.enabled, False
+        try:
+            for name in names:
+                url_listed.time(lambda: storage.url(name))
+        finally:
+            storage.index.enabled = indexed
+
+        for name in names:
+            open_head.bytes += len(open_head.time(lambda: self._read(storage, name, 1024)))
+            open_full.bytes += len(open_full.time(lambda: self._read(storage, name, -1)))
+
+        measurements = [save, url_cached, url_indexed, url_listed, open_head, open_full]
+        self._print(f"Sync API ({files} x {len(payload) // 1024} KiB)", measurements)
+
+        return names
+
+    def _bench_memory(
+        self, storage: Any, prefix: str, large_size: int, latency: float, jitter: float
+    ) -> None:
+        """
+        Measure peak Python memory while uploading and streaming a large file.
+
+        This phase talks to a stand-in in a child process, so tracemalloc only
+        counts the storage backend and not the blobs the stand-in holds.
+        """
+        from .standin import BlobStandInProcess
+
+        upload = Measurement("save (large)", bytes=large_size)
+        download = Measurement("open + stream (large)", bytes=large_size)
+
+        with (
+            TemporaryFile() as handle,
+            BlobStandInProcess(latency, jitter) as server,
+            server.environment(),
+        ):
+            chunk = urandom(MIB)
+            for _ in range(large_size // MIB):
+                handle.write(chunk)
+            handle.flush()
+
+            content = File(handle, name=f"{prefix}/large.bin")
+
+            # Each peak starts from live memory only, not from cyclic garbage of earlier
+            # requests that the collector has yet to free
+            gc.collect()
+            tracemalloc.start()
+            try:
+                name = upload.time(lambda: storage.save(content.name, content))
+                _, upload_peak = tracemalloc.get_traced_memory()
+
+                gc.collect()
+                tracemalloc.reset_peak()
+
+                download.time(lambda: self._stream(storage, name))
+                _, download_peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            storage.delete(name)
+
+        self._print(f"Large file ({large_size // MIB} MiB)", [upload, download])
+
+        if self.verbose:
+            self.write(f"  Peak memory during upload:    {upload_peak / MIB:.1f} MiB")
+            self.write(f"  Peak memory during streaming: {download_peak / MIB:.1f} MiB")
+            self.write("")
+
+    def _bench_async(
+        self, storage: Any, prefix: str, payload: bytes, files: int, concurrency: int
+    ) -> None:
+        """Compare concurrent uploads through the async API with the sync API from async code."""
+        async_save = Measurement(f"asave x{concurrency}", bytes=len(payload) * files)
+        sync_save = Measurement(f"sync_to_async(save) x{concurrency}", bytes=len(payload) * files)
+
+        async def timed(measurement: Measurement, call: Callable[[], Any]) -> str:
+            started = perf_counter()
+            name = await call()
+            measurement.samples.append(perf_counter() - started)
+            return name
+
+        async def run(measurement: Measurement, save: Callable[..., Any], label: str) -> list[str]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one(i: int) -> str:
+                async with semaphore:
+                    content = ContentFile(payload, name=f"{prefix}/{label}-{i}.bin")
+                    return await timed(measurement, lambda: save(content.name, content))
+
+            started = perf_counter()
+            names = await asyncio.gather(*(one(i) for i in range(files)))
+            measurement.elapsed = perf_counter() - started
+            return list(names)
+
+        async def main() -> list[str]:
+            names = await run(async_save, storage.asave, "async")
+            # The default thread-sensitive executor is what sync views share under ASGI
+            names += await run(sync_save, sync_to_async(storage.save), "sync")
+            return names
+
+        names = asyncio.run(main())
+        storage.delete_many(names)
+
+        self._print("Upload-heavy async workload", [async_save, sync_save])
+
+    def _bench_bulk(self, storage: Any, prefix: str, names: list[str]) -> None:
+        """Measure the batch operations, cleaning up the benchmark blobs."""
+        exists_many = Measurement("exists_many")
+        delete_many = Measurement("delete_many")
+
+        storage.cache.clear()
+        exists_many.time(lambda: storage.exists_many(names))
+        report = delete_many.time(lambda: storage.delete_many(names))
+
+        self._print(f"Bulk operations ({len(names)} names)", [exists_many, delete_many])
+
+        if self.verbose:
+            self.write(f"  delete_many: {report.summary()}")
+
+    @contextmanager
+    def _index_database(self) -> Iterator[str]:
+        """Yield the alias of a throwaway SQLite database holding the blob index"""
+        from django.db import connections
+
+        from .....api.models import BlobObject
+
+        with TemporaryDirectory() as directory:
+            config = {"ENGINE": "django.db.backends.sqlite3", "NAME": Path(directory) / "index"}
+            # Fills in the remaining keys; a "default" entry is required but discarded
+            configs = connections.configure_settings({"default": {}, self.DATABASE: config})
+            connections.settings[self.DATABASE] = configs[self.DATABASE]
+
+            try:
+                with connections[self.DATABASE].schema_editor() as editor:
+                    editor.create_model(BlobObject)
+
+                yield self.DATABASE
+            finally:
+                connections[self.DATABASE].close()
+                del connections.settings[self.DATABASE]
+
+    @staticmethod
+    def _read(storage: Any, name: str, size: int) -> bytes:
+        with storage.open(name) as handle:
+            return handle.read(size)
+
+    @staticmethod
+    def _stream(storage: Any, name: str) -> None:
+        with storage.open(name) as handle:
+            for _ in handle.chunks():
+                pass
+
+    def _print(self, title: str, measurements: list[Measurement]) -> None:
+        if self.verbose:
+            self.printer.print(title, measurements)
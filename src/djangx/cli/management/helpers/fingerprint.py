@@ -0,0 +1,153 @@
+"""Management command utilities: fingerprint
+
+Fingerprints everything makemigrations and migrate act on, so build steps
+that only deal with migrations can be skipped when none of it has changed.
+"""
+
+import sys
+from hashlib import sha256
+from importlib.util import find_spec
+from pathlib import Path
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+
+from ....api.models import BuildFingerprint
+
+
+class MigrationFingerprint:
+    """Fingerprint of migration files, model definitions and applied migrations.
+
+    Reading it costs two small queries and hashing the source files, instead
+    of loading the migration graph and diffing the models against it.
+
+    Attributes:
+        alias: The database whose applied migrations are fingerprinted.
+    """
+
+    NAME = "migrations"
+
+    def __init__(self, alias: str = DEFAULT_DB_ALIAS) -> None:
+        """Initialize the fingerprint.
+
+        Args:
+            alias: The database whose applied migrations are fingerprinted.
+        """
+        self.alias = alias
+
+    def compute(self) -> str:
+        """Compute the fingerprint of the current project and database state.
+
+        Returns:
+            The hex digest of the fingerprint.
+        """
+        digest = sha256()
+
+        # Settings and versions that change migrations without changing any file
+        for value in (django.__version__, settings.AUTH_USER_MODEL, settings.DEFAULT_AUTO_FIELD):
+            digest.update(f"{value}\0".encode())
+
+        # Keyed by module name, so checkouts in different directories agree
+        sources = {**self._migration_files(), **self._model_files()}
+        for module_name in sorted(sources):
+            digest.update(f"{module_name}\0".encode())
+            digest.update(sources[module_name].read_bytes())
+
+        for app, name in self._applied_migrations():
+            digest.update(f"{app}.{name}\0".encode())
+
+        return digest.hexdigest()
+
+    def stored(self) -> str | None:
+        """Return the fingerprint stored by the last successful build, if any."""
+        try:
+            return (
+                BuildFingerprint.objects.using(self.alias)
+                .filter(name=self.NAME)
+                .values_list("digest", flat=True)
+                .first()
+            )
+        except DatabaseError:
+            # Not migrated yet
+            return None
+
+    def store(self, digest: str) -> None:
+        """Store a fingerprint for the next build to compare against.
+
+        Args:
+            digest: The fingerprint to store.
+        """
+        try:
+            BuildFingerprint.objects.using(self.alias).update_or_create(
+                name=self.NAME, defaults={"digest": digest}
+            )
+        except DatabaseError:
+            # Without the table the next build simply runs every step again
+            pass
+
+    def matches(self) -> bool:
+        """Return whether nothing changed since the last successful build."""
+        stored = self.stored()
+        return stored is not None and stored == self.compute()
+
+    @staticmethod
+    def _migration_files() -> dict[str, Path]:
+        """Return the migration files of every installed app by module name."""
+        files: dict[str, Path] = {}
+
+        for app_config in apps.get_app_configs():
+            module_name, _ = MigrationLoader.migrations_module(app_config.label)
+            if module_name is None:
+                continue
+
+            try:
+                spec = find_spec(module_name)
+            except ModuleNotFoundError:
+                continue
+
+            if spec is None or not spec.submodule_search_locations:
+                continue
+
+            for location in spec.submodule_search_locations:
+                for path in Path(location).glob("*.py"):
+                    files[f"{module_name}.{path.stem}"] = path
+
+        return files
+
+    @staticmethod
+    def _model_files() -> dict[str, Path]:
+        """Return the source files defining the installed models by module name.
+
+        Covers the modules of abstract bases, mixins and custom field classes
+        too, since changing any of them changes the migrations of the models.
+        """
+        classes: set[type] = set()
+
+        for model in apps.get_models(include_auto_created=True):
+            classes.update(model.__mro__)
+            for model_field in model._meta.get_fields(include_hidden=True):
+                classes.update(type(model_field).__mro__)
+
+        files: dict[str, Path] = {}
+
+        for module_name in {cls.__module__ for cls in classes}:
+            filename = getattr(sys.modules.get(module_name), "__file__", None)
+            if filename:
+                files[module_name] = Path(filename)
+
+        return files
+
+    def _applied_migrations(self) -> list[tuple[str, str]]:
+        """Return the migrations recorded as applied, or none before the first migrate."""
+        try:
+            return list(
+                MigrationRecorder.Migration.objects.using(self.alias)
+                .order_by("app", "name")
+                .values_list("app", "name")
+            )
+        except DatabaseError:
+            return []
@@ -7,6 +7,7 @@ and continues running remaining commands even if one fails.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from time import perf_counter
 
 from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
@@ -23,11 +24,15 @@ class CommandResult:
         command: The command that was executed.
         success: Whether the command executed successfully.
         error: Error message if the command failed, None otherwise.
+        skip_reason: Why the command was skipped, None if it ran.
+        duration: Time taken by the command in seconds.
     """
 
     command: str
     success: bool
     error: str | None = None
+    skip_reason: str | None = None
+    duration: float = 0.0
 
 
 class CommandOutput(ABC):
@@ -90,6 +95,18 @@ class CommandOutput(ABC):
         """
         pass
 
+    @abstractmethod
+    def print_command_skipped(self, cmd: str, reason: str, index: int, total: int) -> None:
+        """Print that a command was skipped, with progress bar.
+
+        Args:
+            cmd: The command that was skipped.
+            reason: Why the command was skipped.
+            index: The current command index (1-based).
+            total: The total number of commands.
+        """
+        pass
+
     @abstractmethod
     def print_command_failure(self, cmd: str, error: str, index: int, total: int) -> None:
         """Print command failure information with progress bar.
@@ -113,6 +130,15 @@ class CommandOutput(ABC):
         """
         pass
 
+    @abstractmethod
+    def print_timings(self, results: list[CommandResult]) -> None:
+        """Print the time taken by each command.
+
+        Args:
+            results: The results of all executed commands.
+        """
+        pass
+
 
 class CommandExecutor:
     """Executor for running commands.
@@ -225,10 +251,15 @@ class CommandProcess:
 
         for i, cmd in enumerate(commands, 1):
             self.output.print_command_header()
+            started = perf_counter()
             result = self.executor.execute(cmd)
+            result.duration = perf_counter() - started
             results.append(result)
 
-            if result.success:
+            if result.skip_reason is not None:
+                self.output.print_command_skipped(cmd, result.skip_reason, i, total)
+                completed += 1
+            elif result.success:
                 self.output.print_command_success(cmd, i, total)
                 completed += 1
             else:
@@ -236,6 +267,7 @@ class CommandProcess:
                 failed += 1
 
         self.output.print_summary(total, completed, failed)
+        self.output.print_timings(results)
 
 
 class CommandGenerator(ABC):
@@ -280,6 +312,14 @@ class CommandGenerator(ABC):
         """
         pass
 
+    def create_executor(self) -> CommandExecutor:
+        """Create the executor running each command.
+
+        Returns:
+            An instance of CommandExecutor.
+        """
+        return CommandExecutor(self.django_command)
+
     def generate(self, dry_run: bool = False) -> None:
         """Generate and execute the command process.
 
@@ -295,7 +335,7 @@ class CommandGenerator(ABC):
 
         # Initialize components
         output = self.create_output_handler()
-        executor = CommandExecutor(self.django_command)
+        executor = self.create_executor()
         process = CommandProcess(self.django_command, output, executor, self.get_mode())
 
         # Run the process
@@ -388,6 +428,20 @@ class Output(CommandOutput):
         self.command.stdout.write(self.command.style.SUCCESS(f"✓ Completed: {cmd}"))
         self.command.stdout.write("")
 
+    def print_command_skipped(self, cmd: str, reason: str, index: int, total: int) -> None:
+        """Print that a command was skipped, with progress bar.
+
+        Args:
+            cmd: The command that was skipped.
+            reason: Why the command was skipped.
+            index: The current command index (1-based).
+            total: The total number of commands.
+        """
+        progress_bar = self._create_progress_bar(index, total)
+        self.command.stdout.write(f"\n{progress_bar}")
+        self.command.stdout.write(self.command.style.NOTICE(f"⏭ Skipped: {cmd} ({reason})"))
+        self.command.stdout.write("")
+
     def print_command_failure(self, cmd: str, error: str, index: int, total: int) -> None:
         """Print command failure information with progress bar.
 
@@ -426,6 +480,27 @@ class Output(CommandOutput):
 
         self.command.stdout.write("")
 
+    def print_timings(self, results: list[CommandResult]) -> None:
+        """Print the time taken by each command.
+
+        Args:
+            results: The results of all executed commands.
+        """
+        self.command.stdout.write(self.command.style.NOTICE("⏱ Timings:\n"))
+
+        for result in results:
+            status = "skipped" if result.skip_reason is not None else "ran"
+            if not result.success:
+                status = "failed"
+
+            self.command.stdout.write(
+                f"  {result.duration:>8.3f}s  {status:<8}"
+                f"{self.command.style.HTTP_INFO(result.command)}"
+            )
+
+        total = sum(result.duration for result in results)
+        self.command.stdout.write(f"  {total:>8.3f}s  total\n")
+
     def _create_progress_bar(self, current: int, total: int) -> str:
         """Create a visual progress bar for the commands.
 
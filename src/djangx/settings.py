@@ -1,7 +1,12 @@
+from urllib.parse import urlsplit
+
 from django.utils.csp import CSP  # type: ignore[reportMissingTypeStubs]
 
+from .api import settings as _api_settings
 from .api.settings import *  # noqa: F403
 from .cli.settings import *  # noqa: F403
+from .types import StoragesDict
+from .ui import settings as _ui_settings
 from .ui.settings import *  # noqa: F403
 
 # ==============================================================================
@@ -9,20 +14,61 @@ from .ui.settings import *  # noqa: F403
 # https://docs.djangoproject.com/en/stable/howto/csp/
 # ==============================================================================
 
-SECURE_CSP: dict[str, list[str]] = {
-    "default-src": [CSP.SELF],
-    "script-src": [CSP.SELF, CSP.NONCE],
-    "style-src": [
-        CSP.SELF,
-        CSP.NONCE,
-        "https://fonts.googleapis.com",  # Google Fonts CSS
-    ],
-    "font-src": [
-        CSP.SELF,
-        "https://fonts.gstatic.com",  # Google Fonts font files
-    ],
+_GOOGLE_FONTS_CSP: dict[str, list[str]] = {
+    "style-src": ["https://fonts.googleapis.com"],  # Google Fonts CSS
+    "font-src": ["https://fonts.gstatic.com"],  # Google Fonts font files
 }
 
+
+def _get_static_origins() -> list[str]:
+    """Return the CDN origin static files are served from, if they are offloaded."""
+    parts = urlsplit(_ui_settings.STATIC_URL)
+    return [f"{parts.scheme}://{parts.netloc}"] if parts.netloc else []
+
+
+def _get_secure_csp() -> dict[str, list[str]]:
+    """
+    Build the CSP, dropping the Google Fonts hosts when fonts are self-hosted
+    and allowing the static CDN origin when static files are offloaded.
+    """
+    external_fonts: dict[str, list[str]] = {} if _ui_settings.FONTS.self_host else _GOOGLE_FONTS_CSP
+    static = _get_static_origins()
+
+    return {
+        "default-src": [CSP.SELF],
+        "script-src": [CSP.SELF, CSP.NONCE, *static],
+        "style-src": [CSP.SELF, CSP.NONCE, *static, *external_fonts.get("style-src", [])],
+        "font-src": [CSP.SELF, *static, *external_fonts.get("font-src", [])],
+        "img-src": [CSP.SELF, *static],
+    }
+
+
+SECURE_CSP: dict[str, list[str]] = _get_secure_csp()
+
+# ==============================================================================
+# Static files served from a CDN
+# https://docs.djangoproject.com/en/stable/ref/contrib/staticfiles/#manifeststaticfilesstorage
+# ==============================================================================
+
+
+def _get_storages() -> StoragesDict:
+    """
+    Content-hash static file names when they are served from a CDN, so files
+    offloaded by 'staticsync' can be cached for good and never go stale.
+    """
+    if not _get_static_origins():
+        return _api_settings.STORAGES
+
+    return {
+        **_api_settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage",
+        },
+    }
+
+
+STORAGES: StoragesDict = _get_storages()
+
 # ==============================================================================
 # Internationalization
 # https://docs.djangoproject.com/en/stable/topics/i18n/
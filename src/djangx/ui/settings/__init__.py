@@ -1,5 +1,7 @@
 from .apps import *  # noqa: F403
 from .contactinfo import *  # noqa: F403
+from .fonts import *  # noqa: F403
+from .images import *  # noqa: F403
 from .org import *  # noqa: F403
 from .social import *  # noqa: F403
 from .urls import *  # noqa: F403
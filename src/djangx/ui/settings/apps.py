@@ -1,6 +1,8 @@
 from enum import StrEnum
 
 from ... import PKG_NAME, Conf, ConfField
+from ...api.settings.auth import AUTH_USER_CACHE_TTL
+from ...cli.settings.security import DEBUG
 from ..types import TemplatesDict
 
 # ===============================================================
@@ -33,7 +35,7 @@ _APPS_CONF = AppsConf()
 
 def _get_installed_apps() -> list[str]:
     """Build the final list of installed Django applications."""
-    base_apps: list[str] = [f"{PKG_NAME}.cli", f"{PKG_NAME}.ui", "app"]
+    base_apps: list[str] = [f"{PKG_NAME}.cli", f"{PKG_NAME}.api", f"{PKG_NAME}.ui", "app"]
 
     django_apps: list[str] = [
         _Apps.ADMIN,
@@ -153,15 +155,17 @@ class _Middlewares(StrEnum):
     COMMON = "django.middleware.common.CommonMiddleware"
     CSRF = "django.middleware.csrf.CsrfViewMiddleware"
     AUTH = "django.contrib.auth.middleware.AuthenticationMiddleware"
+    AUTH_CACHED = f"{PKG_NAME}.api.usercache.CachedAuthenticationMiddleware"
     MESSAGES = "django.contrib.messages.middleware.MessageMiddleware"
     CLICKJACKING = "django.middleware.clickjacking.XFrameOptionsMiddleware"
     CSP = "django.middleware.csp.ContentSecurityPolicyMiddleware"
     BROWSER_RELOAD = "django_browser_reload.middleware.BrowserReloadMiddleware"
+    QUERIES = f"{PKG_NAME}.api.middleware.QueryInstrumentationMiddleware"
 
 
 _APP_MIDDLEWARE_MAP: dict[_Apps, list[_Middlewares]] = {
     _Apps.SESSIONS: [_Middlewares.SESSION],
-    _Apps.AUTH: [_Middlewares.AUTH],
+    _Apps.AUTH: [_Middlewares.AUTH, _Middlewares.AUTH_CACHED],
     _Apps.MESSAGES: [_Middlewares.MESSAGES],
     _Apps.BROWSER_RELOAD: [_Middlewares.BROWSER_RELOAD],
 }
@@ -172,6 +176,8 @@ class MiddlewareConf(Conf):
 
     extend = ConfField(env="MIDDLEWARE_EXTEND", toml="middleware.extend", type=list)
     remove = ConfField(env="MIDDLEWARE_REMOVE", toml="middleware.remove", type=list)
+    # Per-request query counts, timings and N+1 warnings; defaults to DEBUG
+    queries = ConfField(env="MIDDLEWARE_QUERIES", toml="middleware.queries", type=bool)
 
 
 _MIDDLEWARE_CONF = MiddlewareConf()
@@ -179,12 +185,18 @@ _MIDDLEWARE_CONF = MiddlewareConf()
 
 def _get_middleware(installed_apps: list[str]) -> list[str]:
     """Build the final list of middleware based on installed apps."""
+    # Outermost, so queries made by the other middleware are recorded too
+    instrument_queries: bool = (
+        DEBUG if _MIDDLEWARE_CONF.queries is None else _MIDDLEWARE_CONF.queries
+    )
+
     base_middleware: list[str] = [
+        *([_Middlewares.QUERIES] if instrument_queries else []),
         _Middlewares.SECURITY,
         _Middlewares.SESSION,
         _Middlewares.COMMON,
         _Middlewares.CSRF,
-        _Middlewares.AUTH,
+        _Middlewares.AUTH_CACHED if AUTH_USER_CACHE_TTL > 0 else _Middlewares.AUTH,
         _Middlewares.MESSAGES,
         _Middlewares.CLICKJACKING,
         _Middlewares.CSP,
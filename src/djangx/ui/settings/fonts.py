@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from ... import PKG_NAME, PKG_PATH, Conf, ConfField
+
+
+class FontsConf(Conf):
+    """Self-hosted fonts configuration settings."""
+
+    self_host = ConfField(env="FONTS_SELF_HOST", toml="fonts.self-host", default=False, type=bool)
+    families = ConfField(env="FONTS_FAMILIES", toml="fonts.families", type=list)
+    unicode_ranges = ConfField(
+        env="FONTS_UNICODE_RANGES",
+        toml="fonts.unicode-ranges",
+        default=[
+            "U+0000-00FF",
+            "U+0131",
+            "U+0152-0153",
+            "U+02BB-02BC",
+            "U+02C6",
+            "U+02DA",
+            "U+02DC",
+            "U+0304",
+            "U+0308",
+            "U+0329",
+            "U+2000-206F",
+            "U+20AC",
+            "U+2122",
+            "U+2191",
+            "U+2193",
+            "U+2212",
+            "U+2215",
+            "U+FEFF",
+            "U+FFFD",
+        ],
+        type=list,
+    )
+    display = ConfField(
+        choices=["auto", "block", "swap", "fallback", "optional"],
+        env="FONTS_DISPLAY",
+        toml="fonts.display",
+        default="swap",
+        type=str,
+    )
+    source_dir = ConfField(
+        env="FONTS_SOURCE_DIR",
+        toml="fonts.source-dir",
+        default=Path.cwd() / "fonts",
+        type=Path,
+    )
+    cache_dir = ConfField(
+        env="FONTS_CACHE_DIR",
+        toml="fonts.cache-dir",
+        default=Path.cwd() / ".cache" / PKG_NAME / "fonts",
+        type=Path,
+    )
+    output_dir = ConfField(
+        default=PKG_PATH / "ui" / "static" / "ui" / "fonts",
+        type=Path,
+    )
+    output_css = ConfField(
+        default=PKG_PATH / "ui" / "static" / "ui" / "css" / "fonts.min.css",
+        type=Path,
+    )
+
+
+FONTS = FontsConf()
+
+
+__all__ = ["FONTS"]
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from ... import PKG_NAME, Conf, ConfField
+from ...api.settings import STATIC_ROOT
+
+
+class ImagesConf(Conf):
+    """Static image optimization configuration settings."""
+
+    widths = ConfField(
+        env="IMAGES_WIDTHS",
+        toml="images.widths",
+        default=["320", "640", "960", "1280", "1920"],
+        type=list,
+    )
+    formats = ConfField(
+        env="IMAGES_FORMATS",
+        toml="images.formats",
+        default=["avif", "webp"],
+        type=list,
+    )
+    quality = ConfField(env="IMAGES_QUALITY", toml="images.quality", default=80, type=int)
+    workers = ConfField(env="IMAGES_WORKERS", toml="images.workers", type=int)
+    cache_dir = ConfField(
+        env="IMAGES_CACHE_DIR",
+        toml="images.cache-dir",
+        default=Path.cwd() / ".cache" / PKG_NAME / "images",
+        type=Path,
+    )
+    manifest = ConfField(
+        default=STATIC_ROOT / "images.json",
+        type=Path,
+    )
+
+
+IMAGES = ImagesConf()
+
+
+__all__ = ["IMAGES"]
@@ -9,6 +9,7 @@ class UrlPatternsConf(Conf):
     home = ConfField(env="URLS_HOME", toml="urls.home", default="/", type=str)
     admin = ConfField(env="URLS_ADMIN", toml="urls.admin", default="admin/", type=str)
     static = ConfField(env="URLS_STATIC", toml="urls.static", default="static/", type=str)
+    static_cdn = ConfField(env="URLS_STATIC_CDN", toml="urls.static-cdn", type=str)
     media = ConfField(env="URLS_MEDIA", toml="urls.media", default="media/", type=str)
     browser_reload = ConfField(
         env="URLS_BROWSER_RELOAD",
@@ -22,7 +23,12 @@ _URLPATTERNS = UrlPatternsConf()
 
 HOME_URL: str = "/" if _URLPATTERNS.home == "/" else normalize_url_path(_URLPATTERNS.home)
 ADMIN_URL: str = normalize_url_path(_URLPATTERNS.admin)
-STATIC_URL: str = normalize_url_path(_URLPATTERNS.static)
+# Static files offloaded with 'staticsync' are served from the CDN origin when one is set
+STATIC_URL: str = (
+    _URLPATTERNS.static_cdn.rstrip("/") + "/"
+    if _URLPATTERNS.static_cdn
+    else normalize_url_path(_URLPATTERNS.static)
+)
 MEDIA_URL: str = normalize_url_path(_URLPATTERNS.media)
 BROWSER_RELOAD_URL: str = normalize_url_path(_URLPATTERNS.browser_reload)
 
@@ -1,3 +1,7 @@
+// Loads AOS only when the page has animated elements, shortly before the
+// first one scrolls into view. Asset URLs come from this script's data attributes.
+const aosLoader = document.currentScript;
+
 function aosInit() {
   AOS.init({
     duration: 600,
@@ -6,4 +10,38 @@ function aosInit() {
     mirror: false,
   });
 }
-window.addEventListener("load", aosInit);
+
+function aosLoad() {
+  const nonce = aosLoader.nonce;
+
+  const stylesheet = document.createElement("link");
+  stylesheet.rel = "stylesheet";
+  stylesheet.href = aosLoader.dataset.aosCss;
+  stylesheet.nonce = nonce;
+  document.head.appendChild(stylesheet);
+
+  const script = document.createElement("script");
+  script.src = aosLoader.dataset.aosJs;
+  script.nonce = nonce;
+  script.addEventListener("load", aosInit);
+  document.head.appendChild(script);
+}
+
+const aosElements = document.querySelectorAll("[data-aos]");
+
+if (aosElements.length > 0) {
+  if ("IntersectionObserver" in window) {
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          observer.disconnect();
+          aosLoad();
+        }
+      },
+      { rootMargin: "200px 0px" },
+    );
+    aosElements.forEach((element) => observer.observe(element));
+  } else {
+    aosLoad();
+  }
+}
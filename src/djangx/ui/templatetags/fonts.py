@@ -0,0 +1,25 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import SafeString
+
+from ..settings import FONTS
+
+register = template.Library()
+
+
+@register.simple_tag
+def fonts_stylesheet() -> SafeString | str:
+    """
+    Render the stylesheet link for the self-hosted fonts.
+
+    Usage: {% fonts_stylesheet %}
+
+    Returns:
+        A <link> tag for the generated @font-face stylesheet when self-hosting
+        is enabled, or an empty string otherwise
+    """
+    if not FONTS.self_host:
+        return ""
+
+    return format_html('<link rel="stylesheet" href="{}" />', static("ui/css/fonts.min.css"))
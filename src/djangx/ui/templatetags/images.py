@@ -0,0 +1,148 @@
+import json
+from pathlib import Path
+from typing import Any, cast
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeString
+
+from ..settings import IMAGES
+from ..types import ImageEntryDict, ImageManifestDict, ImageVariantDict
+
+register = template.Library()
+
+# Modern formats in order of preference; browsers pick the first <source> they support
+_SOURCE_TYPES: dict[str, str] = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+}
+
+# Per manifest: its mtime, its image entries, and whether each entry can be served in DEBUG
+_manifest_cache: dict[Path, tuple[float, dict[str, ImageEntryDict], dict[str, bool]]] = {}
+
+
+def _get_images() -> tuple[dict[str, ImageEntryDict], dict[str, bool]]:
+    """
+    Return the image entries of the variant manifest and their servability cache.
+
+    The manifest is parsed once per process. In DEBUG mode it is reloaded
+    whenever the file changes so rebuilt variants show up without a restart,
+    which also starts a new servability cache.
+    """
+    path: Path = IMAGES.manifest
+    cached = _manifest_cache.get(path)
+
+    if cached is not None and not settings.DEBUG:
+        return cached[1], cached[2]
+
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}, {}
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    try:
+        manifest = cast(ImageManifestDict, json.loads(path.read_text()))
+        images = manifest["images"]
+    except (OSError, ValueError, KeyError, TypeError):
+        images = {}
+
+    servable: dict[str, bool] = {}
+    _manifest_cache[path] = (mtime, images, servable)
+    return images, servable
+
+
+def _is_servable(path: str, entry: ImageEntryDict, servable: dict[str, bool]) -> bool:
+    """
+    Check that every variant of an entry can be served.
+
+    Variants are generated in STATIC_ROOT only. In DEBUG mode static files are
+    served from the app and STATICFILES_DIRS directories through the finders,
+    so variants that only exist in the collected tree would 404 there. The
+    finders are asked once per entry until the manifest changes.
+    """
+    if not settings.DEBUG:
+        return True
+
+    if path not in servable:
+        servable[path] = all(
+            finders.find(variant["path"]) is not None
+            for variants in entry["variants"].values()
+            for variant in variants
+        )
+
+    return servable[path]
+
+
+def _srcset(variants: list[ImageVariantDict]) -> str:
+    """Build a srcset attribute value from a list of variants."""
+    return ", ".join(f"{static(v['path'])} {v['width']}w" for v in variants)
+
+
+@register.simple_tag
+def djx_image(
+    path: str,
+    alt: str = "",
+    sizes: str = "100vw",
+    loading: str = "lazy",
+    decoding: str = "async",
+    **attrs: Any,
+) -> SafeString:
+    """
+    Render a responsive image for a static file.
+
+    Usage: {% djx_image "ui/img/logo.png" alt="Logo" sizes="(min-width: 768px) 50vw, 100vw" %}
+
+    Emits a <picture> with AVIF/WebP sources, a srcset and intrinsic
+    width/height from the manifest written by the 'images build' step.
+    Falls back to a plain lazy-loaded <img> when no variants have been built,
+    or in DEBUG mode when the static finders cannot serve them.
+
+    Args:
+        path: The static path of the source image (e.g., 'ui/img/logo.png')
+        alt: Alternative text for the image
+        sizes: The sizes attribute used to pick a candidate from the srcset
+        loading: 'lazy' (default) or 'eager' for above-the-fold images
+        decoding: The decoding hint for the image
+        **attrs: Extra attributes for the <img> element (e.g., class="h-10")
+
+    Returns:
+        The rendered <picture> or <img> element
+    """
+    img_attrs: dict[str, Any] = {"alt": alt, "loading": loading, "decoding": decoding, **attrs}
+    images, servable = _get_images()
+    entry = images.get(path)
+
+    if entry is None or not _is_servable(path, entry, servable):
+        return format_html('<img src="{}"{} />', static(path), flatatt(img_attrs))
+
+    variants = entry["variants"]
+    fallback = next((v for fmt, v in variants.items() if fmt not in _SOURCE_TYPES), [])
+    sources = format_html_join(
+        "",
+        '<source type="{}" srcset="{}" sizes="{}" />',
+        (
+            (mime_type, _srcset(variants[fmt]), sizes)
+            for fmt, mime_type in _SOURCE_TYPES.items()
+            if variants.get(fmt)
+        ),
+    )
+
+    img_attrs.update({"width": entry["width"], "height": entry["height"]})
+    if fallback:
+        img_attrs.update({"srcset": _srcset(fallback), "sizes": sizes})
+
+    src = static(fallback[-1]["path"]) if fallback else static(path)
+
+    return format_html(
+        '<picture>{}<img src="{}"{} /></picture>',
+        sources,
+        src,
+        flatatt(img_attrs),
+    )
@@ -1,3 +1,4 @@
 from .apps import *  # noqa: F403
+from .images import *  # noqa: F403
 from .social import *  # noqa: F403
 from .org import *  # noqa: F403
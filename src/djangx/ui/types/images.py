@@ -0,0 +1,37 @@
+from typing import TypedDict
+
+
+class ImageVariantDict(TypedDict):
+    """A single generated image variant."""
+
+    path: str
+    width: int
+    height: int
+
+
+class ImageEntryDict(TypedDict):
+    """An optimized source image and its variants, keyed by format."""
+
+    hash: str
+    width: int
+    height: int
+    variants: dict[str, list[ImageVariantDict]]
+
+
+class ImageOptionsDict(TypedDict):
+    """The optimization options the variants in a manifest were generated with."""
+
+    widths: list[int]
+    formats: list[str]
+    quality: int
+
+
+class ImageManifestDict(TypedDict):
+    """The image variant manifest written by the images build step."""
+
+    version: int
+    options: ImageOptionsDict
+    images: dict[str, ImageEntryDict]
+
+
+__all__ = ["ImageVariantDict", "ImageEntryDict", "ImageOptionsDict", "ImageManifestDict"]
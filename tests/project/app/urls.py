@@ -0,0 +1,8 @@
+from django.urls import URLPattern, URLResolver, path
+
+from . import views
+
+urlpatterns: list[URLPattern | URLResolver] = [
+    path("users/", views.users),
+    path("routing/", views.routing),
+]
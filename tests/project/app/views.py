@@ -0,0 +1,19 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest, HttpResponse
+
+
+def users(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(str(get_user_model().objects.count()))
+
+
+def routing(request: HttpRequest) -> HttpResponse:
+    """Optionally create a user, then return the database a read goes to"""
+    User = get_user_model()
+
+    if "username" in request.GET:
+        User.objects.create_user(request.GET["username"])
+
+    users = User.objects.all()
+    list(users)
+
+    return HttpResponse(users.db)
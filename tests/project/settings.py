@@ -0,0 +1,22 @@
+"""Settings of the project the tests run against."""
+
+import os
+import tempfile
+from pathlib import Path
+
+# djangX reads pyproject.toml, .env and app/urls.py from the working directory
+_cwd = Path.cwd()
+os.chdir(Path(__file__).resolve().parent)
+
+try:
+    from djangx.settings import *  # noqa: F403
+finally:
+    os.chdir(_cwd)
+
+# On disk rather than in memory, so tests can close connections and open new ones
+DATABASES["default"]["TEST"] = {  # noqa: F405
+    "NAME": Path(tempfile.gettempdir()) / "djangx-tests.sqlite3",
+}
+
+# A replica of the primary, as DB_REPLICAS configures them on PostgreSQL
+DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}  # noqa: F405
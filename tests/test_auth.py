@@ -0,0 +1,24 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from djangx.api.backends.auth import LOOKUP_INDEXES, UsernameOrEmailBackend
+
+
+class LookupIndexTests(TestCase):
+    def test_migrate_adds_lookup_indexes(self) -> None:
+        table = get_user_model()._meta.db_table
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+
+        for name in LOOKUP_INDEXES.values():
+            self.assertIn(name, constraints)
+
+    def test_login_by_username_or_email_ignores_case(self) -> None:
+        user = get_user_model().objects.create_user("Ada", "ada@example.com", "secret")
+        backend = UsernameOrEmailBackend()
+
+        self.assertEqual(backend.authenticate(None, "ADA", "secret"), user)
+        self.assertEqual(backend.authenticate(None, "Ada@Example.com", "secret"), user)
+        self.assertIsNone(backend.authenticate(None, "ada", "wrong"))
@@ -0,0 +1,39 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from djangx.api.backends.storages import BlobApi
+
+
+class BlobApiRequestTests(SimpleTestCase):
+    def test_put_headers(self) -> None:
+        self.assertEqual(
+            BlobApi._put_headers("text/plain", random_suffix=False, overwrite=True, max_age=60),
+            {
+                "x-add-random-suffix": "0",
+                "x-allow-overwrite": "1",
+                "x-content-type": "text/plain",
+                "x-cache-control-max-age": "60",
+            },
+        )
+        self.assertEqual(
+            BlobApi._put_headers(None),
+            {"x-add-random-suffix": "1", "x-allow-overwrite": "0"},
+        )
+
+    def test_api_url_and_version(self) -> None:
+        api = BlobApi("token")
+
+        with mock.patch.dict("os.environ", clear=True):
+            self.assertEqual(api._url("/mpu"), "https://vercel.com/api/blob/mpu")
+            self.assertEqual(api._headers()["x-api-version"], "11")
+
+        with mock.patch.dict(
+            "os.environ",
+            {
+                "VERCEL_BLOB_API_URL": "http://127.0.0.1:8000/api",
+                "VERCEL_BLOB_API_VERSION_OVERRIDE": "12",
+            },
+        ):
+            self.assertEqual(api._url("/mpu"), "http://127.0.0.1:8000/api/mpu")
+            self.assertEqual(api._headers()["x-api-version"], "12")
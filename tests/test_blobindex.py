@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from djangx.api.backends.storages import BlobIndex, BlobMetadata
+from djangx.api.models import BlobObject
+
+
+class BlobIndexTests(TestCase):
+    def test_index_round_trip(self) -> None:
+        index = BlobIndex()
+        metadata = BlobMetadata(url="https://example.com/a.txt", size=3, content_type="text/plain")
+
+        index.set("a.txt", metadata)
+        self.assertEqual(index.set_many([("b.txt", metadata)]), 1)
+        self.assertEqual(index.get("a.txt"), metadata)
+        self.assertEqual(set(index.get_many(["a.txt", "b.txt", "c.txt"])), {"a.txt", "b.txt"})
+
+        index.delete_many(["a.txt", "b.txt"])
+        self.assertIsNone(index.get("a.txt"))
+
+    async def test_async_round_trip(self) -> None:
+        index = BlobIndex()
+        metadata = BlobMetadata(url="https://example.com/a.txt", size=3)
+
+        await index.aset("a.txt", metadata)
+        self.assertEqual(await index.aget("a.txt"), metadata)
+
+        await index.adelete("a.txt")
+        self.assertIsNone(await index.aget("a.txt"))
+
+    def test_failed_query_rolls_back_to_a_savepoint(self) -> None:
+        index = BlobIndex()
+        metadata = BlobMetadata(url="https://example.com/a.txt", size=3)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {BlobObject._meta.db_table}")
+
+        with CaptureQueriesContext(connection) as queries, transaction.atomic():
+            self.assertIsNone(index.get("a.txt"))
+            index.set("a.txt", metadata)
+            self.assertEqual(index.set_many([("a.txt", metadata)]), 0)
+
+            # On PostgreSQL this fails unless each failed query was rolled back
+            get_user_model().objects.create_user("ada")
+
+        rollbacks = [query for query in queries if "ROLLBACK TO SAVEPOINT" in query["sql"]]
+        self.assertGreaterEqual(len(rollbacks), 3)
@@ -0,0 +1,36 @@
+import tempfile
+from pathlib import Path
+
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, override_settings
+
+from djangx.api.backends.dedup import DedupFileSystemStorage
+
+
+class DedupFileSystemStorageTests(SimpleTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.media_root = Path(directory.name) / "media"
+        self.blob_root = Path(directory.name) / "blobs"
+
+        settings = override_settings(MEDIA_ROOT=self.media_root, MEDIA_BLOB_ROOT=self.blob_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_blobs_are_stored_outside_the_media_root(self) -> None:
+        storage = DedupFileSystemStorage()
+
+        storage.save("a.txt", ContentFile(b"same"))
+        storage.save("b.txt", ContentFile(b"same"))
+
+        self.assertCountEqual(
+            self.media_root.rglob("*"), [self.media_root / "a.txt", self.media_root / "b.txt"]
+        )
+
+        blobs = [path for path, _ in storage.iter_blobs()]
+        self.assertEqual(len(blobs), 1)
+        self.assertTrue(blobs[0].is_relative_to(self.blob_root))
+
+        stats = storage.stats()
+        self.assertEqual((stats.blobs, stats.references), (1, 2))
@@ -0,0 +1,90 @@
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+MANIFEST_STORAGES = {
+    **settings.STORAGES,
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"},
+}
+
+
+class ImageManifestStorageTests(SimpleTestCase):
+    """Variants built after collectstatic render under ManifestStaticFilesStorage."""
+
+    def setUp(self) -> None:
+        from PIL import Image
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        source = self.directory / "static" / "photos" / "photo.png"
+        source.parent.mkdir(parents=True)
+        Image.new("RGB", (300, 200), "teal").save(source)
+
+        self.static_root = Path(settings.STATIC_ROOT)
+        self.addCleanup(shutil.rmtree, self.static_root, ignore_errors=True)
+
+        environ = {
+            "IMAGES_CACHE_DIR": str(self.directory / "cache"),
+            "IMAGES_WIDTHS": "100,200",
+            "IMAGES_FORMATS": "webp",
+        }
+        patcher = mock.patch.dict(os.environ, environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_variants_render_with_hashed_names(self) -> None:
+        with override_settings(
+            DEBUG=False,
+            STATICFILES_DIRS=[self.directory / "static"],
+            STORAGES=MANIFEST_STORAGES,
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            call_command("images", "build", no_verbose=True)
+
+            html = Template(
+                '{% load images %}{% djx_image "photos/photo.png" alt="Photo" %}'
+            ).render(Context())
+
+            urls = re.findall(r'([^\s",]+) \d+w', html)
+            self.assertIn("<picture>", html)
+            self.assertEqual(len(urls), 6)
+
+            for url in urls:
+                name = url.removeprefix(settings.STATIC_URL)
+                self.assertRegex(name, r"^photos/photo\.\d+w\.[0-9a-f]{12}\.(webp|png)$")
+                self.assertTrue(staticfiles_storage.exists(name))
+
+    def test_debug_checks_the_finders_once_per_manifest(self) -> None:
+        from djangx.ui.settings import IMAGES
+        from djangx.ui.templatetags import images
+
+        template = Template('{% load images %}{% djx_image "photos/photo.png" alt="Photo" %}')
+
+        with override_settings(DEBUG=True, STATICFILES_DIRS=[self.directory / "static"]):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            call_command("images", "build", no_verbose=True)
+
+            with mock.patch.object(images.finders, "find", wraps=images.finders.find) as find:
+                # The variants only exist in STATIC_ROOT, which the finders do not serve
+                for _ in range(3):
+                    self.assertNotIn("<picture>", template.render(Context()))
+
+                self.assertEqual(find.call_count, 1)
+
+                # A rebuilt manifest is checked again
+                stat = IMAGES.manifest.stat()
+                os.utime(IMAGES.manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                template.render(Context())
+
+                self.assertEqual(find.call_count, 2)
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.signals import request_finished, request_started
+from django.db import connections, transaction
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from djangx.api.backends.routers import ReplicaRouter
+
+User = get_user_model()
+
+
+class ReplicaRoutingTests(TransactionTestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self) -> None:
+        self.router = ReplicaRouter(["replica"])
+        self.router.reset()
+        self.addCleanup(self.router.reset)
+
+        settings = override_settings(DATABASE_ROUTERS=[self.router])
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _connect_request_signals(self) -> None:
+        """Connect the request signals the way the app does when replicas are configured"""
+        with mock.patch("djangx.api.settings.DATABASE_REPLICAS", ["replica"]):
+            apps.get_app_config("djangx_api").ready()
+
+        self.addCleanup(request_started.disconnect, dispatch_uid="djangx_reset_routing_started")
+        self.addCleanup(request_finished.disconnect, dispatch_uid="djangx_reset_routing_finished")
+
+    def test_reads_go_to_the_replica(self) -> None:
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            users = User.objects.all()
+            list(users)
+
+        self.assertEqual(users.db, "replica")
+        self.assertEqual(len(replica.captured_queries), 1)
+
+    def test_reads_after_a_write_go_to_the_primary(self) -> None:
+        self.assertEqual(User.objects.all().db, "replica")
+
+        user = User.objects.create_user("ada")
+
+        with (
+            CaptureQueriesContext(connections["default"]) as primary,
+            CaptureQueriesContext(connections["replica"]) as replica,
+        ):
+            self.assertEqual(User.objects.get(pk=user.pk), user)
+            self.assertTrue(User.objects.filter(username="ada").exists())
+
+        self.assertEqual(len(primary.captured_queries), 2)
+        self.assertEqual(replica.captured_queries, [])
+
+    def test_reads_inside_a_transaction_go_to_the_primary(self) -> None:
+        with transaction.atomic():
+            self.assertEqual(User.objects.all().db, "default")
+
+        # Reading in a transaction does not pin later reads
+        self.assertEqual(User.objects.all().db, "replica")
+
+        with transaction.atomic():
+            User.objects.create_user("ada")
+
+        self.assertEqual(User.objects.all().db, "default")
+
+    def test_requests_reset_the_routing(self) -> None:
+        self._connect_request_signals()
+
+        # Pinned before the request starts, e.g. by an earlier request on this thread
+        User.objects.create_user("ada")
+        self.assertEqual(User.objects.all().db, "default")
+
+        self.assertEqual(self.client.get("/routing/").content, b"replica")
+        self.assertEqual(self.client.get("/routing/", {"username": "grace"}).content, b"default")
+
+        # Finishing the request that wrote unpins the thread again
+        self.assertEqual(User.objects.all().db, "replica")
+        self.assertEqual(self.client.get("/routing/").content, b"replica")
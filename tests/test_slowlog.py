@@ -0,0 +1,57 @@
+import tempfile
+from pathlib import Path
+
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import TransactionTestCase
+
+from djangx.api.slowlog import SlowQueryLog
+
+
+class SlowQueryLogTests(TransactionTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _slow_log(self, threshold_ms: int, path: Path) -> SlowQueryLog:
+        slow_log = SlowQueryLog(threshold_ms=threshold_ms, path=path)
+
+        def install(sender, connection, **kwargs) -> None:
+            slow_log.install(connection)
+
+        connection_created.connect(install, weak=False)
+        self.addCleanup(connection_created.disconnect, install)
+        self.addCleanup(slow_log.close)
+        self.addCleanup(connection.close)
+
+        # The next query opens a new connection, installing the log
+        connection.close()
+
+        return slow_log
+
+    def test_request_wrappers_do_not_outlive_their_request(self) -> None:
+        slow_log = self._slow_log(60_000, self.directory / "slow.jsonl")
+
+        # Each request opens the connection while its query recorder is installed
+        for _ in range(2):
+            response = self.client.get("/users/")
+
+            self.assertEqual(response["X-DB-Queries"], "1")
+            self.assertEqual(connection.execute_wrappers, [slow_log])
+            connection.close()
+
+    def test_unwritable_log_is_not_retried(self) -> None:
+        blocker = self.directory / "blocker"
+        blocker.touch()
+        slow_log = self._slow_log(0, blocker / "slow.jsonl")
+
+        with self.assertLogs("djangx.api.slowlog", "WARNING") as logs:
+            self.client.get("/users/")
+            slow_log.close()
+            self.client.get("/users/")
+            slow_log.close()
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertGreaterEqual(slow_log.dropped, 1)
+        self.assertFalse(blocker.is_dir())
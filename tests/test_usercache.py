@@ -0,0 +1,23 @@
+from django.test import SimpleTestCase, override_settings
+
+from djangx.api.usercache import check_user_cache
+
+
+class UserCacheCheckTests(SimpleTestCase):
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_warns_about_a_per_process_cache(self) -> None:
+        self.assertEqual([message.id for message in check_user_cache()], ["djangx.W001"])
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_accepts_other_caches(self) -> None:
+        self.assertEqual(check_user_cache(), [])
+
+    @override_settings(
+        CACHES={"other": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_reports_a_missing_cache(self) -> None:
+        self.assertEqual([message.id for message in check_user_cache()], ["djangx.E001"])
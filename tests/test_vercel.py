@@ -0,0 +1,44 @@
+import asyncio
+import tempfile
+import threading
+
+from django.core.files.base import ContentFile, File
+from django.test import SimpleTestCase
+
+from djangx.api.backends.storages import VercelBlobStorage
+
+
+class AsyncChunkTests(SimpleTestCase):
+    def _read(self, content: File) -> tuple[bytes, set[int]]:
+        """Stream the content through _aiter_chunks, noting the threads that read it"""
+        threads: set[int] = set()
+        chunks = content.chunks
+
+        def record(*args, **kwargs):
+            for chunk in chunks(*args, **kwargs):
+                threads.add(threading.get_ident())
+                yield chunk
+
+        content.chunks = record
+
+        async def main() -> tuple[bytes, int]:
+            data = b"".join([chunk async for chunk in VercelBlobStorage._aiter_chunks(content)])
+            return data, threading.get_ident()
+
+        data, loop_thread = asyncio.run(main())
+        self.assertTrue(threads)
+        return data, threads - {loop_thread}
+
+    def test_files_are_read_off_the_event_loop(self) -> None:
+        with tempfile.TemporaryFile() as handle:
+            handle.write(b"x" * (3 * File.DEFAULT_CHUNK_SIZE))
+            data, off_loop = self._read(File(handle, name="large.bin"))
+
+        self.assertEqual(data, b"x" * (3 * File.DEFAULT_CHUNK_SIZE))
+        self.assertTrue(off_loop)
+
+    def test_in_memory_content_is_read_directly(self) -> None:
+        data, off_loop = self._read(ContentFile("text", name="small.txt"))
+
+        self.assertEqual(data, b"text")
+        self.assertFalse(off_loop)